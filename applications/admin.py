@@ -1,11 +1,11 @@
-﻿from django.conf import settings
-from django.contrib import admin
-from django.core.mail import send_mail
+﻿from django.contrib import admin
+from django.db import transaction
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.html import format_html
 
 from educate_us_rise_us.admin_mixins import RichTextAdminMixin
+from outbox.models import OutboxEmail
 
 from .models import (
     Application,
@@ -120,22 +120,22 @@ class PartnerAppointmentAdmin(AdminActionLinksMixin, RichTextAdminMixin, admin.M
 
     @admin.action(description="Send response email to selected bookings")
     def send_response_email(self, request, queryset):
-        sent_count = 0
-        for booking in queryset:
+        emails = []
+        booking_ids = []
+        for booking in queryset.only("id", "organization_name", "email", "admin_response"):
             response_text = (booking.admin_response or "").strip()
             if not response_text:
                 continue
             subject = f"Response to your partnership appointment: {booking.organization_name}"
-            send_mail(
-                subject,
-                response_text,
-                getattr(settings, "DEFAULT_FROM_EMAIL", ""),
-                [booking.email],
-                fail_silently=True,
+            emails.append(OutboxEmail.build(subject, response_text, [booking.email]))
+            booking_ids.append(booking.pk)
+
+        with transaction.atomic():
+            OutboxEmail.objects.bulk_create([email for email in emails if email.to])
+            PartnerAppointment.objects.filter(pk__in=booking_ids).update(
+                status=PartnerAppointment.STATUS_RESPONDED,
+                response_sent_at=timezone.now(),
+                updated_at=timezone.now(),
             )
-            booking.status = PartnerAppointment.STATUS_RESPONDED
-            booking.response_sent_at = timezone.now()
-            booking.save(update_fields=["status", "response_sent_at", "updated_at"])
-            sent_count += 1
 
-        self.message_user(request, f"Sent {sent_count} response email(s).")
+        self.message_user(request, f"Queued {len(booking_ids)} response email(s).")
@@ -4,3 +4,6 @@
 class ApplicationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "applications"
+
+    def ready(self):
+        from . import signals  # noqa: F401
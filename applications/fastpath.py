@@ -0,0 +1,172 @@
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.utils.encoding import filepath_to_uri
+from rest_framework import fields as drf_fields
+from rest_framework.response import Response
+
+from educate_us_rise_us.images import srcset_for_name
+
+# DRF fields whose to_representation() is a no-op for values straight out of
+# the database driver.
+PASSTHROUGH_FIELDS = (
+    drf_fields.BooleanField,
+    drf_fields.CharField,
+    drf_fields.ChoiceField,
+    drf_fields.IntegerField,
+    drf_fields.JSONField,
+)
+
+
+class MediaURLResolver:
+    """Turn stored file names into absolute URLs, resolving the base once.
+
+    For local storage the absolute media prefix is built from the request a
+    single time; other backends still go through ``storage.url()`` per file.
+    """
+
+    def __init__(self, request=None, storage=None):
+        self.storage = storage or default_storage
+        self.request = request
+        self.prefix = None
+        if isinstance(self.storage, FileSystemStorage):
+            base_url = self.storage.base_url
+            self.prefix = request.build_absolute_uri(base_url) if request is not None else base_url
+
+    def __call__(self, name):
+        if self.prefix is not None:
+            return self.prefix + filepath_to_uri(name).lstrip("/")
+        url = self.storage.url(name)
+        return self.request.build_absolute_uri(url) if self.request is not None else url
+
+
+def media_url_context(context):
+    resolver = context.get("media_url")
+    if resolver is None:
+        resolver = context["media_url"] = MediaURLResolver(context.get("request"))
+    return resolver
+
+
+def image_url_accessor(file_column, fallback_column=None):
+    """Fast ``get_image_url``: uploaded file URL, else the fallback URL column, else ``""``."""
+
+    def factory(context):
+        media_url = media_url_context(context)
+        columns = [file_column] + ([fallback_column] if fallback_column else [])
+
+        def accessor(row):
+            name = row[file_column]
+            if name:
+                return media_url(name)
+            return (row[fallback_column] or "") if fallback_column else ""
+
+        return columns, accessor
+
+    return factory
+
+
+def srcset_accessor(file_column, variants_column="image_variants"):
+    def factory(context):
+        media_url = media_url_context(context)
+
+        def accessor(row):
+            return srcset_for_name(row[variants_column], row[file_column], media_url)
+
+        return [file_column, variants_column], accessor
+
+    return factory
+
+
+class CompiledSerializer:
+    """Read-only serializer that maps ``.values()`` rows straight to dicts.
+
+    Field accessors are compiled once from a ``ModelSerializer`` class (after
+    sparse ``?fields=`` filtering). Method fields must have an entry in the
+    serializer's ``fast_accessors``; anything that cannot be compiled makes
+    :func:`compile_serializer` return ``None`` so callers fall back to DRF.
+    """
+
+    def __init__(self, columns, accessors):
+        self.columns = columns
+        self.accessors = accessors
+
+    def serialize(self, rows):
+        accessors = self.accessors
+        return [{name: accessor(row) for name, accessor in accessors} for row in rows]
+
+
+def _column_accessor(column, field):
+    if isinstance(field, drf_fields.FileField):
+        media_url = media_url_context(field.context)
+
+        def file_accessor(row):
+            name = row[column]
+            return media_url(name) if name else None
+
+        return file_accessor
+
+    if isinstance(field, PASSTHROUGH_FIELDS) and not isinstance(field, drf_fields.MultipleChoiceField):
+        return lambda row: row[column]
+
+    to_representation = field.to_representation
+
+    def converted(row):
+        value = row[column]
+        return None if value is None else to_representation(value)
+
+    return converted
+
+
+def compile_serializer(serializer_class, context):
+    serializer = serializer_class(context=context)
+    model = serializer_class.Meta.model
+    concrete = {field.name for field in model._meta.concrete_fields}
+    fast_accessors = getattr(serializer_class, "fast_accessors", {})
+
+    columns = {model._meta.pk.name}
+    accessors = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if name in fast_accessors:
+            needed, accessor = fast_accessors[name](context)
+            columns.update(needed)
+        elif field.source in concrete and not isinstance(field, drf_fields.SerializerMethodField):
+            columns.add(field.source)
+            accessor = _column_accessor(field.source, field)
+        else:
+            return None
+        accessors.append((name, accessor))
+    return CompiledSerializer(columns, accessors)
+
+
+def serialize_queryset(serializer_class, queryset, context):
+    """Serialize ``queryset`` through the fast path when possible."""
+    compiled = compile_serializer(serializer_class, context)
+    if compiled is None:
+        return serializer_class(queryset, many=True, context=context).data
+    return compiled.serialize(queryset.values(*_with_ordering(compiled.columns, queryset)))
+
+
+def _with_ordering(columns, queryset):
+    concrete = {field.name for field in queryset.model._meta.concrete_fields}
+    ordering = {name.lstrip("-") for name in queryset.query.order_by if name.lstrip("-") in concrete}
+    return sorted(set(columns) | ordering)
+
+
+class ValuesListMixin:
+    """Serve ``list()`` from ``.values()`` rows via a compiled serializer.
+
+    Falls back to the regular serializer when a field cannot be compiled.
+    Cursor pagination works on the dict rows as-is.
+    """
+
+    def list(self, request, *args, **kwargs):
+        compiled = compile_serializer(self.get_serializer_class(), self.get_serializer_context())
+        if compiled is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = queryset.values(*_with_ordering(compiled.columns, queryset))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(compiled.serialize(page))
+        return Response(compiled.serialize(rows))
@@ -0,0 +1,66 @@
+class SparseFieldsetSerializerMixin:
+    """Drop every field not listed in ``context["fields"]``.
+
+    ``Meta.sparse_field_sources`` maps computed fields to the model columns
+    they read, so views can defer everything else with ``.only()``.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        requested = self.context.get("fields")
+        if requested:
+            for name in list(fields):
+                if name not in requested:
+                    fields.pop(name)
+        return fields
+
+
+class SparseFieldsetMixin:
+    """Read ``?fields=a,b`` on GET and narrow both the serializer and the SQL."""
+
+    fields_query_param = "fields"
+
+    def get_requested_fields(self):
+        if not hasattr(self, "_requested_fields"):
+            self._requested_fields = self._parse_requested_fields()
+        return self._requested_fields
+
+    def _parse_requested_fields(self):
+        request = getattr(self, "request", None)
+        if request is None or request.method != "GET":
+            return None
+        raw = request.query_params.get(self.fields_query_param, "")
+        if not raw:
+            return None
+        available = self.get_serializer_class()().fields
+        requested = {name.strip() for name in raw.split(",") if name.strip() in available}
+        return requested or None
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"] = self.get_requested_fields()
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        requested = self.get_requested_fields()
+        if not requested:
+            return queryset
+        return queryset.only(*self.get_sparse_columns(queryset, requested))
+
+    def get_sparse_columns(self, queryset, requested):
+        serializer_class = self.get_serializer_class()
+        sources = getattr(serializer_class.Meta, "sparse_field_sources", {})
+        concrete = {field.name for field in queryset.model._meta.concrete_fields}
+        declared = serializer_class().fields
+
+        columns = {queryset.model._meta.pk.name}
+        columns.update(name.lstrip("-") for name in queryset.query.order_by if name.lstrip("-") in concrete)
+        for name in requested:
+            if name in sources:
+                columns.update(sources[name])
+                continue
+            source = declared[name].source
+            if source in concrete:
+                columns.add(source)
+        return sorted(columns)
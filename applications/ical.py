@@ -0,0 +1,101 @@
+import hashlib
+from datetime import timedelta, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.utils.html import strip_tags
+
+from educate_us_rise_us.content_cache import content_versions, get_or_build, url_digest
+
+from .models import Event
+
+PRODID = "-//EUTR//Events//EN"
+
+
+def escape_text(value):
+    """Escape a TEXT value per RFC 5545 section 3.3.11."""
+    return (
+        str(value or "")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line):
+    """Fold a content line to 75 octets, continuing with a leading space."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    while encoded:
+        limit = 75 if not parts else 74
+        chunk = encoded[:limit]
+        # Never split a multi-byte character.
+        while chunk and (encoded[len(chunk) : len(chunk) + 1] or b"\x00")[0] & 0xC0 == 0x80:
+            chunk = chunk[:-1]
+        parts.append(chunk.decode("utf-8"))
+        encoded = encoded[len(chunk) :]
+    return "\r\n ".join(parts)
+
+
+def _utc_stamp(value):
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def event_lines(event, host):
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:event-{event.pk}@{host}",
+        f"DTSTAMP:{_utc_stamp(event.updated_at)}",
+        f"DTSTART;VALUE=DATE:{event.date:%Y%m%d}",
+        f"DTEND;VALUE=DATE:{event.date + timedelta(days=1):%Y%m%d}",
+        f"SUMMARY:{escape_text(event.title)}",
+    ]
+    if event.location:
+        lines.append(f"LOCATION:{escape_text(event.location)}")
+    if event.description:
+        lines.append(f"DESCRIPTION:{escape_text(strip_tags(event.description))}")
+    if event.tag:
+        lines.append(f"CATEGORIES:{escape_text(event.tag)}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def build_events_calendar(host):
+    events = (
+        Event.objects.filter(is_active=True, date__isnull=False)
+        .only("id", "title", "date", "location", "tag", "description", "updated_at")
+        .order_by("date", "id")
+    )
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        "X-WR-CALNAME:EUTR Events",
+    ]
+    for event in events.iterator(chunk_size=500):
+        lines.extend(event_lines(event, host))
+    lines.append("END:VCALENDAR")
+    return ("\r\n".join(fold(line) for line in lines) + "\r\n").encode("utf-8")
+
+
+def events_calendar_snapshot(request):
+    """Return ``(etag, body)`` for the current ``Event`` content version.
+
+    Every ``Event`` write bumps the version, so the feed is rebuilt once per
+    change and polling calendar clients are served from the cache.
+    """
+    key = f"events-ics:{content_versions([Event])}:{url_digest(request, include_path=False)}"
+    snapshot = cache.get(key)
+    if snapshot is None:
+
+        def build():
+            body = build_events_calendar(request.get_host().split(":")[0])
+            return f'"{hashlib.sha256(body).hexdigest()[:32]}"', body
+
+        snapshot = get_or_build(key, build)
+    return snapshot
@@ -0,0 +1,408 @@
+import csv
+import io
+import json
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.core.files.base import ContentFile
+from django.db import DatabaseError, models, transaction
+from django.utils.text import slugify
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.response import Response
+
+from educate_us_rise_us.images import delete_variants, registered_image_fields, schedule_variants
+from educate_us_rise_us.richtext import derived_columns, render_rich_text
+
+from .models import Event, Partner, Program, Project, TeamMember, Testimonial
+from .serializers import (
+    EventSerializer,
+    PartnerSerializer,
+    ProgramSerializer,
+    ProjectSerializer,
+    TeamMemberSerializer,
+    TestimonialSerializer,
+)
+
+# kind (as used in the admin URLs) -> (model, serializer used for validation)
+IMPORT_TARGETS = {
+    "programs": (Program, ProgramSerializer),
+    "projects": (Project, ProjectSerializer),
+    "events": (Event, EventSerializer),
+    "team": (TeamMember, TeamMemberSerializer),
+    "partners": (Partner, PartnerSerializer),
+    "testimonials": (Testimonial, TestimonialSerializer),
+}
+
+# Columns slugified into ``import_key`` when a row does not carry one.
+# Migration 0011 backfilled existing rows the same way.
+KEY_FIELDS = {
+    Program: ("title",),
+    Project: ("title",),
+    Event: ("title", "date"),
+    TeamMember: ("name",),
+    Partner: ("name",),
+    Testimonial: ("name",),
+}
+
+KEY_COLUMN = "import_key"
+
+
+class ContentImportError(ValueError):
+    """The upload itself is unusable (as opposed to individual invalid rows)."""
+
+
+def make_import_key(model, values):
+    parts = [str(values[field]) for field in KEY_FIELDS[model] if values.get(field)]
+    max_length = model._meta.get_field(KEY_COLUMN).max_length
+    return slugify(" ".join(parts))[:max_length] or None
+
+
+def read_rows(data, filename=""):
+    """Rows from a JSON array (or ``{"rows": [...]}``) or a CSV file with a header."""
+    if isinstance(data, bytes):
+        try:
+            data = data.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise ContentImportError("Import files must be UTF-8 encoded.")
+
+    if filename.lower().endswith(".json") or data.lstrip().startswith(("[", "{")):
+        try:
+            payload = json.loads(data)
+        except ValueError as exc:
+            raise ContentImportError(f"Invalid JSON: {exc}")
+        if isinstance(payload, dict):
+            payload = payload.get("rows")
+        if not isinstance(payload, list) or not all(isinstance(row, dict) for row in payload):
+            raise ContentImportError("JSON imports must be an array of objects.")
+        return payload
+
+    reader = csv.DictReader(io.StringIO(data))
+    if not reader.fieldnames:
+        raise ContentImportError("The CSV file has no header row.")
+    return list(reader)
+
+
+def _parse_list(value):
+    """JSON list cells: either a JSON array or ``a | b | c``."""
+    if value.startswith("["):
+        try:
+            parsed = json.loads(value)
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, list):
+            return parsed
+    return [part.strip() for part in value.split("|") if part.strip()]
+
+
+def clean_row(model, row):
+    """Normalize spreadsheet cells before serializer validation.
+
+    Blank cells become ``None`` on nullable columns and are dropped on other
+    non-text columns (so the model default applies); list columns accept a
+    JSON array or ``|``-separated text.
+    """
+    cleaned = {}
+    for column, value in row.items():
+        if column is None:
+            # Extra cells past the CSV header.
+            continue
+        column = column.strip()
+        if isinstance(value, str):
+            value = value.strip()
+            try:
+                field = model._meta.get_field(column)
+            except FieldDoesNotExist:
+                field = None
+            if isinstance(field, models.JSONField):
+                if not value:
+                    continue
+                value = _parse_list(value)
+            elif field is not None and value == "" and not isinstance(field, (models.CharField, models.TextField)):
+                if not field.null:
+                    continue
+                value = None
+        cleaned[column] = value
+    return cleaned
+
+
+class PhotoArchive:
+    """Images from an uploaded zip, looked up by path or bare file name."""
+
+    def __init__(self, fileobj):
+        try:
+            self.zip = zipfile.ZipFile(fileobj)
+        except zipfile.BadZipFile:
+            raise ContentImportError("The photos upload is not a valid zip archive.")
+        self.members = {}
+        for info in self.zip.infolist():
+            if info.is_dir():
+                continue
+            self.members.setdefault(info.filename, info)
+            self.members.setdefault(os.path.basename(info.filename), info)
+
+    def find(self, name):
+        name = str(name).strip().lstrip("/")
+        return self.members.get(name) or self.members.get(os.path.basename(name))
+
+    def store(self, info, field):
+        """Verify one member is an image and save it under ``field.upload_to``.
+
+        Runs on the import's thread pool; ``ZipFile`` reads are thread-safe.
+        """
+        from PIL import Image
+
+        max_bytes = int(getattr(settings, "CONTENT_IMPORT_MAX_PHOTO_BYTES", 10 * 1024 * 1024))
+        if info.file_size > max_bytes:
+            raise ContentImportError(f"{info.filename} is larger than {max_bytes} bytes.")
+        data = self.zip.read(info)
+        try:
+            Image.open(io.BytesIO(data)).verify()
+        except Exception:
+            raise ContentImportError(f"{info.filename} is not a valid image.")
+        name = field.generate_filename(None, os.path.basename(info.filename))
+        return field.storage.save(name, ContentFile(data))
+
+    def close(self):
+        self.zip.close()
+
+
+class ContentImporter:
+    """Validate and upsert spreadsheet rows into one ``OrderedActiveModel``.
+
+    Rows are validated with the admin serializer ``batch_size`` at a time and
+    each batch is written by a single ``bulk_create(update_conflicts=True)``
+    in its own transaction. Rows match existing records on ``import_key``
+    (given as a column, or derived from ``KEY_FIELDS``) and only the columns
+    present in the file are overwritten. Invalid rows are reported and
+    skipped without failing the rest of their batch.
+
+    Photos named in the image column are read from ``photos`` (a zip) and
+    saved to storage by a thread pool; responsive variants are then
+    scheduled as for a normal upload.
+    """
+
+    def __init__(self, model, serializer_class, photos=None, batch_size=None, workers=None, dry_run=False):
+        self.model = model
+        self.validator = serializer_class()
+        self.batch_size = batch_size or int(getattr(settings, "CONTENT_IMPORT_BATCH_SIZE", 500))
+        self.workers = workers or int(getattr(settings, "CONTENT_IMPORT_PHOTO_WORKERS", 4))
+        self.dry_run = dry_run
+        self.archive = PhotoArchive(photos) if photos is not None else None
+        self.image_field, self.variants_field = registered_image_fields().get(model, (None, None))
+
+        concrete = {field.name for field in model._meta.concrete_fields}
+        self.writable = [
+            name
+            for name, field in self.validator.fields.items()
+            if not field.read_only and name in concrete and name != self.image_field
+        ]
+        self.report = {"rows": 0, "created": 0, "updated": 0, "skipped": 0, "photos": 0, "dry_run": dry_run, "errors": []}
+
+    def run(self, rows):
+        rows = [clean_row(self.model, row) for row in rows]
+        columns = set().union(*(row.keys() for row in rows)) if rows else set()
+        self.with_photos = bool(self.image_field) and self.image_field in columns
+        self.update_fields = [name for name in self.writable if name in columns] + ["updated_at"]
+        # bulk_create() skips save(), so derived rich text columns are rendered here.
+        self.rich_text_fields = [name for name in getattr(self.model, "rich_text_fields", ()) if name in columns]
+        for name in self.rich_text_fields:
+            self.update_fields += derived_columns(name)
+        if self.with_photos:
+            self.update_fields += [self.image_field, self.variants_field]
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for offset in range(0, len(rows), self.batch_size):
+                    self._import_batch(rows[offset : offset + self.batch_size], offset + 1, pool)
+        finally:
+            if self.archive is not None:
+                self.archive.close()
+        return self.report
+
+    def _error(self, number, errors):
+        self.report["skipped"] += 1
+        self.report["errors"].append({"row": number, "errors": errors})
+
+    def _validate(self, batch, first_number):
+        valid = []
+        keys = {}
+        for number, row in enumerate(batch, start=first_number):
+            self.report["rows"] += 1
+            row = dict(row)
+            photo = row.pop(self.image_field, None) if self.image_field else None
+            key = row.pop(KEY_COLUMN, None)
+            try:
+                data = self.validator.run_validation(row)
+            except serializers.ValidationError as exc:
+                self._error(number, exc.detail)
+                continue
+
+            key = str(key).strip() if key else make_import_key(self.model, data)
+            if not key:
+                self._error(number, {KEY_COLUMN: [f"Add an {KEY_COLUMN} column or fill in {', '.join(KEY_FIELDS[self.model])}."]})
+                continue
+            max_length = self.model._meta.get_field(KEY_COLUMN).max_length
+            if len(key) > max_length:
+                self._error(number, {KEY_COLUMN: [f"Ensure this field has no more than {max_length} characters."]})
+                continue
+            if key in keys:
+                self._error(number, {KEY_COLUMN: [f"Duplicate of row {keys[key]}."]})
+                continue
+
+            member = None
+            if photo:
+                if self.archive is None:
+                    self._error(number, {self.image_field: ["Upload a photos zip to attach images."]})
+                    continue
+                member = self.archive.find(photo)
+                if member is None:
+                    self._error(number, {self.image_field: [f"{photo} was not found in the photos archive."]})
+                    continue
+            keys[key] = number
+            valid.append((number, key, data, member))
+        return valid
+
+    def _store_photos(self, valid, pool):
+        field = self.model._meta.get_field(self.image_field)
+        members = {member.filename: member for _, _, _, member in valid if member is not None}
+        futures = {filename: pool.submit(self.archive.store, member, field) for filename, member in members.items()}
+        stored, failed = {}, {}
+        for filename, future in futures.items():
+            try:
+                stored[filename] = future.result()
+            except Exception as exc:
+                failed[filename] = str(exc)
+
+        kept = []
+        for entry in valid:
+            number, _, _, member = entry
+            if member is not None and member.filename in failed:
+                self._error(number, {self.image_field: [failed[member.filename]]})
+            else:
+                kept.append(entry)
+        return kept, stored
+
+    def _import_batch(self, batch, first_number, pool):
+        valid = self._validate(batch, first_number)
+        if not valid:
+            return
+
+        matches = self.model._base_manager.filter(**{f"{KEY_COLUMN}__in": [key for _, key, _, _ in valid]})
+        if self.with_photos:
+            existing = {
+                key: (photo, variants)
+                for key, photo, variants in matches.values_list(KEY_COLUMN, self.image_field, self.variants_field)
+            }
+        else:
+            existing = dict.fromkeys(matches.values_list(KEY_COLUMN, flat=True))
+
+        if self.dry_run:
+            self._count(valid, existing)
+            return
+
+        stored = {}
+        if any(member is not None for _, _, _, member in valid):
+            valid, stored = self._store_photos(valid, pool)
+
+        objects, new_photos, stale_variants = [], [], []
+        for _, key, data, member in valid:
+            obj = self.model(**data, **{KEY_COLUMN: key})
+            if self.rich_text_fields:
+                render_rich_text(obj, self.rich_text_fields)
+            if self.with_photos:
+                previous_photo, previous_variants = existing.get(key) or ("", {})
+                if member is not None:
+                    setattr(obj, self.image_field, stored[member.filename])
+                    setattr(obj, self.variants_field, {})
+                    new_photos.append(obj)
+                    if previous_variants:
+                        stale_variants.append(previous_variants)
+                else:
+                    # A blank photo cell keeps whatever the row already has.
+                    setattr(obj, self.image_field, previous_photo or None)
+                    setattr(obj, self.variants_field, previous_variants or {})
+            objects.append(obj)
+
+        try:
+            with transaction.atomic():
+                self.model.objects.bulk_create(
+                    objects,
+                    update_conflicts=True,
+                    unique_fields=[KEY_COLUMN],
+                    update_fields=self.update_fields,
+                )
+                transaction.on_commit(lambda: self._after_commit(new_photos, stale_variants))
+        except DatabaseError as exc:
+            for name in stored.values():
+                self.model._meta.get_field(self.image_field).storage.delete(name)
+            for number, _, _, _ in valid:
+                self._error(number, {"non_field_errors": [str(exc)]})
+            return
+
+        self._count(valid, existing)
+        self.report["photos"] += len(stored)
+
+    def _count(self, valid, existing):
+        updated = sum(1 for _, key, _, _ in valid if key in existing)
+        self.report["updated"] += updated
+        self.report["created"] += len(valid) - updated
+
+    def _after_commit(self, new_photos, stale_variants):
+        for variants in stale_variants:
+            delete_variants(variants)
+        missing = [obj.import_key for obj in new_photos if obj.pk is None]
+        pks = {}
+        if missing:
+            # Backends that cannot return ids from an upsert.
+            pks = dict(self.model._base_manager.filter(import_key__in=missing).values_list(KEY_COLUMN, "pk"))
+        for obj in new_photos:
+            pk = obj.pk or pks.get(obj.import_key)
+            if pk is not None:
+                schedule_variants(self.model, pk, getattr(obj, self.image_field).name)
+
+
+def import_rows(kind, rows, **options):
+    try:
+        model, serializer_class = IMPORT_TARGETS[kind]
+    except KeyError:
+        raise ContentImportError(f"Unknown import kind {kind!r}; choose from {', '.join(IMPORT_TARGETS)}.")
+    return {"kind": kind, **ContentImporter(model, serializer_class, **options).run(rows)}
+
+
+class ContentImportActionMixin:
+    """Adds ``POST <list-url>/import/`` to a content admin viewset.
+
+    Send a multipart ``file`` (CSV or JSON) with an optional ``photos`` zip,
+    or a JSON array of rows. ``?dry_run=true`` validates without writing.
+    """
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser, FormParser, JSONParser],
+    )
+    def bulk_import(self, request, *args, **kwargs):
+        upload = request.FILES.get("file")
+        dry_run = (request.query_params.get("dry_run") or "").lower() in {"1", "true", "yes", "on"}
+        try:
+            if upload is not None:
+                rows = read_rows(upload.read(), upload.name)
+            elif isinstance(request.data, list):
+                rows = request.data
+            else:
+                raise ContentImportError("Upload a CSV or JSON `file`, or post a JSON array of rows.")
+            report = ContentImporter(
+                self.get_queryset().model,
+                self.get_serializer_class(),
+                photos=request.FILES.get("photos"),
+                dry_run=dry_run,
+            ).run(rows)
+        except ContentImportError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report)
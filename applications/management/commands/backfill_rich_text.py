@@ -0,0 +1,65 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+from educate_us_rise_us.richtext import derive_rows, derived_columns, rich_text_models
+
+
+class Command(BaseCommand):
+    help = "Fill sanitized HTML, excerpts and word counts for existing rich text in parallel."
+
+    def add_arguments(self, parser):
+        parser.add_argument("models", nargs="*", help="Limit to these models, e.g. posts.Post.")
+        parser.add_argument("--workers", type=int, default=2, help="Worker processes.")
+        parser.add_argument("--chunk-size", type=int, default=200, help="Rows per worker task and bulk update.")
+        parser.add_argument("--force", action="store_true", help="Re-render rows that already have derived columns.")
+
+    def handle(self, *args, **options):
+        registry = rich_text_models()
+        targets = registry
+        if options["models"]:
+            try:
+                targets = [apps.get_model(label) for label in options["models"]]
+            except (LookupError, ValueError) as exc:
+                raise CommandError(str(exc))
+            unknown = [model._meta.label for model in targets if model not in registry]
+            if unknown:
+                raise CommandError(f"No rich text fields on: {', '.join(unknown)}")
+
+        jobs = []
+        for model in targets:
+            for field_name in model.rich_text_fields:
+                html_column = derived_columns(field_name)[0]
+                rows = model._base_manager.exclude(**{field_name: ""})
+                if not options["force"]:
+                    rows = rows.filter(Q(**{html_column: ""}) | Q(**{f"{html_column}__isnull": True}))
+                pks_and_values = list(rows.order_by("pk").values_list("pk", field_name))
+                chunk_size = max(1, options["chunk_size"])
+                for offset in range(0, len(pks_and_values), chunk_size):
+                    jobs.append((model, field_name, pks_and_values[offset : offset + chunk_size]))
+
+        if not jobs:
+            self.stdout.write(self.style.SUCCESS("All rich text columns are up to date."))
+            return
+
+        rendered = 0
+        with ProcessPoolExecutor(max_workers=max(1, options["workers"])) as pool:
+            futures = []
+            for model, field_name, rows in jobs:
+                excerpt_length = model._meta.get_field(derived_columns(field_name)[1]).max_length
+                futures.append((model, field_name, pool.submit(derive_rows, rows, excerpt_length)))
+            for model, field_name, future in futures:
+                columns = derived_columns(field_name)
+                objects = []
+                for pk, values in future.result():
+                    obj = model(pk=pk)
+                    for column, value in zip(columns, values):
+                        setattr(obj, column, value)
+                    objects.append(obj)
+                # bulk_update() leaves updated_at alone: the source text has not changed.
+                model._base_manager.bulk_update(objects, columns)
+                rendered += len(objects)
+
+        self.stdout.write(self.style.SUCCESS(f"Rich text rendered for {rendered} value(s)."))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from applications.fastpath import serialize_queryset
+from applications.serializers import ProgramSerializer
+from educate_us_rise_us.benchmarking import best_of, rolled_back, seed_programs
+
+
+class Command(BaseCommand):
+    help = "Compare DRF serialization with the compiled .values() fast path on throwaway Program rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+        parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing per path.")
+
+    def handle(self, *args, **options):
+        request = Request(RequestFactory().get("/api/programs/"))
+        self.stdout.write(f"{'rows':>8} {'drf (s)':>10} {'fast (s)':>10} {'speedup':>8}")
+        for count in options["rows"]:
+            with rolled_back():
+                queryset = seed_programs(count)
+                slow = best_of(
+                    lambda: ProgramSerializer(queryset.all(), many=True, context={"request": request}).data,
+                    options["repeat"],
+                )
+                fast = best_of(
+                    lambda: serialize_queryset(ProgramSerializer, queryset.all(), {"request": request}),
+                    options["repeat"],
+                )
+            self.stdout.write(f"{count:>8} {slow:>10.3f} {fast:>10.3f} {slow / fast:>7.1f}x")
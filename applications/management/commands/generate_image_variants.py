@@ -0,0 +1,46 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from educate_us_rise_us.images import build_in_pool, init_worker, pending_variants, registered_image_fields
+
+
+class Command(BaseCommand):
+    help = "Generate responsive WebP/JPEG variants for existing CMS images in parallel."
+
+    def add_arguments(self, parser):
+        parser.add_argument("models", nargs="*", help="Limit to these models, e.g. applications.Program.")
+        parser.add_argument("--workers", type=int, default=None, help="Worker processes (default IMAGE_VARIANT_WORKERS).")
+        parser.add_argument("--force", action="store_true", help="Regenerate variants that are already current.")
+
+    def handle(self, *args, **options):
+        registry = registered_image_fields()
+        targets = list(registry)
+        if options["models"]:
+            try:
+                targets = [apps.get_model(label) for label in options["models"]]
+            except (LookupError, ValueError) as exc:
+                raise CommandError(str(exc))
+            unknown = [model._meta.label for model in targets if model not in registry]
+            if unknown:
+                raise CommandError(f"No image variants registered for: {', '.join(unknown)}")
+
+        jobs = list(pending_variants(targets, force=options["force"]))
+
+        if not jobs:
+            self.stdout.write(self.style.SUCCESS("All image variants are up to date."))
+            return
+
+        workers = options["workers"] or int(getattr(settings, "IMAGE_VARIANT_WORKERS", 2))
+        generated = failed = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            for (model, pk, name), error in build_in_pool(pool, jobs):
+                if error is None:
+                    generated += 1
+                else:
+                    failed += 1
+                    self.stderr.write(f"{model._meta.label} #{pk} ({name}): {error}")
+
+        self.stdout.write(self.style.SUCCESS(f"Image variants generated for {generated} image(s); {failed} failed."))
@@ -0,0 +1,50 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from applications.importing import IMPORT_TARGETS, ContentImportError, import_rows, read_rows
+
+
+class Command(BaseCommand):
+    help = "Upsert programs, projects, events, team, partners or testimonials from a CSV/JSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(IMPORT_TARGETS))
+        parser.add_argument("path", help="CSV (with a header row) or JSON array of rows.")
+        parser.add_argument("--photos", help="Zip of images referenced by the photo/logo column.")
+        parser.add_argument("--batch-size", type=int, default=None, help="Rows per transaction (default CONTENT_IMPORT_BATCH_SIZE).")
+        parser.add_argument("--workers", type=int, default=None, help="Photo upload threads (default CONTENT_IMPORT_PHOTO_WORKERS).")
+        parser.add_argument("--dry-run", action="store_true", help="Validate and report without writing anything.")
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["path"], "rb") as handle:
+                rows = read_rows(handle.read(), options["path"])
+            photos = open(options["photos"], "rb") if options["photos"] else None
+        except OSError as exc:
+            raise CommandError(str(exc))
+
+        try:
+            report = import_rows(
+                options["kind"],
+                rows,
+                photos=photos,
+                batch_size=options["batch_size"],
+                workers=options["workers"],
+                dry_run=options["dry_run"],
+            )
+        except ContentImportError as exc:
+            raise CommandError(str(exc))
+        finally:
+            if photos is not None:
+                photos.close()
+
+        for error in report["errors"]:
+            self.stderr.write(f"Row {error['row']}: {json.dumps(error['errors'])}")
+        prefix = "Dry run: " if options["dry_run"] else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}{report['rows']} row(s): {report['created']} created, {report['updated']} updated, "
+                f"{report['skipped']} skipped, {report['photos']} photo(s) attached."
+            )
+        )
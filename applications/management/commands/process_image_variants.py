@@ -0,0 +1,36 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from educate_us_rise_us.images import init_worker, process_variant_jobs
+
+
+class Command(BaseCommand):
+    help = "Build responsive variants for queued image uploads in a process pool."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--workers", type=int, default=None, help="Worker processes (default IMAGE_VARIANT_WORKERS).")
+        parser.add_argument("--loop", action="store_true", help="Keep polling for new uploads.")
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds to sleep when the queue is empty.")
+
+    def handle(self, *args, **options):
+        workers = options["workers"] or int(getattr(settings, "IMAGE_VARIANT_WORKERS", 2))
+        total_generated = total_failed = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            while True:
+                generated, failed = process_variant_jobs(pool, options["batch_size"])
+                total_generated += generated
+                total_failed += failed
+                if generated or failed:
+                    self.stdout.write(f"Generated {generated}, failed {failed}.")
+                    continue
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Image variant queue drained: {total_generated} generated, {total_failed} failed.")
+        )
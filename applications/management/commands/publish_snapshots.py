@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from educate_us_rise_us.snapshots import publish_snapshots
+
+
+class Command(BaseCommand):
+    help = "Render the public content lists to versioned, precompressed JSON files served by WhiteNoise."
+
+    def handle(self, *args, **options):
+        manifest = publish_snapshots()
+        for section, entry in manifest["files"].items():
+            self.stdout.write(f"{section}: {entry['url']} ({entry['bytes']} bytes)")
+        self.stdout.write(self.style.SUCCESS(f"Snapshot manifest version {manifest['version']}."))
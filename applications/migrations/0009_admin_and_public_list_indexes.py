@@ -0,0 +1,67 @@
+# Generated by Django 6.0.2 on 2026-10-19 11:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0008_program_project_event_photo'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['type', 'status', '-created_at'], name='application_type_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['status', '-created_at'], name='application_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['-created_at'], name='application_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(condition=models.Q(('is_resolved', False)), fields=['-created_at'], name='contact_unresolved_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(condition=models.Q(('is_resolved', True)), fields=['-created_at'], name='contact_resolved_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['display_order', 'date', 'id'], name='event_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='partner',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['display_order', 'id'], name='partner_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='partnerappointment',
+            index=models.Index(fields=['status', '-created_at'], name='appointment_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='partnerappointment',
+            index=models.Index(fields=['-created_at'], name='appointment_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='program',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['display_order', 'id'], name='program_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['display_order', 'id'], name='project_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teammember',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['display_order', 'id'], name='teammember_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['display_order', 'id'], name='testimonial_active_order_idx'),
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 6.0.2 on 2026-10-19 15:13
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+# Mirrors applications.importing.KEY_FIELDS at the time of this migration.
+KEY_FIELDS = {
+    "Program": ("title",),
+    "Project": ("title",),
+    "Event": ("title", "date"),
+    "TeamMember": ("name",),
+    "Partner": ("name",),
+    "Testimonial": ("name",),
+}
+
+
+def backfill_import_keys(apps, schema_editor):
+    """Give existing rows the key an import of the same spreadsheet row would use."""
+    for model_name, key_fields in KEY_FIELDS.items():
+        model = apps.get_model("applications", model_name)
+        seen = set()
+        rows = []
+        for row in model.objects.order_by("id"):
+            key = slugify(" ".join(str(getattr(row, field)) for field in key_fields if getattr(row, field)))[:120]
+            if not key:
+                continue
+            if key in seen:
+                suffix = f"-{row.pk}"
+                key = key[: 120 - len(suffix)] + suffix
+            seen.add(key)
+            row.import_key = key
+            rows.append(row)
+        model.objects.bulk_update(rows, ["import_key"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0010_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='import_key',
+            field=models.CharField(blank=True, max_length=120, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='partner',
+            name='import_key',
+            field=models.CharField(blank=True, max_length=120, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='program',
+            name='import_key',
+            field=models.CharField(blank=True, max_length=120, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='import_key',
+            field=models.CharField(blank=True, max_length=120, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='teammember',
+            name='import_key',
+            field=models.CharField(blank=True, max_length=120, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='testimonial',
+            name='import_key',
+            field=models.CharField(blank=True, max_length=120, null=True, unique=True),
+        ),
+        migrations.RunPython(backfill_import_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-19 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0011_content_import_key'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['date', 'id'], name='event_active_date_idx'),
+        ),
+    ]
@@ -1,10 +1,17 @@
 ﻿from django.db import models
+from django.utils import timezone
+
+from educate_us_rise_us.content_cache import ContentQuerySet
+from educate_us_rise_us.richtext import EXCERPT_LENGTH, RichTextMixin
+from search.querysets import SearchIndexedQuerySet
 
 
 class TimeStampedModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SearchIndexedQuerySet.as_manager()
+
     class Meta:
         abstract = True
 
@@ -12,6 +19,11 @@ class TimeStampedModel(models.Model):
 class OrderedActiveModel(TimeStampedModel):
     display_order = models.PositiveIntegerField(default=0)
     is_active = models.BooleanField(default=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
+    # Natural key used by bulk imports to upsert rows (see applications.importing).
+    import_key = models.CharField(max_length=120, unique=True, null=True, blank=True)
+
+    objects = ContentQuerySet.as_manager()
 
     class Meta:
         abstract = True
@@ -54,70 +66,116 @@ class Application(TimeStampedModel):
     reviewed_at = models.DateTimeField(null=True, blank=True)
     review_note = models.TextField(blank=True)
 
+    objects = ContentQuerySet.as_manager()
+
+    search_fields = ("name", "email", "phone", "role", "message", "review_note")
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["type", "status", "-created_at"], name="application_type_status_idx"),
+            models.Index(fields=["status", "-created_at"], name="application_status_idx"),
+            models.Index(fields=["-created_at"], name="application_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.type}: {self.name} <{self.email}>"
 
 
-class Program(OrderedActiveModel):
+class Program(RichTextMixin, OrderedActiveModel):
     title = models.CharField(max_length=200)
     focus = models.CharField(max_length=120, blank=True)
     description = models.TextField()
+    description_html = models.TextField(blank=True, editable=False)
+    description_excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False)
+    description_word_count = models.PositiveIntegerField(default=0, editable=False)
     status = models.CharField(max_length=80, default="Active")
     beneficiaries = models.CharField(max_length=200, blank=True)
     highlights = models.JSONField(default=list, blank=True)
     image = models.URLField(blank=True)
     photo = models.ImageField(upload_to="programs/", blank=True, null=True)
 
+    rich_text_fields = ("description",)
+    search_fields = ("title", "focus", "description", "beneficiaries", "status")
+
     class Meta:
         ordering = ["display_order", "id"]
+        indexes = [
+            models.Index(fields=["display_order", "id"], condition=models.Q(is_active=True), name="program_active_order_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
 
-class Project(OrderedActiveModel):
+class Project(RichTextMixin, OrderedActiveModel):
     title = models.CharField(max_length=200)
     tag = models.CharField(max_length=80, blank=True)
     copy = models.TextField()
+    copy_html = models.TextField(blank=True, editable=False)
+    copy_excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False)
+    copy_word_count = models.PositiveIntegerField(default=0, editable=False)
     image = models.URLField(blank=True)
     photo = models.ImageField(upload_to="projects/", blank=True, null=True)
 
+    rich_text_fields = ("copy",)
+    search_fields = ("title", "tag", "copy")
+
     class Meta:
         ordering = ["display_order", "id"]
+        indexes = [
+            models.Index(fields=["display_order", "id"], condition=models.Q(is_active=True), name="project_active_order_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
 
-class Event(OrderedActiveModel):
+class Event(RichTextMixin, OrderedActiveModel):
     title = models.CharField(max_length=200)
     date = models.DateField(null=True, blank=True)
     location = models.CharField(max_length=200, blank=True)
     tag = models.CharField(max_length=80, blank=True)
     description = models.TextField()
+    description_html = models.TextField(blank=True, editable=False)
+    description_excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False)
+    description_word_count = models.PositiveIntegerField(default=0, editable=False)
     highlights = models.JSONField(default=list, blank=True)
     image = models.URLField(blank=True)
     photo = models.ImageField(upload_to="events/", blank=True, null=True)
 
+    rich_text_fields = ("description",)
+    search_fields = ("title", "location", "tag", "description")
+
     class Meta:
         ordering = ["display_order", "date", "id"]
+        indexes = [
+            models.Index(fields=["display_order", "date", "id"], condition=models.Q(is_active=True), name="event_active_order_idx"),
+            models.Index(fields=["date", "id"], condition=models.Q(is_active=True), name="event_active_date_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
 
-class TeamMember(OrderedActiveModel):
+class TeamMember(RichTextMixin, OrderedActiveModel):
     name = models.CharField(max_length=120)
     role = models.CharField(max_length=120)
     copy = models.TextField(blank=True)
+    copy_html = models.TextField(blank=True, editable=False)
+    copy_excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False)
+    copy_word_count = models.PositiveIntegerField(default=0, editable=False)
     image = models.URLField(blank=True)
     photo = models.ImageField(upload_to="team/", blank=True, null=True)
 
+    rich_text_fields = ("copy",)
+    search_fields = ("name", "role", "copy")
+
     class Meta:
         ordering = ["display_order", "id"]
+        indexes = [
+            models.Index(fields=["display_order", "id"], condition=models.Q(is_active=True), name="teammember_active_order_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -128,22 +186,36 @@ class Partner(OrderedActiveModel):
     link = models.URLField(blank=True)
     logo = models.ImageField(upload_to="partners/", blank=True, null=True)
 
+    search_fields = ("name", "link")
+
     class Meta:
         ordering = ["display_order", "id"]
+        indexes = [
+            models.Index(fields=["display_order", "id"], condition=models.Q(is_active=True), name="partner_active_order_idx"),
+        ]
 
     def __str__(self):
         return self.name
 
 
-class Testimonial(OrderedActiveModel):
+class Testimonial(RichTextMixin, OrderedActiveModel):
     name = models.CharField(max_length=120)
     role = models.CharField(max_length=120, blank=True)
     quote = models.TextField()
+    quote_html = models.TextField(blank=True, editable=False)
+    quote_excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False)
+    quote_word_count = models.PositiveIntegerField(default=0, editable=False)
     image = models.URLField(blank=True)
     photo = models.ImageField(upload_to="testimonials/", blank=True, null=True)
 
+    rich_text_fields = ("quote",)
+    search_fields = ("name", "role", "quote")
+
     class Meta:
         ordering = ["display_order", "id"]
+        indexes = [
+            models.Index(fields=["display_order", "id"], condition=models.Q(is_active=True), name="testimonial_active_order_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name}"
@@ -155,8 +227,18 @@ class ContactMessage(TimeStampedModel):
     message = models.TextField()
     is_resolved = models.BooleanField(default=False)
 
+    objects = ContentQuerySet.as_manager()
+
+    search_fields = ("name", "email", "message")
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # One partial index per side: ``is_resolved`` filters compile to a
+            # bare boolean predicate that SQLite cannot match to a composite.
+            models.Index(fields=["-created_at"], condition=models.Q(is_resolved=False), name="contact_unresolved_idx"),
+            models.Index(fields=["-created_at"], condition=models.Q(is_resolved=True), name="contact_resolved_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name} <{self.email}>"
@@ -184,8 +266,45 @@ class PartnerAppointment(TimeStampedModel):
     admin_response = models.TextField(blank=True)
     response_sent_at = models.DateTimeField(null=True, blank=True)
 
+    objects = ContentQuerySet.as_manager()
+
+    search_fields = ("organization_name", "contact_name", "email", "phone", "topic", "message", "admin_response")
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "-created_at"], name="appointment_status_created_idx"),
+            models.Index(fields=["-created_at"], name="appointment_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.organization_name} ({self.contact_name})"
+
+
+class ImageVariantJob(models.Model):
+    """An upload waiting for responsive variants.
+
+    Queued by ``educate_us_rise_us.images.schedule_variants`` and built by
+    ``manage.py process_image_variants``; one row per image, so re-uploading
+    before the worker gets to it just updates the queued name.
+    """
+
+    model_label = models.CharField(max_length=100)
+    object_id = models.PositiveBigIntegerField()
+    name = models.CharField(max_length=255)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+        constraints = [
+            models.UniqueConstraint(fields=["model_label", "object_id"], name="unique_image_variant_job"),
+        ]
+        indexes = [
+            models.Index(fields=["next_attempt_at"], name="image_variant_job_due_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.model_label} #{self.object_id} ({self.name})"
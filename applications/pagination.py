@@ -1,7 +1,186 @@
-﻿from rest_framework.pagination import PageNumberPagination
+﻿import json
+
+from django.conf import settings
+from django.db import connections
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class AdminResultsSetPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class PublicCursorPagination(CursorPagination):
+    """Opt-in cursor pagination for public lists.
+
+    Responses stay plain, unpaginated arrays unless the client sends
+    ``?limit=`` or ``?cursor=``, so existing frontends keep working.
+    """
+
+    page_size = 20
+    page_size_query_param = "limit"
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.page_size_query_param not in params and self.cursor_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view):
+        return tuple(queryset.query.order_by) or ("-pk",)
+
+
+def estimate_count(queryset):
+    """Return the planner's row estimate for ``queryset``, or ``None``.
+
+    Unfiltered querysets read ``pg_class.reltuples``; filtered ones use the
+    top-level ``Plan Rows`` of ``EXPLAIN``. Only Postgres is supported.
+    """
+    if connections[queryset.db].vendor != "postgresql":
+        return None
+    queryset = queryset.order_by()
+    if not queryset.query.where:
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute("SELECT reltuples FROM pg_class WHERE oid = %s::regclass", [queryset.model._meta.db_table])
+            row = cursor.fetchone()
+        if row and row[0] >= 0:
+            return int(row[0])
+    try:
+        plan = json.loads(queryset.explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (ValueError, KeyError, IndexError, TypeError):
+        return None
+
+
+class EstimatedCountPagination(AdminResultsSetPagination):
+    """Page-number pagination that never runs ``COUNT(*)`` on large results.
+
+    ``count`` is exact below ``ADMIN_EXACT_COUNT_THRESHOLD`` rows and a
+    planner estimate above it (flagged by ``count_is_estimate``). ``next``
+    comes from fetching one extra row, so it is always accurate.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        try:
+            page_number = int(request.query_params.get(self.page_query_param, 1))
+        except (TypeError, ValueError):
+            page_number = 0
+        if page_number < 1:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message="Invalid page."))
+
+        offset = (page_number - 1) * page_size
+        rows = list(queryset[offset : offset + page_size + 1])
+        self.request = request
+        self.page_number = page_number
+        self.has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        if page_number > 1 and not rows:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message="That page contains no results."))
+
+        self.count, self.count_is_estimate = self.get_count(queryset)
+        # Never report fewer rows than we have already seen.
+        self.count = max(self.count, offset + len(rows) + (1 if self.has_next else 0))
+        return rows
+
+    def get_count(self, queryset):
+        threshold = int(getattr(settings, "ADMIN_EXACT_COUNT_THRESHOLD", 10000))
+        estimate = estimate_count(queryset)
+        if estimate is None or estimate < threshold:
+            return queryset.count(), False
+        return estimate, True
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if self.page_number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "count": self.count,
+                "count_is_estimate": self.count_is_estimate,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_is_estimate"] = {"type": "boolean"}
+        return response_schema
+
+
+class AdminKeysetPagination(CursorPagination):
+    """Keyset pagination with no count at all; ordering follows ``?ordering=``."""
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-created_at"
+
+
+class AdminPagination(BasePagination):
+    """Admin list pagination with a selectable mode.
+
+    ``?pagination=page|estimate|keyset`` picks the mode per request; a
+    ``?cursor=`` implies ``keyset``. Otherwise the view's
+    ``pagination_mode`` is used, defaulting to exact page numbers.
+    """
+
+    mode_query_param = "pagination"
+    mode_classes = {
+        "page": AdminResultsSetPagination,
+        "estimate": EstimatedCountPagination,
+        "keyset": AdminKeysetPagination,
+    }
+    default_mode = "page"
+
+    def __init__(self):
+        self.delegate = None
+
+    def get_mode(self, request, view=None):
+        mode = request.query_params.get(self.mode_query_param)
+        if mode in self.mode_classes:
+            return mode
+        if AdminKeysetPagination.cursor_query_param in request.query_params:
+            return "keyset"
+        return getattr(view, "pagination_mode", self.default_mode)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.delegate = self.mode_classes[self.get_mode(request, view)]()
+        return self.delegate.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.delegate.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return AdminResultsSetPagination().get_paginated_response_schema(schema)
+
+    def get_schema_operation_parameters(self, view):
+        return AdminResultsSetPagination().get_schema_operation_parameters(view)
+
+    @property
+    def display_page_controls(self):
+        return bool(self.delegate and self.delegate.display_page_controls)
+
+    def to_html(self):
+        return self.delegate.to_html()
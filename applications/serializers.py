@@ -1,5 +1,9 @@
 ﻿from rest_framework import serializers
 
+from educate_us_rise_us.images import srcset_map
+
+from .fastpath import image_url_accessor, srcset_accessor
+from .fieldsets import SparseFieldsetSerializerMixin
 from .models import (
     Application,
     ContactMessage,
@@ -80,8 +84,52 @@ class ApplicationReviewSerializer(serializers.ModelSerializer):
         return value
 
 
-class ProgramSerializer(serializers.ModelSerializer):
+class ApplicationBulkReviewItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField(min_value=1)
+    status = serializers.ChoiceField(choices=[Application.STATUS_APPROVED, Application.STATUS_REJECTED])
+    review_note = serializers.CharField(required=False, allow_blank=True, default="")
+
+
+class ApplicationBulkReviewSerializer(serializers.Serializer):
+    """Either ``{"ids": [...], "status": ..., "review_note": ...}`` or ``{"reviews": [{...}, ...]}``."""
+
+    MAX_ITEMS = 1000
+
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, allow_empty=False)
+    status = serializers.ChoiceField(
+        choices=[Application.STATUS_APPROVED, Application.STATUS_REJECTED],
+        required=False,
+    )
+    review_note = serializers.CharField(required=False, allow_blank=True, default="")
+    reviews = ApplicationBulkReviewItemSerializer(many=True, required=False)
+
+    def validate(self, attrs):
+        reviews = attrs.get("reviews")
+        if reviews is None:
+            if not attrs.get("ids") or not attrs.get("status"):
+                raise serializers.ValidationError("Provide either reviews, or ids together with status.")
+            reviews = [
+                {"id": pk, "status": attrs["status"], "review_note": attrs.get("review_note", "")}
+                for pk in attrs["ids"]
+            ]
+        if not reviews:
+            raise serializers.ValidationError("At least one application is required.")
+        if len(reviews) > self.MAX_ITEMS:
+            raise serializers.ValidationError(f"At most {self.MAX_ITEMS} applications can be reviewed at once.")
+        ids = [item["id"] for item in reviews]
+        if len(ids) != len(set(ids)):
+            raise serializers.ValidationError("Each application may only appear once.")
+        return {"reviews": reviews}
+
+
+class ProgramSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField(read_only=True)
+    image_srcset = serializers.SerializerMethodField(read_only=True)
+
+    fast_accessors = {
+        "image_url": image_url_accessor("photo", "image"),
+        "image_srcset": srcset_accessor("photo"),
+    }
 
     class Meta:
         model = Program
@@ -90,17 +138,22 @@ class ProgramSerializer(serializers.ModelSerializer):
             "title",
             "focus",
             "description",
+            "description_html",
+            "description_excerpt",
+            "description_word_count",
             "status",
             "beneficiaries",
             "highlights",
             "image",
             "photo",
             "image_url",
+            "image_srcset",
             "display_order",
             "is_active",
             "created_at",
             "updated_at",
         ]
+        sparse_field_sources = {"image_url": ["photo", "image"], "image_srcset": ["photo", "image_variants"]}
 
     def get_image_url(self, obj):
         if obj.photo:
@@ -110,9 +163,18 @@ class ProgramSerializer(serializers.ModelSerializer):
             return obj.photo.url
         return obj.image or ""
 
+    def get_image_srcset(self, obj):
+        return srcset_map(obj.image_variants, obj.photo, self.context.get("request"))
 
-class ProjectSerializer(serializers.ModelSerializer):
+
+class ProjectSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField(read_only=True)
+    image_srcset = serializers.SerializerMethodField(read_only=True)
+
+    fast_accessors = {
+        "image_url": image_url_accessor("photo", "image"),
+        "image_srcset": srcset_accessor("photo"),
+    }
 
     class Meta:
         model = Project
@@ -121,14 +183,19 @@ class ProjectSerializer(serializers.ModelSerializer):
             "title",
             "tag",
             "copy",
+            "copy_html",
+            "copy_excerpt",
+            "copy_word_count",
             "image",
             "photo",
             "image_url",
+            "image_srcset",
             "display_order",
             "is_active",
             "created_at",
             "updated_at",
         ]
+        sparse_field_sources = {"image_url": ["photo", "image"], "image_srcset": ["photo", "image_variants"]}
 
     def get_image_url(self, obj):
         if obj.photo:
@@ -138,10 +205,19 @@ class ProjectSerializer(serializers.ModelSerializer):
             return obj.photo.url
         return obj.image or ""
 
+    def get_image_srcset(self, obj):
+        return srcset_map(obj.image_variants, obj.photo, self.context.get("request"))
 
-class EventSerializer(serializers.ModelSerializer):
+
+class EventSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     date = serializers.DateField(required=False, allow_null=True, format="%Y-%m-%d", input_formats=["%Y-%m-%d"])
     image_url = serializers.SerializerMethodField(read_only=True)
+    image_srcset = serializers.SerializerMethodField(read_only=True)
+
+    fast_accessors = {
+        "image_url": image_url_accessor("photo", "image"),
+        "image_srcset": srcset_accessor("photo"),
+    }
 
     class Meta:
         model = Event
@@ -152,15 +228,20 @@ class EventSerializer(serializers.ModelSerializer):
             "location",
             "tag",
             "description",
+            "description_html",
+            "description_excerpt",
+            "description_word_count",
             "highlights",
             "image",
             "photo",
             "image_url",
+            "image_srcset",
             "display_order",
             "is_active",
             "created_at",
             "updated_at",
         ]
+        sparse_field_sources = {"image_url": ["photo", "image"], "image_srcset": ["photo", "image_variants"]}
 
     def get_image_url(self, obj):
         if obj.photo:
@@ -170,9 +251,18 @@ class EventSerializer(serializers.ModelSerializer):
             return obj.photo.url
         return obj.image or ""
 
+    def get_image_srcset(self, obj):
+        return srcset_map(obj.image_variants, obj.photo, self.context.get("request"))
+
 
-class TeamMemberSerializer(serializers.ModelSerializer):
+class TeamMemberSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField(read_only=True)
+    image_srcset = serializers.SerializerMethodField(read_only=True)
+
+    fast_accessors = {
+        "image_url": image_url_accessor("photo", "image"),
+        "image_srcset": srcset_accessor("photo"),
+    }
 
     class Meta:
         model = TeamMember
@@ -181,14 +271,19 @@ class TeamMemberSerializer(serializers.ModelSerializer):
             "name",
             "role",
             "copy",
+            "copy_html",
+            "copy_excerpt",
+            "copy_word_count",
             "image",
             "photo",
             "image_url",
+            "image_srcset",
             "display_order",
             "is_active",
             "created_at",
             "updated_at",
         ]
+        sparse_field_sources = {"image_url": ["photo", "image"], "image_srcset": ["photo", "image_variants"]}
 
     def get_image_url(self, obj):
         if obj.photo:
@@ -198,9 +293,18 @@ class TeamMemberSerializer(serializers.ModelSerializer):
             return obj.photo.url
         return obj.image or ""
 
+    def get_image_srcset(self, obj):
+        return srcset_map(obj.image_variants, obj.photo, self.context.get("request"))
+
 
-class PartnerSerializer(serializers.ModelSerializer):
+class PartnerSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     logo_url = serializers.SerializerMethodField(read_only=True)
+    logo_srcset = serializers.SerializerMethodField(read_only=True)
+
+    fast_accessors = {
+        "logo_url": image_url_accessor("logo"),
+        "logo_srcset": srcset_accessor("logo"),
+    }
 
     class Meta:
         model = Partner
@@ -210,11 +314,13 @@ class PartnerSerializer(serializers.ModelSerializer):
             "link",
             "logo",
             "logo_url",
+            "logo_srcset",
             "display_order",
             "is_active",
             "created_at",
             "updated_at",
         ]
+        sparse_field_sources = {"logo_url": ["logo"], "logo_srcset": ["logo", "image_variants"]}
 
     def get_logo_url(self, obj):
         if not obj.logo:
@@ -224,9 +330,18 @@ class PartnerSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.logo.url)
         return obj.logo.url
 
+    def get_logo_srcset(self, obj):
+        return srcset_map(obj.image_variants, obj.logo, self.context.get("request"))
 
-class TestimonialSerializer(serializers.ModelSerializer):
+
+class TestimonialSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField(read_only=True)
+    image_srcset = serializers.SerializerMethodField(read_only=True)
+
+    fast_accessors = {
+        "image_url": image_url_accessor("photo", "image"),
+        "image_srcset": srcset_accessor("photo"),
+    }
 
     class Meta:
         model = Testimonial
@@ -235,14 +350,19 @@ class TestimonialSerializer(serializers.ModelSerializer):
             "name",
             "role",
             "quote",
+            "quote_html",
+            "quote_excerpt",
+            "quote_word_count",
             "image",
             "photo",
             "image_url",
+            "image_srcset",
             "display_order",
             "is_active",
             "created_at",
             "updated_at",
         ]
+        sparse_field_sources = {"image_url": ["photo", "image"], "image_srcset": ["photo", "image_variants"]}
 
     def get_image_url(self, obj):
         if obj.photo:
@@ -252,6 +372,9 @@ class TestimonialSerializer(serializers.ModelSerializer):
             return obj.photo.url
         return obj.image or ""
 
+    def get_image_srcset(self, obj):
+        return srcset_map(obj.image_variants, obj.photo, self.context.get("request"))
+
 
 class ContactMessageCreateSerializer(serializers.ModelSerializer):
     class Meta:
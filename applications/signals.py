@@ -0,0 +1,36 @@
+from educate_us_rise_us.content_cache import content_changed, track_content_model
+from educate_us_rise_us.images import register_image_field
+from educate_us_rise_us.snapshots import publish_on_change
+from search.index import register_search_model
+
+from .models import (
+    Application,
+    ContactMessage,
+    Event,
+    Partner,
+    PartnerAppointment,
+    Program,
+    Project,
+    TeamMember,
+    Testimonial,
+)
+
+PUBLIC_CONTENT_MODELS = (Program, Project, Event, TeamMember, Partner, Testimonial)
+DASHBOARD_MODELS = (Application, ContactMessage, PartnerAppointment)
+
+for model in PUBLIC_CONTENT_MODELS:
+    track_content_model(model)
+
+for model in (Program, Project, Event, TeamMember, Testimonial):
+    register_image_field(model, "photo")
+register_image_field(Partner, "logo")
+
+# Republish the static JSON snapshots after public content changes.
+content_changed.connect(publish_on_change, dispatch_uid="static-snapshots-publish")
+
+# Versioned only to invalidate the cached admin dashboard; never purged.
+for model in DASHBOARD_MODELS:
+    track_content_model(model, purge=False)
+
+for model in (*PUBLIC_CONTENT_MODELS, *DASHBOARD_MODELS):
+    register_search_model(model)
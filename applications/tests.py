@@ -0,0 +1,415 @@
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from io import BytesIO
+from urllib.parse import parse_qs, urlsplit
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from unittest import mock
+
+from accounts.models import User
+
+from educate_us_rise_us.images import process_variant_jobs
+from educate_us_rise_us.snapshots import LOCK_NAME, publish_snapshots
+
+from .importing import import_rows, read_rows
+from .models import Application, ContactMessage, Event, ImageVariantJob, PartnerAppointment, Program, TeamMember
+from .views import filter_created_range, filter_event_dates
+
+
+@contextmanager
+def prefer_indexes():
+    # Test tables are tiny, so Postgres would pick a sequential scan on cost
+    # alone; turn that off so the plan shows which index is usable.
+    if connection.vendor != "postgresql":
+        yield
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SET enable_seqscan = off")
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("RESET enable_seqscan")
+
+
+class QueryPlanTests(TestCase):
+    def assertUsesIndex(self, queryset, index_name, sorted_by_index=True):
+        with prefer_indexes():
+            plan = queryset.explain()
+        self.assertIn(index_name, plan)
+        if sorted_by_index and connection.vendor == "sqlite":
+            self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_application_admin_filters(self):
+        self.assertUsesIndex(
+            Application.objects.filter(type=Application.TYPE_VOLUNTEER, status=Application.STATUS_PENDING),
+            "application_type_status_idx",
+        )
+        self.assertUsesIndex(
+            Application.objects.filter(status=Application.STATUS_APPROVED),
+            "application_status_idx",
+        )
+        self.assertUsesIndex(
+            filter_created_range(Application.objects.all(), "2026-01-01", "2026-01-31"),
+            "application_created_idx",
+        )
+
+    def test_partner_appointment_status_filter(self):
+        self.assertUsesIndex(
+            PartnerAppointment.objects.filter(status=PartnerAppointment.STATUS_PENDING),
+            "appointment_status_created_idx",
+        )
+
+    def test_contact_message_resolution_filter(self):
+        self.assertUsesIndex(ContactMessage.objects.filter(is_resolved=False), "contact_unresolved_idx")
+        self.assertUsesIndex(ContactMessage.objects.filter(is_resolved=True), "contact_resolved_idx")
+
+    def test_public_lists_use_partial_ordering_index(self):
+        self.assertUsesIndex(
+            Program.objects.filter(is_active=True).order_by("display_order", "id"),
+            "program_active_order_idx",
+        )
+        self.assertUsesIndex(
+            TeamMember.objects.filter(is_active=True).order_by("display_order", "id"),
+            "teammember_active_order_idx",
+        )
+        self.assertUsesIndex(
+            Event.objects.filter(is_active=True).order_by("display_order", "date", "id"),
+            "event_active_order_idx",
+        )
+
+    def test_event_date_filters(self):
+        active = Event.objects.filter(is_active=True)
+        self.assertUsesIndex(filter_event_dates(active, {"when": "upcoming"}), "event_active_date_idx")
+        self.assertUsesIndex(filter_event_dates(active, {"when": "past"}), "event_active_date_idx")
+        self.assertUsesIndex(filter_event_dates(active, {"month": "2026-03"}), "event_active_date_idx")
+
+
+class CreatedRangeFilterTests(TestCase):
+    def setUp(self):
+        self.messages = {}
+        for label, moment in {
+            "before": datetime(2026, 2, 28, 23, 59),
+            "first": datetime(2026, 3, 1, 0, 0),
+            "last": datetime(2026, 3, 2, 23, 59, 59),
+            "after": datetime(2026, 3, 3, 0, 0),
+        }.items():
+            message = ContactMessage.objects.create(name=label, email=f"{label}@example.com", message="-")
+            ContactMessage.objects.filter(pk=message.pk).update(created_at=timezone.make_aware(moment))
+            self.messages[label] = message.pk
+
+    def names(self, date_from, date_to):
+        queryset = filter_created_range(ContactMessage.objects.all(), date_from, date_to)
+        return set(queryset.values_list("name", flat=True))
+
+    def test_range_includes_whole_end_day(self):
+        self.assertEqual(self.names("2026-03-01", "2026-03-02"), {"first", "last"})
+
+    def test_open_ended_ranges(self):
+        self.assertEqual(self.names("2026-03-02", None), {"last", "after"})
+        self.assertEqual(self.names(None, "2026-02-28"), {"before"})
+
+    def test_invalid_dates_are_ignored(self):
+        self.assertEqual(self.names("not-a-date", "2026-02-30"), {"before", "first", "last", "after"})
+
+
+class EventDateFilterTests(TestCase):
+    today = date(2026, 3, 15)
+
+    def setUp(self):
+        Event.objects.all().delete()
+        for title, day in {
+            "undated": None,
+            "february": date(2026, 2, 27),
+            "yesterday": self.today - timedelta(days=1),
+            "today": self.today,
+            "march-end": date(2026, 3, 31),
+            "april": date(2026, 4, 1),
+        }.items():
+            Event.objects.create(title=title, date=day, description="-")
+
+    def titles(self, params):
+        with mock.patch("applications.views.timezone.localdate", return_value=self.today):
+            return list(filter_event_dates(Event.objects.all(), params).values_list("title", flat=True))
+
+    def test_upcoming_starts_today_in_date_order(self):
+        self.assertEqual(self.titles({"when": "upcoming"}), ["today", "march-end", "april"])
+
+    def test_past_is_newest_first(self):
+        self.assertEqual(self.titles({"when": "past"}), ["yesterday", "february"])
+
+    def test_month_and_range_are_inclusive(self):
+        self.assertEqual(self.titles({"month": "2026-03"}), ["yesterday", "today", "march-end"])
+        self.assertEqual(self.titles({"date_from": "2026-03-31", "date_to": "2026-04-01"}), ["march-end", "april"])
+        self.assertEqual(self.titles({"month": "2026-03", "when": "upcoming"}), ["today", "march-end"])
+
+    def test_no_or_invalid_filters_keep_every_event(self):
+        self.assertEqual(len(self.titles({})), 6)
+        self.assertEqual(len(self.titles({"month": "March", "date_from": "soon"})), 6)
+
+
+class SnapshotTests(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        settings_override = override_settings(SNAPSHOT_ROOT=self.root, SNAPSHOT_PUBLISH_ON_CHANGE=False)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def add_program(self, title):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Program.objects.create(title=title, focus="f", description="d", beneficiaries="b")
+
+    def snapshot_names(self):
+        return {name for name in os.listdir(self.root) if name.endswith(".json") and name != "manifest.json"}
+
+    def test_publish_writes_hashed_files_and_reuses_unchanged_ones(self):
+        manifest = publish_snapshots()
+        self.assertIn("programs", manifest["files"])
+        self.assertIn(LOCK_NAME, os.listdir(self.root))
+        self.assertEqual(publish_snapshots(), manifest)
+        self.assertEqual(publish_snapshots(if_stale=True), manifest)
+
+    def test_prune_keeps_previous_manifest_files_only(self):
+        first = publish_snapshots()["files"]["programs"]["url"].rsplit("/", 1)[-1]
+        self.add_program("Second")
+        second = publish_snapshots()["files"]["programs"]["url"].rsplit("/", 1)[-1]
+        self.assertIn(first, self.snapshot_names())
+        self.add_program("Third")
+        third = publish_snapshots()["files"]["programs"]["url"].rsplit("/", 1)[-1]
+        names = self.snapshot_names()
+        self.assertNotIn(first, names)
+        self.assertTrue({second, third} <= names)
+        self.assertIn(LOCK_NAME, os.listdir(self.root))
+
+    def test_manifest_view_republishes_after_changes_from_elsewhere(self):
+        publish_snapshots()
+        # Publishing on change is off, as in a process that does not serve the files.
+        self.add_program("Imported")
+        manifest = self.client.get("/api/snapshots/").json()
+        programs = self.client.get(manifest["files"]["programs"]["url"])
+        self.assertEqual(programs.status_code, 200)
+        self.assertIn("Imported", [item["title"] for item in json.loads(b"".join(programs.streaming_content))])
+
+    def test_middleware_serves_snapshots_with_cache_headers(self):
+        manifest = publish_snapshots()
+        url = manifest["files"]["programs"]["url"]
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("immutable", response["Cache-Control"])
+        manifest_response = self.client.get("/snapshots/manifest.json")
+        self.assertEqual(manifest_response.status_code, 200)
+        self.assertNotIn("immutable", manifest_response.get("Cache-Control", ""))
+        self.assertEqual(self.client.get(url.replace(".json", ".missing.json")).status_code, 404)
+
+
+class BulkReviewTests(TestCase):
+    url = "/api/admin/applications/bulk-review/"
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(email="admin@example.org")
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        self.applications = [
+            Application.objects.create(type=Application.TYPE_JOIN, name=f"Applicant {i}", email=f"a{i}@example.org")
+            for i in range(3)
+        ]
+
+    def review(self, payload):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, payload, format="json")
+        updates = [query["sql"] for query in queries.captured_queries if query["sql"].startswith("UPDATE")]
+        return response, updates
+
+    def test_one_update_per_status_with_per_row_notes(self):
+        first, second, third = self.applications
+        response, updates = self.review(
+            {
+                "reviews": [
+                    {"id": first.pk, "status": Application.STATUS_APPROVED, "review_note": "Strong"},
+                    {"id": second.pk, "status": Application.STATUS_APPROVED, "review_note": "Maybe later"},
+                    {"id": third.pk, "status": Application.STATUS_REJECTED},
+                ]
+            }
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["updated"], 3)
+        self.assertEqual(len(updates), 2)
+        rows = dict(Application.objects.values_list("pk", "status"))
+        notes = dict(Application.objects.values_list("pk", "review_note"))
+        self.assertEqual(rows, {first.pk: "approved", second.pk: "approved", third.pk: "rejected"})
+        self.assertEqual(notes, {first.pk: "Strong", second.pk: "Maybe later", third.pk: ""})
+        self.assertEqual(set(Application.objects.values_list("reviewed_by", flat=True)), {self.admin.pk})
+
+    def test_missing_ids_are_reported_and_duplicates_rejected(self):
+        response, _ = self.review({"ids": [self.applications[0].pk, 999999], "status": Application.STATUS_REJECTED})
+        self.assertEqual(response.json()["updated"], 1)
+        self.assertEqual(response.json()["results"][1], {"id": 999999, "error": "Not found."})
+
+        pk = self.applications[1].pk
+        response, updates = self.review({"ids": [pk, pk], "status": Application.STATUS_APPROVED})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(updates, [])
+
+
+class AdminPaginationTests(TestCase):
+    url = "/api/admin/contact-messages/"
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_superuser(email="admin@example.org"))
+        now = timezone.now()
+        for i in range(15):
+            ContactMessage.objects.create(name=f"Contact {i}", email=f"c{i}@example.org", message="Hi")
+        # Distinct timestamps so the keyset order is total.
+        for i, pk in enumerate(ContactMessage.objects.order_by("pk").values_list("pk", flat=True)):
+            ContactMessage.objects.filter(pk=pk).update(created_at=now - timedelta(minutes=i))
+
+    def get(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        counts = [query["sql"] for query in queries.captured_queries if "COUNT(" in query["sql"]]
+        return response.json(), counts
+
+    def test_view_default_is_estimate_mode_with_exact_small_counts(self):
+        data, counts = self.get()
+        self.assertEqual((data["count"], data["count_is_estimate"], len(data["results"])), (15, False, 10))
+        self.assertIn("page=2", data["next"])
+        self.assertEqual(len(counts), 1)
+
+    def test_large_estimates_skip_count(self):
+        with mock.patch("applications.pagination.estimate_count", return_value=50000):
+            data, counts = self.get(page=2)
+        self.assertEqual((data["count"], data["count_is_estimate"], len(data["results"])), (50000, True, 5))
+        self.assertIsNone(data["next"])
+        self.assertEqual(counts, [])
+
+    def test_page_mode_is_plain_page_numbers(self):
+        data, _ = self.get(pagination="page", page=2)
+        self.assertNotIn("count_is_estimate", data)
+        self.assertEqual((data["count"], len(data["results"])), (15, 5))
+        self.assertEqual(self.client.get(self.url, {"pagination": "estimate", "page": 3}).status_code, 404)
+
+    def test_keyset_mode_walks_every_row_once_without_counting(self):
+        data, counts = self.get(pagination="keyset")
+        self.assertNotIn("count", data)
+        self.assertEqual(counts, [])
+        seen = [row["id"] for row in data["results"]]
+        # A cursor alone selects keyset mode.
+        cursor = parse_qs(urlsplit(data["next"]).query)["cursor"][0]
+        data, _ = self.get(cursor=cursor)
+        seen += [row["id"] for row in data["results"]]
+        self.assertIsNone(data["next"])
+        expected = list(ContactMessage.objects.order_by("-created_at").values_list("pk", flat=True))
+        self.assertEqual(seen, expected)
+
+
+@override_settings(SNAPSHOT_PUBLISH_ON_CHANGE=False)
+class ContentImportTests(TestCase):
+    def setUp(self):
+        # Drop the programs seeded by migration 0003.
+        Program.objects.all().delete()
+
+    def test_rows_upsert_on_import_key(self):
+        report = import_rows(
+            "programs",
+            [
+                {"title": "Reading Club", "description": "Weekly reading", "focus": "Literacy"},
+                {"title": "Coding Camp", "description": "Holiday coding", "import_key": "camp-2026"},
+            ],
+        )
+        self.assertEqual((report["created"], report["updated"], report["skipped"]), (2, 0, 0))
+        self.assertEqual(set(Program.objects.values_list("import_key", flat=True)), {"reading-club", "camp-2026"})
+
+        rows = read_rows("title,description\nReading Club,Twice a week\nMaths Hub,Homework help\n")
+        report = import_rows("programs", rows)
+        self.assertEqual((report["created"], report["updated"]), (1, 1))
+        self.assertEqual(Program.objects.count(), 3)
+        reading = Program.objects.get(import_key="reading-club")
+        # Columns missing from the file keep their stored values.
+        self.assertEqual((reading.description, reading.focus), ("Twice a week", "Literacy"))
+        self.assertIn("Twice a week", reading.description_html)
+
+    def test_invalid_and_duplicate_rows_are_skipped(self):
+        report = import_rows(
+            "programs",
+            [
+                {"title": "Reading Club", "description": "Weekly reading"},
+                {"title": "", "description": "No title"},
+                {"title": "Reading Club", "description": "Again"},
+            ],
+        )
+        self.assertEqual((report["created"], report["skipped"]), (1, 2))
+        self.assertEqual([error["row"] for error in report["errors"]], [2, 3])
+        self.assertEqual(Program.objects.get().description, "Weekly reading")
+
+    def test_dry_run_writes_nothing(self):
+        report = import_rows("programs", [{"title": "Reading Club", "description": "Weekly"}], dry_run=True)
+        self.assertEqual((report["created"], report["dry_run"]), (1, True))
+        self.assertFalse(Program.objects.exists())
+
+
+@override_settings(
+    IMAGE_VARIANTS_ASYNC=True, IMAGE_VARIANT_WIDTHS=[320], IMAGE_VARIANT_MAX_ATTEMPTS=2, SNAPSHOT_PUBLISH_ON_CHANGE=False
+)
+class ImageVariantQueueTests(TestCase):
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=root)
+        media.enable()
+        self.addCleanup(media.disable)
+        pool = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(pool.shutdown)
+        self.pool = pool
+
+    def upload(self, content):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Program.objects.create(
+                title="Reading club",
+                description="d",
+                photo=SimpleUploadedFile("photo.png", content, content_type="image/png"),
+            )
+
+    def png(self):
+        from PIL import Image
+
+        buffer = BytesIO()
+        Image.new("RGB", (640, 320), "white").save(buffer, "PNG")
+        return buffer.getvalue()
+
+    def test_upload_queues_its_own_pk_and_the_worker_builds_it(self):
+        program = self.upload(self.png())
+        job = ImageVariantJob.objects.get()
+        self.assertEqual((job.model_label, job.object_id, job.name), ("applications.program", program.pk, program.photo.name))
+
+        self.assertEqual(process_variant_jobs(self.pool), (1, 0))
+        program.refresh_from_db()
+        self.assertEqual(program.image_variants["source"], program.photo.name)
+        self.assertEqual(set(program.image_variants["files"]), {"webp", "jpeg"})
+        self.assertFalse(ImageVariantJob.objects.exists())
+
+    def test_corrupt_upload_is_dropped_after_max_attempts(self):
+        self.upload(b"not an image")
+        with self.assertLogs("educate_us_rise_us.images", "WARNING"):
+            self.assertEqual(process_variant_jobs(self.pool), (0, 1))
+        job = ImageVariantJob.objects.get()
+        self.assertEqual(job.attempts, 1)
+        self.assertGreater(job.next_attempt_at, timezone.now())
+        self.assertEqual(process_variant_jobs(self.pool), (0, 0))
+
+        ImageVariantJob.objects.update(next_attempt_at=timezone.now())
+        with self.assertLogs("educate_us_rise_us.images", "ERROR"):
+            self.assertEqual(process_variant_jobs(self.pool), (0, 1))
+        self.assertFalse(ImageVariantJob.objects.exists())
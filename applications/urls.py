@@ -2,7 +2,9 @@
 from rest_framework.routers import DefaultRouter
 
 from .views import (
+    AdminDashboardView,
     ApplicationAdminViewSet,
+    ApplicationBulkReviewView,
     ApplicationReviewView,
     ContactCreateView,
     ContactMessageAdminViewSet,
@@ -22,6 +24,7 @@ from .views import (
     TestimonialAdminViewSet,
     TestimonialsListView,
     VolunteerApplicationCreateView,
+    events_calendar,
 )
 
 router = DefaultRouter()
@@ -42,12 +45,15 @@ urlpatterns = [
     path("programs/", ProgramsListView.as_view(), name="programs-list"),
     path("projects/", ProjectsListView.as_view(), name="projects-list"),
     path("events/", EventsListView.as_view(), name="events-list"),
+    path("events.ics", events_calendar, name="events-calendar"),
     path("team/", TeamListView.as_view(), name="team-list"),
     path("partners/", PartnersListView.as_view(), name="partners-list"),
     path("testimonials/", TestimonialsListView.as_view(), name="testimonials-list"),
     path("contact/", ContactCreateView.as_view(), name="contact-create"),
     path("partner-appointments/", PartnerAppointmentCreateView.as_view(), name="partner-appointment-create"),
     path("admin/applications/<int:pk>/review/", ApplicationReviewView.as_view(), name="application-review"),
+    path("admin/applications/bulk-review/", ApplicationBulkReviewView.as_view(), name="application-bulk-review"),
+    path("admin/dashboard/", AdminDashboardView.as_view(), name="admin-dashboard"),
 ]
 
 urlpatterns += router.urls
@@ -1,13 +1,29 @@
-﻿from django.utils import timezone
+﻿from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, Count, Q, TextField, Value, When
+from django.db.models.functions import TruncDate
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_date
 from django.conf import settings
-from django.core.mail import send_mail
-from rest_framework import filters, generics, status, viewsets
+from django.views.decorators.http import require_safe
+from rest_framework import generics, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from educate_us_rise_us.content_cache import VersionedCacheListMixin, content_versions
+from educate_us_rise_us.http_cache import ConditionalGetMixin, apply_public_cache_headers
+from outbox.mixins import MailCampaignActionMixin
+from outbox.models import OutboxEmail
+from search.filters import FullTextSearchFilter, RankedOrderingFilter
+
 from .models import (
     Application,
     ContactMessage,
@@ -19,9 +35,14 @@ from .models import (
     TeamMember,
     Testimonial,
 )
-from .pagination import AdminResultsSetPagination
+from .fastpath import ValuesListMixin
+from .ical import events_calendar_snapshot
+from .importing import ContentImportActionMixin
+from .fieldsets import SparseFieldsetMixin
+from .pagination import AdminPagination, PublicCursorPagination
 from .serializers import (
     ApplicationAdminSerializer,
+    ApplicationBulkReviewSerializer,
     ApplicationReviewSerializer,
     ContactMessageAdminSerializer,
     ContactMessageCreateSerializer,
@@ -49,11 +70,221 @@ def parse_bool(value):
     return None
 
 
+def parse_day(value):
+    try:
+        return parse_date(value) if value else None
+    except ValueError:
+        return None
+
+
+def filter_created_range(queryset, date_from, date_to, field="created_at"):
+    """Filter ``field`` to whole days as a half-open ``[from, to + 1 day)`` range.
+
+    Comparing the raw column (rather than ``__date``) lets the database use
+    the ``created_at`` indexes. Unparseable dates are ignored.
+    """
+    start = parse_day(date_from)
+    end = parse_day(date_to)
+    if start:
+        queryset = queryset.filter(**{f"{field}__gte": timezone.make_aware(datetime.combine(start, time.min))})
+    if end:
+        end = timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min))
+        queryset = queryset.filter(**{f"{field}__lt": end})
+    return queryset
+
+
+def parse_month(value):
+    try:
+        return datetime.strptime(value, "%Y-%m").date() if value else None
+    except ValueError:
+        return None
+
+
+def filter_event_dates(queryset, params):
+    """Apply ``?when=upcoming|past``, ``?month=YYYY-MM`` and inclusive ``?date_from``/``?date_to``.
+
+    Any date filter drops undated events and orders by date (newest first for
+    ``past``) so the ``(is_active, date)`` index serves both the filter and
+    the sort. Unparseable values are ignored.
+    """
+    when = (params.get("when") or "").strip().lower()
+    start = parse_day(params.get("date_from"))
+    end = parse_day(params.get("date_to"))
+
+    month = parse_month(params.get("month"))
+    if month:
+        month_end = (month.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+        start = max(start, month) if start else month
+        end = min(end, month_end) if end else month_end
+
+    today = timezone.localdate()
+    if when == "upcoming":
+        start = max(start, today) if start else today
+    elif when == "past":
+        yesterday = today - timedelta(days=1)
+        end = min(end, yesterday) if end else yesterday
+    elif not (start or end):
+        return queryset
+
+    queryset = queryset.filter(date__isnull=False)
+    if start:
+        queryset = queryset.filter(date__gte=start)
+    if end:
+        queryset = queryset.filter(date__lte=end)
+    if when == "past":
+        return queryset.order_by("-date", "-id")
+    return queryset.order_by("date", "id")
+
+
 class JWTAdminMixin:
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAdminUser]
-    pagination_class = AdminResultsSetPagination
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    pagination_class = AdminPagination
+    filter_backends = [FullTextSearchFilter, RankedOrderingFilter]
+
+
+class ApplicationBulkReviewView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        serializer = ApplicationBulkReviewSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        reviews = serializer.validated_data["reviews"]
+
+        reviewed_at = timezone.now()
+        updated = 0
+        with transaction.atomic():
+            existing = set(
+                Application.objects.filter(pk__in=[item["id"] for item in reviews]).values_list("pk", flat=True)
+            )
+            groups = defaultdict(dict)
+            for item in reviews:
+                if item["id"] in existing:
+                    groups[item["status"]][item["id"]] = item["review_note"]
+
+            # One UPDATE per status; per-row notes go through a CASE.
+            for status_value, notes in groups.items():
+                if len(set(notes.values())) == 1:
+                    review_note = Value(next(iter(notes.values())))
+                else:
+                    review_note = Case(
+                        *(When(pk=pk, then=Value(note)) for pk, note in notes.items()),
+                        output_field=TextField(),
+                    )
+                updated += Application.objects.filter(pk__in=list(notes)).update(
+                    status=status_value,
+                    review_note=review_note,
+                    reviewed_by=request.user,
+                    reviewed_at=reviewed_at,
+                    updated_at=reviewed_at,
+                )
+
+        results = [
+            {"id": item["id"], "status": item["status"]}
+            if item["id"] in existing
+            else {"id": item["id"], "error": "Not found."}
+            for item in reviews
+        ]
+        return Response(
+            {
+                "updated": updated,
+                "reviewed_at": reviewed_at,
+                "results": results,
+            }
+        )
+
+
+DASHBOARD_MODELS = (Application, ContactMessage, PartnerAppointment)
+
+
+def _status_counts(choices):
+    return {value: 0 for value, _ in choices}
+
+
+def _daily_counts(model, start, days):
+    rows = (
+        model.objects.filter(created_at__gte=start)
+        .annotate(day=TruncDate("created_at"))
+        .values("day")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    counts = {row["day"]: row["count"] for row in rows}
+    return [counts.get(start.date() + timedelta(days=offset), 0) for offset in range(days)]
+
+
+def admin_dashboard_payload():
+    application_types = {
+        value: {**_status_counts(Application.STATUS_CHOICES), "total": 0}
+        for value, _ in Application.TYPE_CHOICES
+    }
+    application_statuses = _status_counts(Application.STATUS_CHOICES)
+    grouped = Application.objects.order_by().values("type", "status").annotate(count=Count("id"))
+    for row in grouped:
+        by_type = application_types.setdefault(row["type"], {**_status_counts(Application.STATUS_CHOICES), "total": 0})
+        by_type[row["status"]] = by_type.get(row["status"], 0) + row["count"]
+        by_type["total"] += row["count"]
+        application_statuses[row["status"]] = application_statuses.get(row["status"], 0) + row["count"]
+
+    contact_counts = ContactMessage.objects.aggregate(
+        total=Count("id"),
+        unresolved=Count("id", filter=Q(is_resolved=False)),
+    )
+
+    appointment_statuses = _status_counts(PartnerAppointment.STATUS_CHOICES)
+    for row in PartnerAppointment.objects.order_by().values("status").annotate(count=Count("id")):
+        appointment_statuses[row["status"]] = row["count"]
+
+    days = int(getattr(settings, "ADMIN_DASHBOARD_SPARKLINE_DAYS", 14))
+    today = timezone.localdate()
+    start = timezone.make_aware(datetime.combine(today - timedelta(days=days - 1), time.min))
+
+    return {
+        "applications": {
+            "total": sum(application_statuses.values()),
+            "by_status": application_statuses,
+            "by_type": application_types,
+        },
+        "contact_messages": contact_counts,
+        "partner_appointments": {
+            "total": sum(appointment_statuses.values()),
+            "by_status": appointment_statuses,
+        },
+        "activity": {
+            "days": [(start.date() + timedelta(days=offset)).isoformat() for offset in range(days)],
+            "applications": _daily_counts(Application, start, days),
+            "contact_messages": _daily_counts(ContactMessage, start, days),
+            "partner_appointments": _daily_counts(PartnerAppointment, start, days),
+        },
+        "generated_at": timezone.now(),
+    }
+
+
+class AdminDashboardView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        # The key moves with every write to the dashboard models (and with the
+        # date, for the sparklines); the TTL only bounds how stale it can get.
+        key = f"admin-dashboard:{content_versions(DASHBOARD_MODELS)}:{timezone.localdate().isoformat()}"
+        payload = cache.get(key)
+        if payload is None:
+            payload = admin_dashboard_payload()
+            cache.set(key, payload, int(getattr(settings, "ADMIN_DASHBOARD_CACHE_SECONDS", 30)))
+        return Response(payload)
+
+
+class PublicContentListView(
+    SparseFieldsetMixin,
+    ConditionalGetMixin,
+    VersionedCacheListMixin,
+    ValuesListMixin,
+    generics.ListAPIView,
+):
+    permission_classes = [AllowAny]
+    pagination_class = PublicCursorPagination
 
 
 class VolunteerApplicationCreateView(generics.CreateAPIView):
@@ -76,12 +307,14 @@ class JoinApplicationCreateView(APIView):
         return Response(out.data, status=status.HTTP_201_CREATED)
 
 
-class ApplicationAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
+class ApplicationAdminViewSet(MailCampaignActionMixin, JWTAdminMixin, viewsets.ModelViewSet):
     queryset = Application.objects.select_related("reviewed_by").all()
     serializer_class = ApplicationAdminSerializer
-    search_fields = ["name", "email", "phone", "role", "message", "review_note"]
+    search_fields = Application.search_fields
     ordering_fields = ["created_at", "updated_at", "reviewed_at", "status", "type", "name", "email"]
     ordering = ["-created_at"]
+    mail_campaign_fields = ("name", "email", "type", "role", "status")
+    pagination_mode = "estimate"
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -101,10 +334,7 @@ class ApplicationAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
             queryset = queryset.filter(status=app_status)
         if reviewed_by:
             queryset = queryset.filter(reviewed_by_id=reviewed_by)
-        if date_from:
-            queryset = queryset.filter(created_at__date__gte=date_from)
-        if date_to:
-            queryset = queryset.filter(created_at__date__lte=date_to)
+        queryset = filter_created_range(queryset, date_from, date_to)
         return queryset
 
 
@@ -130,49 +360,61 @@ class ApplicationReviewView(generics.UpdateAPIView):
         return Response(output.data)
 
 
-class ProgramsListView(generics.ListAPIView):
+class ProgramsListView(PublicContentListView):
     serializer_class = ProgramSerializer
-    permission_classes = [AllowAny]
 
     def get_queryset(self):
         return Program.objects.filter(is_active=True).order_by("display_order", "id")
 
 
-class ProjectsListView(generics.ListAPIView):
+class ProjectsListView(PublicContentListView):
     serializer_class = ProjectSerializer
-    permission_classes = [AllowAny]
 
     def get_queryset(self):
         return Project.objects.filter(is_active=True).order_by("display_order", "id")
 
 
-class EventsListView(generics.ListAPIView):
+class EventsListView(PublicContentListView):
     serializer_class = EventSerializer
-    permission_classes = [AllowAny]
 
     def get_queryset(self):
         return Event.objects.filter(is_active=True).order_by("display_order", "date", "id")
 
+    def get_cache_scope(self):
+        # "upcoming"/"past" move at midnight without any Event write.
+        return timezone.localdate().isoformat() if self.request.query_params.get("when") else ""
+
+    def filter_queryset(self, queryset):
+        return super().filter_queryset(filter_event_dates(queryset, self.request.query_params))
+
+
+@require_safe
+def events_calendar(request):
+    """``/api/events.ics``: active dated events as an iCalendar feed."""
+    etag, body = events_calendar_snapshot(request)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(body, content_type="text/calendar; charset=utf-8")
+    response["ETag"] = etag
+    return apply_public_cache_headers(response, [Event])
+
 
-class TeamListView(generics.ListAPIView):
+class TeamListView(PublicContentListView):
     serializer_class = TeamMemberSerializer
-    permission_classes = [AllowAny]
 
     def get_queryset(self):
         return TeamMember.objects.filter(is_active=True).order_by("display_order", "id")
 
 
-class PartnersListView(generics.ListAPIView):
+class PartnersListView(PublicContentListView):
     serializer_class = PartnerSerializer
-    permission_classes = [AllowAny]
 
     def get_queryset(self):
         return Partner.objects.filter(is_active=True).order_by("display_order", "id")
 
 
-class TestimonialsListView(generics.ListAPIView):
+class TestimonialsListView(PublicContentListView):
     serializer_class = TestimonialSerializer
-    permission_classes = [AllowAny]
 
     def get_queryset(self):
         return Testimonial.objects.filter(is_active=True).order_by("display_order", "id")
@@ -187,6 +429,7 @@ class PartnerAppointmentCreateView(generics.CreateAPIView):
     serializer_class = PartnerAppointmentCreateSerializer
     permission_classes = [AllowAny]
 
+    @transaction.atomic
     def perform_create(self, serializer):
         appointment = serializer.save(status=PartnerAppointment.STATUS_PENDING)
 
@@ -205,7 +448,7 @@ class PartnerAppointmentCreateView(generics.CreateAPIView):
             f"Message:\n{appointment.message or '-'}"
         )
         if team_email:
-            send_mail(admin_subject, admin_message, from_email, [team_email], fail_silently=True)
+            OutboxEmail.enqueue(admin_subject, admin_message, [team_email], from_email)
 
         user_subject = "We received your partner appointment request"
         user_message = (
@@ -214,13 +457,13 @@ class PartnerAppointmentCreateView(generics.CreateAPIView):
             "Our team has received your request and will respond by email soon.\n\n"
             "Best regards,\nEUTR Partnerships Team"
         )
-        send_mail(user_subject, user_message, from_email, [appointment.email], fail_silently=True)
+        OutboxEmail.enqueue(user_subject, user_message, [appointment.email], from_email)
 
 
-class ProgramAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
+class ProgramAdminViewSet(ContentImportActionMixin, JWTAdminMixin, viewsets.ModelViewSet):
     queryset = Program.objects.all().order_by("display_order", "id")
     serializer_class = ProgramSerializer
-    search_fields = ["title", "focus", "description", "beneficiaries", "status"]
+    search_fields = Program.search_fields
     ordering_fields = ["display_order", "title", "status", "created_at", "updated_at", "is_active"]
     ordering = ["display_order", "id"]
 
@@ -239,10 +482,10 @@ class ProgramAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
         return queryset
 
 
-class ProjectAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
+class ProjectAdminViewSet(ContentImportActionMixin, JWTAdminMixin, viewsets.ModelViewSet):
     queryset = Project.objects.all().order_by("display_order", "id")
     serializer_class = ProjectSerializer
-    search_fields = ["title", "tag", "copy"]
+    search_fields = Project.search_fields
     ordering_fields = ["display_order", "title", "tag", "created_at", "updated_at", "is_active"]
     ordering = ["display_order", "id"]
 
@@ -258,10 +501,10 @@ class ProjectAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
         return queryset
 
 
-class EventAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
+class EventAdminViewSet(ContentImportActionMixin, JWTAdminMixin, viewsets.ModelViewSet):
     queryset = Event.objects.all().order_by("display_order", "date", "id")
     serializer_class = EventSerializer
-    search_fields = ["title", "location", "tag", "description"]
+    search_fields = Event.search_fields
     ordering_fields = ["display_order", "date", "title", "location", "tag", "created_at", "updated_at", "is_active"]
     ordering = ["display_order", "date", "id"]
 
@@ -286,10 +529,10 @@ class EventAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
         return queryset
 
 
-class TeamAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
+class TeamAdminViewSet(ContentImportActionMixin, JWTAdminMixin, viewsets.ModelViewSet):
     queryset = TeamMember.objects.all().order_by("display_order", "id")
     serializer_class = TeamMemberSerializer
-    search_fields = ["name", "role", "copy"]
+    search_fields = TeamMember.search_fields
     ordering_fields = ["display_order", "name", "role", "created_at", "updated_at", "is_active"]
     ordering = ["display_order", "id"]
 
@@ -305,10 +548,10 @@ class TeamAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
         return queryset
 
 
-class PartnerAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
+class PartnerAdminViewSet(ContentImportActionMixin, JWTAdminMixin, viewsets.ModelViewSet):
     queryset = Partner.objects.all().order_by("display_order", "id")
     serializer_class = PartnerSerializer
-    search_fields = ["name", "link"]
+    search_fields = Partner.search_fields
     ordering_fields = ["display_order", "name", "link", "created_at", "updated_at", "is_active"]
     ordering = ["display_order", "id"]
 
@@ -321,10 +564,10 @@ class PartnerAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
         return queryset
 
 
-class TestimonialAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
+class TestimonialAdminViewSet(ContentImportActionMixin, JWTAdminMixin, viewsets.ModelViewSet):
     queryset = Testimonial.objects.all().order_by("display_order", "id")
     serializer_class = TestimonialSerializer
-    search_fields = ["name", "role", "quote"]
+    search_fields = Testimonial.search_fields
     ordering_fields = ["display_order", "name", "role", "created_at", "updated_at", "is_active"]
     ordering = ["display_order", "id"]
 
@@ -340,12 +583,14 @@ class TestimonialAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
         return queryset
 
 
-class ContactMessageAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
+class ContactMessageAdminViewSet(MailCampaignActionMixin, JWTAdminMixin, viewsets.ModelViewSet):
     queryset = ContactMessage.objects.all().order_by("-created_at")
     serializer_class = ContactMessageAdminSerializer
-    search_fields = ["name", "email", "message"]
+    search_fields = ContactMessage.search_fields
     ordering_fields = ["created_at", "updated_at", "name", "email", "is_resolved"]
     ordering = ["-created_at"]
+    mail_campaign_fields = ("name", "email")
+    pagination_mode = "estimate"
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -358,19 +603,17 @@ class ContactMessageAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
             queryset = queryset.filter(is_resolved=is_resolved)
         if email:
             queryset = queryset.filter(email__icontains=email)
-        if created_from:
-            queryset = queryset.filter(created_at__date__gte=created_from)
-        if created_to:
-            queryset = queryset.filter(created_at__date__lte=created_to)
+        queryset = filter_created_range(queryset, created_from, created_to)
         return queryset
 
 
-class PartnerAppointmentAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
+class PartnerAppointmentAdminViewSet(MailCampaignActionMixin, JWTAdminMixin, viewsets.ModelViewSet):
     queryset = PartnerAppointment.objects.all().order_by("-created_at")
     serializer_class = PartnerAppointmentAdminSerializer
-    search_fields = ["organization_name", "contact_name", "email", "phone", "topic", "message", "admin_response"]
+    search_fields = PartnerAppointment.search_fields
     ordering_fields = ["created_at", "updated_at", "preferred_date", "status", "organization_name", "contact_name"]
     ordering = ["-created_at"]
+    mail_campaign_fields = ("contact_name", "organization_name", "email", "topic", "preferred_date", "status")
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -387,10 +630,7 @@ class PartnerAppointmentAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
             queryset = queryset.filter(status=status_value)
         if email:
             queryset = queryset.filter(email__icontains=email)
-        if created_from:
-            queryset = queryset.filter(created_at__date__gte=created_from)
-        if created_to:
-            queryset = queryset.filter(created_at__date__lte=created_to)
+        queryset = filter_created_range(queryset, created_from, created_to)
         return queryset
 
     @action(detail=True, methods=["post"])
@@ -401,18 +641,12 @@ class PartnerAppointmentAdminViewSet(JWTAdminMixin, viewsets.ModelViewSet):
             return Response({"detail": "Response text is required."}, status=status.HTTP_400_BAD_REQUEST)
 
         subject = f"Response to your partnership appointment: {appointment.organization_name}"
-        send_mail(
-            subject,
-            response_text,
-            getattr(settings, "DEFAULT_FROM_EMAIL", ""),
-            [appointment.email],
-            fail_silently=True,
-        )
-
-        appointment.admin_response = response_text
-        appointment.status = PartnerAppointment.STATUS_RESPONDED
-        appointment.response_sent_at = timezone.now()
-        appointment.save(update_fields=["admin_response", "status", "response_sent_at", "updated_at"])
+        with transaction.atomic():
+            appointment.admin_response = response_text
+            appointment.status = PartnerAppointment.STATUS_RESPONDED
+            appointment.response_sent_at = timezone.now()
+            appointment.save(update_fields=["admin_response", "status", "response_sent_at", "updated_at"])
+            OutboxEmail.enqueue(subject, response_text, [appointment.email])
 
         return Response(self.get_serializer(appointment).data)
 
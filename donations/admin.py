@@ -3,7 +3,8 @@ from django.urls import reverse
 from django.utils.html import format_html
 
 from educate_us_rise_us.admin_mixins import RichTextAdminMixin
-from .models import Donation
+from search.mixins import FullTextAdminSearchMixin
+from .models import Campaign, CampaignCounterShard, Donation
 
 
 class AdminActionLinksMixin:
@@ -21,7 +22,7 @@ class AdminActionLinksMixin:
 
 
 @admin.register(Donation)
-class DonationAdmin(AdminActionLinksMixin, RichTextAdminMixin, admin.ModelAdmin):
+class DonationAdmin(FullTextAdminSearchMixin, AdminActionLinksMixin, RichTextAdminMixin, admin.ModelAdmin):
     rich_text_fields = ("message", "failed_reason")
     list_display = [
         "id",
@@ -31,8 +32,38 @@ class DonationAdmin(AdminActionLinksMixin, RichTextAdminMixin, admin.ModelAdmin)
         "payment_method",
         "provider",
         "status",
+        "campaign",
         "created_at",
         "action_links",
     ]
-    list_filter = ["payment_method", "provider", "status", "currency"]
+    list_filter = ["payment_method", "provider", "status", "currency", "campaign"]
     search_fields = ["donor_name", "email"]
+
+    def get_readonly_fields(self, request, obj=None):
+        # Status changes go through Donation.mark_* so the campaign counter
+        # shards stay in step; moving a donation between campaigns would
+        # bypass them too.
+        readonly = [*super().get_readonly_fields(request, obj), "status"]
+        if obj is not None:
+            readonly.append("campaign")
+        return readonly
+
+
+class CampaignCounterShardInline(admin.TabularInline):
+    model = CampaignCounterShard
+    extra = 0
+    can_delete = False
+    readonly_fields = ["shard", "amount", "donation_count"]
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Campaign)
+class CampaignAdmin(AdminActionLinksMixin, RichTextAdminMixin, admin.ModelAdmin):
+    rich_text_fields = ("description",)
+    list_display = ["id", "title", "slug", "goal_amount", "currency", "starts_at", "ends_at", "is_active", "action_links"]
+    list_filter = ["is_active", "currency"]
+    search_fields = ["title", "slug"]
+    prepopulated_fields = {"slug": ("title",)}
+    inlines = [CampaignCounterShardInline]
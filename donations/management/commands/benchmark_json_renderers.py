@@ -0,0 +1,67 @@
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from applications.fastpath import serialize_queryset
+from applications.serializers import ProgramSerializer
+from donations.models import Donation
+from donations.serializers import DonationSerializer
+from educate_us_rise_us.benchmarking import best_of, peak_memory, rolled_back, seed_programs
+from educate_us_rise_us.renderers import FastJSONRenderer, orjson
+
+
+class Command(BaseCommand):
+    help = "Compare DRF's JSONRenderer with FastJSONRenderer on donation and content payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+        parser.add_argument("--repeat", type=int, default=5, help="Best-of-N timing per renderer.")
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"FastJSONRenderer encoder: {'orjson ' + orjson.__version__ if orjson else 'stdlib json'}")
+        self.stdout.write(
+            f"{'payload':<12} {'rows':>7} {'drf (ms)':>9} {'fast (ms)':>10} {'speedup':>8} "
+            f"{'peak full (KB)':>15} {'peak stream (KB)':>17}"
+        )
+        request = Request(RequestFactory().get("/api/"))
+        for count in options["rows"]:
+            with rolled_back():
+                self._seed_donations(count)
+                programs = seed_programs(count, with_images=False)
+                payloads = {
+                    "donations": DonationSerializer(
+                        Donation.objects.filter(donor_name__startswith="bench-").order_by("-created_at"), many=True
+                    ).data,
+                    "programs": serialize_queryset(ProgramSerializer, programs, {"request": request}),
+                }
+                for name, data in payloads.items():
+                    self._report(name, count, list(data), options["repeat"])
+
+    def _report(self, name, count, data, repeat):
+        drf = best_of(lambda: JSONRenderer().render(data), repeat)
+        fast = best_of(lambda: FastJSONRenderer().render(data), repeat)
+        full_peak = peak_memory(lambda: FastJSONRenderer().render(data))
+        stream_peak = peak_memory(lambda: sum(len(chunk) for chunk in FastJSONRenderer().iter_render(iter(data))))
+        self.stdout.write(
+            f"{name:<12} {count:>7} {drf * 1000:>9.1f} {fast * 1000:>10.1f} {drf / fast:>7.1f}x "
+            f"{full_peak / 1024:>15.0f} {stream_peak / 1024:>17.0f}"
+        )
+
+    def _seed_donations(self, count):
+        Donation.objects.bulk_create(
+            [
+                Donation(
+                    donor_name=f"bench-{index}",
+                    email=f"donor{index}@example.com",
+                    amount=Decimal("25.00") + index,
+                    currency="USD",
+                    payment_method="card",
+                    message="Keep up the great work!",
+                )
+                for index in range(count)
+            ],
+            batch_size=500,
+        )
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from donations.models import CampaignCounterShard
+
+
+class Command(BaseCommand):
+    help = "Rebuild campaign counter shards from completed donations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("campaign_ids", nargs="*", type=int, help="Limit to these campaign ids.")
+
+    def handle(self, *args, **options):
+        corrected = CampaignCounterShard.reconcile(options["campaign_ids"] or None)
+        if corrected:
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt counter shards for {corrected} campaign(s)."))
+        else:
+            self.stdout.write(self.style.SUCCESS("All campaign totals are accurate."))
@@ -1,7 +1,121 @@
-from django.db import models
+import random
+
+from django.db import models, transaction
+from django.db.models import Count, F, Sum
 from django.conf import settings
 from django.utils import timezone
 
+from educate_us_rise_us.richtext import EXCERPT_LENGTH, RichTextMixin
+from search.querysets import SearchIndexedQuerySet
+
+
+class Campaign(RichTextMixin, models.Model):
+    title = models.CharField(max_length=200)
+    slug = models.SlugField(max_length=120, unique=True)
+    description = models.TextField(blank=True)
+    description_html = models.TextField(blank=True, editable=False)
+    description_excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False)
+    description_word_count = models.PositiveIntegerField(default=0, editable=False)
+    goal_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    currency = models.CharField(max_length=10, default='KES')
+    starts_at = models.DateTimeField(null=True, blank=True)
+    ends_at = models.DateTimeField(null=True, blank=True)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    rich_text_fields = ("description",)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return self.title
+
+    def save(self, *args, **kwargs):
+        creating = self._state.adding
+        super().save(*args, **kwargs)
+        if creating:
+            CampaignCounterShard.ensure_shards(self.pk)
+
+    def is_open(self, at=None):
+        at = at or timezone.now()
+        if not self.is_active:
+            return False
+        if self.starts_at and at < self.starts_at:
+            return False
+        if self.ends_at and at >= self.ends_at:
+            return False
+        return True
+
+
+class CampaignCounterShard(models.Model):
+    """One of N rows holding a slice of a campaign's running total.
+
+    Completed donations increment a random shard so concurrent completions do
+    not queue on a single row lock; readers sum the shards. Leaving
+    ``completed`` decrements a random shard too, so a single shard can go
+    negative; only the sum is meaningful.
+    """
+
+    campaign = models.ForeignKey(Campaign, on_delete=models.CASCADE, related_name='counter_shards')
+    shard = models.PositiveSmallIntegerField()
+    amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    donation_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['campaign', 'shard'], name='unique_campaign_counter_shard'),
+        ]
+
+    def __str__(self):
+        return f"{self.campaign_id}#{self.shard}"
+
+    @staticmethod
+    def shard_count():
+        return max(1, int(getattr(settings, 'CAMPAIGN_COUNTER_SHARDS', 16) or 1))
+
+    @classmethod
+    def ensure_shards(cls, campaign_id):
+        cls.objects.bulk_create(
+            [cls(campaign_id=campaign_id, shard=index) for index in range(cls.shard_count())],
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def increment(cls, campaign_id, amount, count=1):
+        shard = random.randrange(cls.shard_count())
+        values = {'amount': F('amount') + amount, 'donation_count': F('donation_count') + count}
+        updated = cls.objects.filter(campaign_id=campaign_id, shard=shard).update(**values)
+        if not updated:
+            cls.ensure_shards(campaign_id)
+            cls.objects.filter(campaign_id=campaign_id, shard=shard).update(**values)
+
+    @classmethod
+    def reconcile(cls, campaign_ids=None):
+        """Rebuild shards from completed donations; returns the campaigns corrected."""
+        if campaign_ids is None:
+            campaign_ids = Campaign.objects.values_list('pk', flat=True)
+        corrected = 0
+        for campaign_id in list(campaign_ids):
+            cls.ensure_shards(campaign_id)
+            with transaction.atomic():
+                # Lock the shards before counting: a completion that commits
+                # after the count is still waiting to increment them.
+                shards = list(cls.objects.select_for_update().filter(campaign_id=campaign_id).order_by('shard'))
+                actual = Donation.objects.filter(campaign_id=campaign_id, status='completed').aggregate(
+                    amount=Sum('amount'), count=Count('id')
+                )
+                amount, count = actual['amount'] or 0, actual['count']
+                current = (sum(shard.amount for shard in shards), sum(shard.donation_count for shard in shards))
+                if not shards or current == (amount, count):
+                    continue
+                cls.objects.filter(campaign_id=campaign_id).update(amount=0, donation_count=0)
+                cls.objects.filter(pk=shards[0].pk).update(amount=amount, donation_count=count)
+                corrected += 1
+        return corrected
+
+
 class Donation(models.Model):
     PAYMENT_METHODS = (
         ('mpesa', 'MPESA'),
@@ -16,6 +130,7 @@ class Donation(models.Model):
     )
 
     user = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL)
+    campaign = models.ForeignKey(Campaign, null=True, blank=True, on_delete=models.SET_NULL, related_name='donations')
     donor_name = models.CharField(max_length=120)
     email = models.EmailField()
     phone = models.CharField(max_length=30, blank=True)
@@ -32,6 +147,10 @@ class Donation(models.Model):
     failed_reason = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = SearchIndexedQuerySet.as_manager()
+
+    search_fields = ("donor_name", "email")
+
     def __str__(self):
         return f"{self.donor_name} - {self.amount} {self.currency}"
 
@@ -39,11 +158,35 @@ class Donation(models.Model):
         self.status = "completed"
         if not self.completed_at:
             self.completed_at = timezone.now()
-        self.save(update_fields=["status", "completed_at"])
+        with transaction.atomic():
+            # Only the request that actually flips the row counts towards the
+            # campaign, so repeated webhooks cannot inflate the total.
+            transitioned = (
+                Donation.objects.filter(pk=self.pk)
+                .exclude(status="completed")
+                .update(status="completed", completed_at=self.completed_at)
+            )
+            if not transitioned:
+                self.save(update_fields=["status", "completed_at"])
+            elif self.campaign_id:
+                CampaignCounterShard.increment(self.campaign_id, self.amount)
 
     def mark_failed(self, reason=""):
         self.status = "failed"
         self.failed_reason = reason[:1000]
-        self.save(update_fields=["status", "failed_reason"])
+        self._leave_completed(["status", "failed_reason"])
+
+    def mark_pending(self, update_fields=()):
+        self.status = "pending"
+        self._leave_completed(["status", *update_fields])
+
+    def _leave_completed(self, update_fields):
+        with transaction.atomic():
+            # The mirror of mark_completed: only the request that flips a
+            # completed row takes it back off the campaign total.
+            left = Donation.objects.filter(pk=self.pk, status="completed").update(status=self.status)
+            self.save(update_fields=update_fields)
+            if left and self.campaign_id:
+                CampaignCounterShard.increment(self.campaign_id, -self.amount, count=-1)
 
 # Create your models here.
@@ -2,7 +2,26 @@
 
 from rest_framework import serializers
 
-from .models import Donation
+from .models import Campaign, Donation
+
+
+class CampaignSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Campaign
+        fields = [
+            "id",
+            "title",
+            "slug",
+            "description",
+            "description_html",
+            "description_excerpt",
+            "description_word_count",
+            "goal_amount",
+            "currency",
+            "starts_at",
+            "ends_at",
+            "is_active",
+        ]
 
 
 class DonationSerializer(serializers.ModelSerializer):
@@ -23,6 +42,7 @@ class DonationSerializer(serializers.ModelSerializer):
             "payment_method",
             "anonymous",
             "message",
+            "campaign",
             "status",
             "provider",
             "external_reference",
@@ -50,6 +70,7 @@ class DonationSerializer(serializers.ModelSerializer):
             "phone": {"required": False},
             "anonymous": {"required": False},
             "message": {"required": False},
+            "campaign": {"required": False},
         }
 
     def validate_amount(self, value):
@@ -64,7 +85,18 @@ class DonationSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Currency must be one of USD, KES, EUR, GBP.")
         return next_value
 
+    def validate_campaign(self, value):
+        if value is not None and not value.is_open():
+            raise serializers.ValidationError("This campaign is not accepting donations.")
+        return value
+
     def validate(self, attrs):
+        campaign = attrs.get("campaign")
+        if campaign:
+            attrs.setdefault("currency", campaign.currency.upper())
+            if attrs["currency"] != campaign.currency.upper():
+                raise serializers.ValidationError({"currency": f"Campaign donations must be in {campaign.currency}."})
+
         first_name = attrs.pop("firstName", "").strip()
         last_name = attrs.pop("lastName", "").strip()
         payment_method_input = attrs.pop("paymentMethod", "").strip().lower()
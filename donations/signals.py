@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete
+
+from search.index import register_search_model
+
+from .models import CampaignCounterShard, Donation
+
+register_search_model(Donation)
+
+
+def _subtract_deleted_donation(sender, instance, **kwargs):
+    if instance.status == "completed" and instance.campaign_id:
+        CampaignCounterShard.increment(instance.campaign_id, -instance.amount, count=-1)
+
+
+post_delete.connect(_subtract_deleted_donation, sender=Donation, dispatch_uid="donation-subtract-deleted")
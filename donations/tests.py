@@ -1,3 +1,94 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from django.contrib.admin.sites import site
+from django.core.cache import cache
+from django.db.models import Sum
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import User
+
+from .models import Campaign, CampaignCounterShard, Donation
+
+
+@override_settings(
+    CAMPAIGN_COUNTER_SHARDS=4,
+    PAYMENT_REQUIRE_WEBHOOK_SIGNATURES=False,
+    PAYMENT_STRIPE_WEBHOOK_SECRET="",
+    PAYMENT_STATUS_UPDATE_TOKEN="",
+)
+class CampaignCounterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.campaign = Campaign.objects.create(title="School fees", slug="school-fees", goal_amount=1000)
+        self.client = APIClient()
+
+    def donate(self, amount, status="pending"):
+        return Donation.objects.create(
+            campaign=self.campaign, donor_name="Amina", email="amina@example.org", amount=amount, status=status
+        )
+
+    def webhook(self, donation, status):
+        return self.client.post("/api/webhooks/stripe/", {"donation_id": donation.pk, "status": status}, format="json")
+
+    def totals(self):
+        totals = CampaignCounterShard.objects.filter(campaign=self.campaign).aggregate(
+            amount=Sum("amount"), count=Sum("donation_count")
+        )
+        return totals["amount"], totals["count"]
+
+    def test_shards_are_created_with_the_campaign(self):
+        self.assertEqual(CampaignCounterShard.objects.filter(campaign=self.campaign).count(), 4)
+        self.assertEqual(self.totals(), (Decimal("0"), 0))
+
+    def test_repeated_completion_webhooks_count_once(self):
+        donation = self.donate("150.00")
+        for _ in range(3):
+            self.assertEqual(self.webhook(donation, "completed").status_code, 200)
+        self.assertEqual(self.totals(), (Decimal("150.00"), 1))
+
+    def test_shards_sum_to_the_campaign_progress(self):
+        for amount in ("100.00", "250.50", "49.50"):
+            self.donate(amount).mark_completed()
+        self.assertEqual(self.totals(), (Decimal("400.00"), 3))
+        progress = self.client.get(f"/api/campaigns/{self.campaign.slug}/progress/").json()
+        self.assertEqual((progress["raised_amount"], progress["donation_count"]), ("400.00", 3))
+        self.assertEqual(progress["percent"], 40.0)
+
+    def test_leaving_completed_subtracts_once(self):
+        refunded = self.donate("100.00")
+        reopened = self.donate("60.00")
+        kept = self.donate("40.00")
+        for donation in (refunded, reopened, kept):
+            donation.mark_completed()
+
+        self.assertEqual(self.webhook(refunded, "failed").status_code, 200)
+        self.assertEqual(self.webhook(refunded, "failed").status_code, 200)
+        response = self.client.post(f"/api/donations/{reopened.pk}/update-status/", {"status": "pending"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.totals(), (Decimal("40.00"), 1))
+
+        refunded.refresh_from_db()
+        refunded.mark_completed()
+        self.assertEqual(self.totals(), (Decimal("140.00"), 2))
+
+    def test_deleting_a_completed_donation_subtracts_it(self):
+        self.donate("75.00").mark_completed()
+        self.donate("25.00").mark_completed()
+        Donation.objects.filter(amount="75.00").delete()
+        self.assertEqual(self.totals(), (Decimal("25.00"), 1))
+
+    def test_reconcile_rebuilds_drifted_shards(self):
+        self.donate("80.00").mark_completed()
+        self.donate("20.00", status="completed")  # written without going through mark_completed
+        self.assertEqual(CampaignCounterShard.reconcile(), 1)
+        self.assertEqual(self.totals(), (Decimal("100.00"), 2))
+        self.assertEqual(CampaignCounterShard.reconcile(), 0)
+
+    def test_admin_cannot_edit_status_or_move_campaigns(self):
+        request = RequestFactory().get("/")
+        request.user = User.objects.create_superuser(email="admin@example.org")
+        admin = site._registry[Donation]
+        self.assertIn("status", admin.get_readonly_fields(request))
+        self.assertNotIn("campaign", admin.get_readonly_fields(request))
+        self.assertIn("campaign", admin.get_readonly_fields(request, self.donate("10.00")))
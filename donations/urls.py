@@ -1,11 +1,12 @@
 ﻿from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from .views import DonationStatusStreamView, DonationViewSet, MpesaWebhookView, PayPalWebhookView, StripeWebhookView
+from .views import CampaignViewSet, DonationStatusStreamView, DonationViewSet, MpesaWebhookView, PayPalWebhookView, StripeWebhookView
 
 router = DefaultRouter()
 router.include_format_suffixes = False
 router.register(r"donations", DonationViewSet, basename="donations")
+router.register(r"campaigns", CampaignViewSet, basename="campaigns")
 
 payment_section = DonationViewSet.as_view({"get": "payment_section"})
 payment_stats = DonationViewSet.as_view({"get": "payment_stats"})
@@ -5,10 +5,12 @@ import json
 import time
 import uuid
 from datetime import datetime
+from decimal import Decimal
 from urllib import error as urllib_error
 from urllib import request as urllib_request
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Count, Sum
 from django.http import StreamingHttpResponse
 from rest_framework import status, viewsets
@@ -17,8 +19,10 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Donation
-from .serializers import DonationSerializer
+from educate_us_rise_us.renderers import StreamingListMixin
+
+from .models import Campaign, CampaignCounterShard, Donation
+from .serializers import CampaignSerializer, DonationSerializer
 
 
 def normalize_status(value):
@@ -43,6 +47,67 @@ def donation_payload(donation):
     }
 
 
+def payment_section_payload():
+    return {
+        "title": "Secure and flexible payment options",
+        "copy": "Choose your preferred payment method. Donations are first recorded as pending for verification.",
+        "supported_currencies": ["USD", "KES", "EUR", "GBP"],
+        "methods": [
+            {"id": "visa", "label": "Visa", "backend_value": "card", "requires_token": True, "enabled": True},
+            {"id": "paypal", "label": "PayPal", "backend_value": "paypal", "requires_token": True, "enabled": True},
+            {"id": "mpesa", "label": "M-Pesa", "backend_value": "mpesa", "requires_token": True, "enabled": True},
+            {"id": "bank", "label": "Bank", "backend_value": "bank", "requires_token": True, "enabled": True},
+        ],
+        "submit_endpoint": "/api/donations/",
+        "initiate_endpoint": "/api/donations/initiate-payment/",
+        "realtime": {
+            "transport": "SSE",
+            "stream_endpoint_template": "/api/donations/{id}/status-stream/",
+            "status_endpoint_template": "/api/donations/{id}/payment-status/",
+        },
+        "webhook_security": {
+            "stripe_header": "Stripe-Signature",
+            "paypal_headers": ["Paypal-Transmission-Sig", "X-Paypal-Signature"],
+            "mpesa_headers": ["X-Mpesa-Signature", "X-Webhook-Signature"],
+        },
+        "mpesa": {
+            "test_phone": _mpesa_env()["test_phone"],
+            "uses_real_stk_push_when_credentials_present": True,
+            "check_endpoint": "/api/donations/mpesa-check/",
+        },
+    }
+
+
+def campaign_progress(campaign):
+    cache_key = f"campaign-progress:{campaign.pk}"
+    progress = cache.get(cache_key)
+    if progress is None:
+        totals = CampaignCounterShard.objects.filter(campaign_id=campaign.pk).aggregate(
+            raised=Sum("amount"),
+            donations=Sum("donation_count"),
+        )
+        progress = {
+            "raised_amount": str(Decimal(totals["raised"] or 0).quantize(Decimal("0.01"))),
+            "donation_count": totals["donations"] or 0,
+        }
+        ttl = int(getattr(settings, "CAMPAIGN_PROGRESS_CACHE_SECONDS", 5) or 5)
+        cache.set(cache_key, progress, ttl)
+
+    goal = campaign.goal_amount or 0
+    percent = 0.0
+    if goal > 0:
+        percent = min(100.0, round(float(progress["raised_amount"]) * 100 / float(goal), 2))
+    return {
+        "campaign_id": campaign.pk,
+        "slug": campaign.slug,
+        "goal_amount": str(goal),
+        "currency": campaign.currency,
+        "percent": percent,
+        "is_open": campaign.is_open(),
+        **progress,
+    }
+
+
 def _normalize_signature(value):
     raw = (value or "").strip()
     for prefix in ("sha256=", "v1="):
@@ -240,8 +305,7 @@ class BaseWebhookView(APIView):
             reason = (data.get("reason") or data.get("message") or "").strip()
             donation.mark_failed(reason=reason)
         else:
-            donation.status = "pending"
-            donation.save(update_fields=["status", "provider", "external_reference", "gateway_event_id"])
+            donation.mark_pending(update_fields=["provider", "external_reference", "gateway_event_id"])
 
         donation.refresh_from_db()
         return Response(
@@ -352,7 +416,7 @@ class DonationStatusStreamView(APIView):
         return response
 
 
-class DonationViewSet(viewsets.ModelViewSet):
+class DonationViewSet(StreamingListMixin, viewsets.ModelViewSet):
     queryset = Donation.objects.all().order_by("-created_at")
     serializer_class = DonationSerializer
     permission_classes = [AllowAny]
@@ -504,44 +568,14 @@ class DonationViewSet(viewsets.ModelViewSet):
         elif new_status == "failed":
             donation.mark_failed(reason)
         else:
-            donation.status = "pending"
-            donation.save(update_fields=["status", "provider", "external_reference", "gateway_event_id"])
+            donation.mark_pending(update_fields=["provider", "external_reference", "gateway_event_id"])
 
         donation.refresh_from_db()
         return Response({"detail": "Payment status updated.", **donation_payload(donation)})
 
     @action(detail=False, methods=["get"], url_path="payment-section")
     def payment_section(self, request):
-        return Response(
-            {
-                "title": "Secure and flexible payment options",
-                "copy": "Choose your preferred payment method. Donations are first recorded as pending for verification.",
-                "supported_currencies": ["USD", "KES", "EUR", "GBP"],
-                "methods": [
-                    {"id": "visa", "label": "Visa", "backend_value": "card", "requires_token": True, "enabled": True},
-                    {"id": "paypal", "label": "PayPal", "backend_value": "paypal", "requires_token": True, "enabled": True},
-                    {"id": "mpesa", "label": "M-Pesa", "backend_value": "mpesa", "requires_token": True, "enabled": True},
-                    {"id": "bank", "label": "Bank", "backend_value": "bank", "requires_token": True, "enabled": True},
-                ],
-                "submit_endpoint": "/api/donations/",
-                "initiate_endpoint": "/api/donations/initiate-payment/",
-                "realtime": {
-                    "transport": "SSE",
-                    "stream_endpoint_template": "/api/donations/{id}/status-stream/",
-                    "status_endpoint_template": "/api/donations/{id}/payment-status/",
-                },
-                "webhook_security": {
-                    "stripe_header": "Stripe-Signature",
-                    "paypal_headers": ["Paypal-Transmission-Sig", "X-Paypal-Signature"],
-                    "mpesa_headers": ["X-Mpesa-Signature", "X-Webhook-Signature"],
-                },
-                "mpesa": {
-                    "test_phone": _mpesa_env()["test_phone"],
-                    "uses_real_stk_push_when_credentials_present": True,
-                    "check_endpoint": "/api/donations/mpesa-check/",
-                },
-            }
-        )
+        return Response(payment_section_payload())
 
     @action(detail=False, methods=["get"], url_path="payment-stats")
     def payment_stats(self, request):
@@ -565,3 +599,18 @@ class DonationViewSet(viewsets.ModelViewSet):
         total_amount = Donation.objects.filter(status="completed").aggregate(Sum("amount"))["amount__sum"] or 0
         total_donations = Donation.objects.filter(status="completed").count()
         return Response({"total_amount": total_amount, "total_donations": total_donations})
+
+
+class CampaignViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = Campaign.objects.filter(is_active=True).order_by("-created_at")
+    serializer_class = CampaignSerializer
+    permission_classes = [AllowAny]
+    lookup_field = "slug"
+
+    @action(detail=True, methods=["get"])
+    def progress(self, request, slug=None):
+        campaign = self.get_object()
+        response = Response(campaign_progress(campaign))
+        ttl = int(getattr(settings, "CAMPAIGN_PROGRESS_CACHE_SECONDS", 5) or 5)
+        response["Cache-Control"] = f"public, max-age={ttl}"
+        return response
@@ -0,0 +1,74 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from django.db import transaction
+
+
+class _Rollback(Exception):
+    pass
+
+
+@contextmanager
+def rolled_back():
+    """Run the block in a transaction that is always rolled back.
+
+    Benchmark commands seed throwaway rows inside it, so nothing they
+    create outlives the run.
+    """
+    try:
+        with transaction.atomic():
+            yield
+            raise _Rollback
+    except _Rollback:
+        pass
+
+
+def best_of(func, repeat):
+    """Fastest of ``repeat`` runs of ``func``, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def peak_memory(func):
+    """Peak bytes allocated while ``func`` runs."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def seed_programs(count, with_images=True):
+    """Bulk-create ``count`` ``Program`` rows titled ``bench-<n>``."""
+    from applications.models import Program
+
+    variants = {
+        "source": "programs/bench.jpg",
+        "files": {
+            "webp": {"320": "programs/bench__320w.webp", "640": "programs/bench__640w.webp"},
+            "jpeg": {"320": "programs/bench__320w.jpg", "640": "programs/bench__640w.jpg"},
+        },
+    }
+    Program.objects.bulk_create(
+        [
+            Program(
+                title=f"bench-{index}",
+                focus="Education",
+                description="Benchmark row " * 20,
+                highlights=["one", "two", "three"],
+                photo="programs/bench.jpg" if with_images and index % 2 else None,
+                image="" if with_images and index % 2 else "https://example.com/image.jpg",
+                image_variants=variants if with_images and index % 2 else {},
+                display_order=index,
+            )
+            for index in range(count)
+        ],
+        batch_size=500,
+    )
+    return Program.objects.filter(title__startswith="bench-").order_by("display_order", "id")
@@ -0,0 +1,270 @@
+import hashlib
+import json
+import logging
+import time
+from urllib import request as urllib_request
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal
+from django.http import HttpResponse
+from django.utils import timezone
+
+from search.querysets import SearchIndexedQuerySet
+
+from .renderers import default_json_renderer
+
+logger = logging.getLogger(__name__)
+
+# Sent with ``sender=<model>`` after a tracked model's content version changes.
+content_changed = Signal()
+
+_tracked_models = set()
+_purged_models = set()
+
+
+def _version_key(model):
+    return f"content-version:{model._meta.label_lower}"
+
+
+def _fresh_version():
+    # Seeded from the clock so an evicted counter never reuses a number that
+    # older cached responses may still be stored under.
+    return int(time.time() * 1000)
+
+
+def _current(key):
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _fresh_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _incr(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _fresh_version(), timeout=None)
+
+
+def get_content_version(model):
+    return _current(_version_key(model))
+
+
+def bump_content_version(model):
+    """Move ``model`` to a new content version once the current transaction commits.
+
+    Bumping before commit would let a concurrent request rebuild a cache
+    entry from the old rows and store it under the new version.
+    """
+    key = _version_key(model)
+
+    def bump():
+        _incr(key)
+        content_changed.send(sender=model)
+
+    transaction.on_commit(bump)
+
+
+def get_counter_version(name):
+    """Version of the denormalized counters called ``name`` (e.g. ``"posts"``).
+
+    Counter writes skip ``updated_at`` and the content version, so cached
+    lists and feeds survive them; views that show the counts put this in
+    their cache scope instead.
+    """
+    return _current(f"counter-version:{name}")
+
+
+def bump_counter_version(name):
+    """Move counter group ``name`` to a new version once the transaction commits."""
+    transaction.on_commit(lambda: _incr(f"counter-version:{name}"))
+
+
+PROCESS_LOCAL_CACHES = {
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+}
+
+
+@checks.register(checks.Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    """Content versions only invalidate other processes through a shared cache.
+
+    Gunicorn workers, the outbox worker and management commands
+    (``import_content``, ``backfill_rich_text`` ...) all bump versions, so a
+    per-process backend would leave the web workers serving stale responses.
+    """
+    backend = settings.CACHES["default"]["BACKEND"]
+    if settings.DEBUG or backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        checks.Error(
+            f"CACHES['default'] uses {backend}, which is not shared between processes.",
+            hint="Set CACHE_BACKEND/CACHE_LOCATION to a shared cache such as Redis.",
+            id="content_cache.E001",
+        )
+    ]
+
+
+def surrogate_key(model):
+    return model._meta.label_lower.replace(".", "-")
+
+
+def _on_tracked_write(sender, **kwargs):
+    bump_content_version(sender)
+
+
+def track_content_model(model, purge=True):
+    """Bump ``model``'s content version whenever one of its rows is saved or deleted.
+
+    Pass ``purge=False`` for models that never appear in public responses, so
+    writes to them do not send CDN purge requests.
+    """
+    if purge:
+        _purged_models.add(model)
+    if model in _tracked_models:
+        return
+    _tracked_models.add(model)
+    label = model._meta.label_lower
+    post_save.connect(_on_tracked_write, sender=model, dispatch_uid=f"content-version-save-{label}")
+    post_delete.connect(_on_tracked_write, sender=model, dispatch_uid=f"content-version-delete-{label}")
+
+
+def is_tracked(model):
+    return model in _tracked_models
+
+
+def purge_surrogate_keys(keys):
+    url = (getattr(settings, "CDN_PURGE_URL", "") or "").strip()
+    if not url or not keys:
+        return
+    headers = {"Content-Type": "application/json"}
+    token = (getattr(settings, "CDN_PURGE_TOKEN", "") or "").strip()
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    data = json.dumps({"surrogate_keys": sorted(keys)}).encode("utf-8")
+    req = urllib_request.Request(url, data=data, headers=headers, method="POST")
+    try:
+        with urllib_request.urlopen(req, timeout=5):
+            pass
+    except Exception as exc:
+        logger.warning("CDN purge for %s failed: %s", ", ".join(sorted(keys)), exc)
+
+
+def _purge_on_change(sender, **kwargs):
+    if sender in _purged_models:
+        purge_surrogate_keys({surrogate_key(sender)})
+
+
+content_changed.connect(_purge_on_change, dispatch_uid="content-cache-cdn-purge")
+
+
+class ContentQuerySet(SearchIndexedQuerySet):
+    """QuerySet whose bulk write paths invalidate cached public responses."""
+
+    def update(self, **kwargs):
+        # QuerySet.update() skips auto_now, but HTTP validators are derived
+        # from updated_at, so stamp it here unless the caller set it.
+        if "updated_at" not in kwargs and any(f.name == "updated_at" for f in self.model._meta.concrete_fields):
+            kwargs["updated_at"] = timezone.now()
+        rows = super().update(**kwargs)
+        if rows:
+            bump_content_version(self.model)
+        return rows
+
+    update.alters_data = True
+
+    def delete(self):
+        result = super().delete()
+        if result[0]:
+            bump_content_version(self.model)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def bulk_create(self, objs, *args, **kwargs):
+        created = super().bulk_create(objs, *args, **kwargs)
+        if created:
+            bump_content_version(self.model)
+        return created
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        rows = super().bulk_update(objs, fields, *args, **kwargs)
+        if rows:
+            bump_content_version(self.model)
+        return rows
+
+
+def get_or_build(key, build):
+    timeout = int(getattr(settings, "CONTENT_CACHE_TIMEOUT", 3600))
+    lock_timeout = int(getattr(settings, "CONTENT_CACHE_LOCK_SECONDS", 10))
+    lock_key = f"{key}:lock"
+
+    if cache.add(lock_key, 1, lock_timeout):
+        try:
+            body = build()
+            cache.set(key, body, timeout)
+        finally:
+            cache.delete(lock_key)
+        return body
+
+    # Another worker is already rebuilding this key; wait for its result
+    # instead of piling more identical queries onto the database.
+    deadline = time.monotonic() + lock_timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        body = cache.get(key)
+        if body is not None:
+            return body
+    return build()
+
+
+def content_versions(model_list):
+    return ".".join(str(get_content_version(model)) for model in model_list)
+
+
+def url_digest(request, include_path=True):
+    # Serializers build absolute media URLs, so the host is part of the key.
+    url = f"{request.scheme}://{request.get_host()}"
+    if include_path:
+        url += request.get_full_path()
+    return hashlib.md5(url.encode("utf-8")).hexdigest()
+
+
+def cached_json_response(request, model_list, build_payload, prefix):
+    key = f"content-response:{prefix}:{content_versions(model_list)}:{url_digest(request)}"
+
+    body = cache.get(key)
+    if body is None:
+        body = get_or_build(key, lambda: default_json_renderer().render(build_payload()))
+    return HttpResponse(body, content_type="application/json")
+
+
+class VersionedCacheListMixin:
+    """Serve list responses as pre-rendered JSON keyed on model versions."""
+
+    cache_models = None
+
+    def get_cache_models(self):
+        return self.cache_models or [self.get_queryset().model]
+
+    def get_cache_scope(self):
+        """Extra key part for responses that change without a write (e.g. "upcoming")."""
+        return ""
+
+    def list(self, request, *args, **kwargs):
+        parent_list = super().list
+        if getattr(request, "accepted_renderer", None) is None or request.accepted_renderer.format != "json":
+            return parent_list(request, *args, **kwargs)
+        return cached_json_response(
+            request,
+            self.get_cache_models(),
+            lambda: parent_list(request, *args, **kwargs).data,
+            prefix=f"{self.__class__.__name__}:{self.get_cache_scope()}",
+        )
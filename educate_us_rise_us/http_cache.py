@@ -0,0 +1,94 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from .content_cache import content_versions, is_tracked, surrogate_key, url_digest
+
+
+def apply_public_cache_headers(response, model_list, cache_control=None):
+    options = cache_control if cache_control is not None else getattr(settings, "PUBLIC_CACHE_CONTROL", {})
+    if options:
+        patch_cache_control(response, **options)
+    response["Surrogate-Key"] = " ".join(surrogate_key(model) for model in model_list)
+    return response
+
+
+def queryset_validators(request, queryset, field="updated_at", scope=""):
+    """Return ``(etag, last_modified_timestamp)`` from one aggregate query.
+
+    ``scope`` distinguishes results that change without a write, e.g. lists
+    filtered relative to today.
+    """
+
+    def compute():
+        values = queryset.aggregate(last_modified=Max(field), count=Count("pk"))
+        last_modified = values["last_modified"]
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        stamp = last_modified.isoformat() if last_modified else ""
+        seed = f"{queryset.model._meta.label_lower}:{values['count']}:{stamp}:{scope}:{request.get_full_path()}"
+        return f'"{hashlib.md5(seed.encode("utf-8")).hexdigest()}"', timestamp
+
+    if not is_tracked(queryset.model):
+        return compute()
+
+    # Tracked models bump their content version on every write, so the
+    # aggregate only has to run once per version.
+    label = queryset.model._meta.label_lower
+    key = f"content-validators:{label}:{content_versions([queryset.model])}:{scope}:{url_digest(request)}"
+    validators = cache.get(key)
+    if validators is None:
+        validators = compute()
+        cache.set(key, validators, int(getattr(settings, "CONTENT_CACHE_TIMEOUT", 3600)))
+    return validators
+
+
+class ConditionalGetMixin:
+    """Answer conditional GETs with 304 before any serialization happens.
+
+    Validators come from ``max(updated_at)`` plus the row count of the
+    filtered queryset; responses carry ``ETag``, ``Cache-Control``
+    (``PUBLIC_CACHE_CONTROL`` unless ``cache_control`` is set on the view)
+    and a ``Surrogate-Key`` naming the model.
+
+    ``Last-Modified`` is only sent for single objects. For a list,
+    ``max(updated_at)`` does not advance when a row is deleted, deactivated
+    or drops out of a date window, so ``If-Modified-Since`` alone would get
+    a 304 for a changed list.
+    """
+
+    cache_control = None
+    validator_field = "updated_at"
+
+    def get_cache_scope(self):
+        return ""
+
+    def conditional_response(self, request, queryset, respond, single_object=False):
+        etag, last_modified = queryset_validators(request, queryset, self.validator_field, self.get_cache_scope())
+        if not single_object:
+            last_modified = None
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = respond()
+            if response.status_code != 200:
+                return response
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        return apply_public_cache_headers(response, [queryset.model], self.cache_control)
+
+    def list(self, request, *args, **kwargs):
+        parent_list = super().list
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.conditional_response(request, queryset, lambda: parent_list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        parent_retrieve = super().retrieve
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+        return self.conditional_response(
+            request, queryset, lambda: parent_retrieve(request, *args, **kwargs), single_object=True
+        )
@@ -0,0 +1,315 @@
+import logging
+import os
+from concurrent.futures import as_completed
+from datetime import timedelta
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+FORMATS = {
+    "webp": ("WEBP", "webp"),
+    "jpeg": ("JPEG", "jpg"),
+}
+
+# model -> (image field name, variants field name)
+_registry = {}
+
+
+def variant_widths():
+    return sorted(int(width) for width in getattr(settings, "IMAGE_VARIANT_WIDTHS", [320, 640, 1280]))
+
+
+def variant_name(name, width, fmt):
+    """``programs/photo.jpg`` -> ``programs/photo__640w.webp``."""
+    stem, _ = os.path.splitext(name)
+    return f"{stem}__{width}w.{FORMATS[fmt][1]}"
+
+
+def _has_alpha(image):
+    return image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+
+
+def _flatten(image):
+    from PIL import Image
+
+    if _has_alpha(image):
+        rgba = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.split()[-1])
+        return background
+    return image.convert("RGB")
+
+
+def generate_variants(name, widths=None):
+    """Write resized WebP/JPEG copies of ``name`` next to it in storage.
+
+    Widths at or above the original's are skipped (no upscaling). Returns the
+    variants map stored on the model: ``{"source": name, "files": {fmt:
+    {width: name}}}``. Runs in pool workers, so it only touches storage.
+    """
+    from PIL import Image, ImageOps
+
+    widths = widths or variant_widths()
+    quality = int(getattr(settings, "IMAGE_VARIANT_QUALITY", 80))
+    files = {fmt: {} for fmt in FORMATS}
+
+    with default_storage.open(name, "rb") as source:
+        image = Image.open(source)
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    has_alpha = _has_alpha(image)
+    for width in widths:
+        if width >= image.width:
+            continue
+        height = max(1, round(image.height * width / image.width))
+        resized = image.resize((width, height), Image.Resampling.LANCZOS)
+        for fmt, (pil_format, _) in FORMATS.items():
+            if fmt == "jpeg":
+                output = _flatten(resized)
+                options = {"quality": quality, "optimize": True, "progressive": True}
+            else:
+                output = resized.convert("RGBA" if has_alpha else "RGB")
+                options = {"quality": quality, "method": 4}
+            buffer = BytesIO()
+            output.save(buffer, pil_format, **options)
+            target = variant_name(name, width, fmt)
+            if default_storage.exists(target):
+                default_storage.delete(target)
+            files[fmt][str(width)] = default_storage.save(target, ContentFile(buffer.getvalue()))
+
+    return {"source": name, "files": {fmt: sizes for fmt, sizes in files.items() if sizes}}
+
+
+def delete_variants(variants):
+    for sizes in (variants or {}).get("files", {}).values():
+        for stored in sizes.values():
+            try:
+                default_storage.delete(stored)
+            except Exception as exc:
+                logger.warning("Could not delete image variant %s: %s", stored, exc)
+
+
+def srcset_for_name(variants, name, url_for):
+    """Build the srcset map for image ``name`` using ``url_for(stored_name)``."""
+    if not name or not variants or variants.get("source") != name:
+        return {}
+    result = {}
+    for fmt, sizes in variants.get("files", {}).items():
+        entries = [
+            f"{url_for(stored)} {width}w"
+            for width, stored in sorted(sizes.items(), key=lambda item: int(item[0]))
+        ]
+        if entries:
+            result[fmt] = ", ".join(entries)
+    return result
+
+
+def srcset_map(variants, field_file, request=None):
+    """``{"webp": "<url> 320w, <url> 640w", "jpeg": ...}`` for a current variants map."""
+
+    def url_for(stored):
+        url = default_storage.url(stored)
+        return request.build_absolute_uri(url) if request is not None else url
+
+    return srcset_for_name(variants, field_file.name if field_file else "", url_for)
+
+
+def init_worker():
+    import django
+
+    django.setup()
+
+
+def store_variants(model, pk, variants):
+    """Save ``variants`` unless the image changed while they were being built."""
+    image_field, variants_field = _registry[model]
+    # The default manager is a ContentQuerySet, so cached responses pick up
+    # the new srcset immediately.
+    updated = model._default_manager.filter(pk=pk, **{image_field: variants["source"]}).update(
+        **{variants_field: variants}
+    )
+    if not updated:
+        delete_variants(variants)
+    return updated
+
+
+def pending_variants(models=None, force=False):
+    """Yield ``(model, pk, name)`` for every image whose variants are missing or stale."""
+    for model in models or list(_registry):
+        image_field, variants_field = _registry[model]
+        rows = model._base_manager.exclude(**{image_field: ""}).exclude(**{f"{image_field}__isnull": True})
+        for pk, name, variants in rows.values_list("pk", image_field, variants_field).iterator():
+            if force or (variants or {}).get("source") != name:
+                yield model, pk, name
+
+
+def build_in_pool(pool, jobs):
+    """Resize ``(model, pk, name)`` jobs in ``pool`` and store each result.
+
+    Yields ``(job, error)`` as jobs finish; ``error`` is ``None`` on success.
+    """
+    futures = {pool.submit(generate_variants, name): (model, pk, name) for model, pk, name in jobs}
+    for future in as_completed(futures):
+        model, pk, name = job = futures[future]
+        try:
+            store_variants(model, pk, future.result())
+        except Exception as exc:
+            yield job, exc
+        else:
+            yield job, None
+
+
+def _generate(model, pk, name):
+    try:
+        store_variants(model, pk, generate_variants(name))
+    except Exception as exc:
+        logger.warning("Image variants for %s #%s failed: %s", model._meta.label, pk, exc)
+
+
+def _max_attempts():
+    return int(getattr(settings, "IMAGE_VARIANT_MAX_ATTEMPTS", 3))
+
+
+def _retry_delay(attempts):
+    return timedelta(seconds=int(getattr(settings, "IMAGE_VARIANT_RETRY_SECONDS", 60)) * 2 ** max(attempts - 1, 0))
+
+
+def _lease_seconds():
+    return int(getattr(settings, "IMAGE_VARIANT_LEASE_SECONDS", 600))
+
+
+def enqueue_variants(model, pk, name):
+    from applications.models import ImageVariantJob
+
+    ImageVariantJob.objects.update_or_create(
+        model_label=model._meta.label_lower,
+        object_id=pk,
+        defaults={"name": name, "attempts": 0, "next_attempt_at": timezone.now(), "last_error": ""},
+    )
+
+
+def claim_variant_jobs(limit):
+    """Lease up to ``limit`` due jobs, like ``outbox.delivery.claim_due``.
+
+    A worker that dies mid-batch leaves its jobs to be picked up again once
+    ``IMAGE_VARIANT_LEASE_SECONDS`` have passed.
+    """
+    from applications.models import ImageVariantJob
+
+    with transaction.atomic():
+        jobs = list(
+            ImageVariantJob.objects.select_for_update(skip_locked=True)
+            .filter(next_attempt_at__lte=timezone.now())
+            .order_by("id")[:limit]
+        )
+        if jobs:
+            ImageVariantJob.objects.filter(pk__in=[job.pk for job in jobs]).update(
+                next_attempt_at=timezone.now() + timedelta(seconds=_lease_seconds())
+            )
+    return jobs
+
+
+def process_variant_jobs(pool, limit=50):
+    """Build variants for up to ``limit`` queued uploads; returns ``(generated, failed)``.
+
+    A failed job is retried with exponential backoff and dropped after
+    ``IMAGE_VARIANT_MAX_ATTEMPTS``, so a corrupt upload cannot wedge the queue.
+    """
+    from applications.models import ImageVariantJob
+
+    rows = {}
+    for job in claim_variant_jobs(limit):
+        try:
+            model = apps.get_model(job.model_label)
+        except (LookupError, ValueError):
+            model = None
+        if model not in _registry:
+            job.delete()
+            continue
+        rows[(model, job.object_id, job.name)] = job
+
+    generated = failed = 0
+    for key, error in build_in_pool(pool, rows):
+        job = rows[key]
+        # Filtering on the name leaves the job alone if the image was
+        # re-uploaded (and so re-queued) while this one was being built.
+        queued = ImageVariantJob.objects.filter(pk=job.pk, name=job.name)
+        if error is None:
+            queued.delete()
+            generated += 1
+            continue
+        failed += 1
+        attempts = job.attempts + 1
+        if attempts >= _max_attempts():
+            logger.error("Giving up on image variants for %s: %s", job, error)
+            queued.delete()
+        else:
+            logger.warning("Image variants for %s failed (attempt %s): %s", job, attempts, error)
+            queued.update(
+                attempts=attempts,
+                next_attempt_at=timezone.now() + _retry_delay(attempts),
+                last_error=str(error),
+            )
+    return generated, failed
+
+
+def schedule_variants(model, pk, name):
+    """Queue variants for a new upload.
+
+    With ``IMAGE_VARIANTS_ASYNC`` (the default) the web process only queues
+    the upload; ``process_image_variants`` resizes it, so request-serving
+    processes never run the CPU-heavy encoding. Otherwise they are built
+    inline, which suits local development.
+    """
+    if getattr(settings, "IMAGE_VARIANTS_ASYNC", True):
+        enqueue_variants(model, pk, name)
+        return
+    _generate(model, pk, name)
+
+
+def _variants_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    image_field, variants_field = _registry[sender]
+    field_file = getattr(instance, image_field)
+    variants = getattr(instance, variants_field) or {}
+    name = field_file.name if field_file else ""
+    if variants.get("source") == name:
+        return
+
+    if variants:
+        stale = variants
+        sender._default_manager.filter(pk=instance.pk).update(**{variants_field: {}})
+        setattr(instance, variants_field, {})
+        transaction.on_commit(lambda: delete_variants(stale))
+    if name:
+        pk = instance.pk
+        transaction.on_commit(lambda: schedule_variants(sender, pk, name))
+
+
+def _variants_on_delete(sender, instance, **kwargs):
+    _, variants_field = _registry[sender]
+    variants = getattr(instance, variants_field) or {}
+    if variants:
+        transaction.on_commit(lambda: delete_variants(variants))
+
+
+def register_image_field(model, image_field, variants_field="image_variants"):
+    """Generate responsive variants for ``model.<image_field>`` after each upload."""
+    _registry[model] = (image_field, variants_field)
+    label = model._meta.label_lower
+    post_save.connect(_variants_on_save, sender=model, dispatch_uid=f"image-variants-save-{label}")
+    post_delete.connect(_variants_on_delete, sender=model, dispatch_uid=f"image-variants-delete-{label}")
+
+
+def registered_image_fields():
+    return dict(_registry)
@@ -0,0 +1,72 @@
+import os
+
+from django.conf import settings
+from whitenoise.middleware import WhiteNoiseMiddleware
+from whitenoise.responders import IsDirectoryError, MissingFileError
+from whitenoise.string_utils import ensure_leading_trailing_slash
+
+MANIFEST_NAME = "manifest.json"
+
+
+def snapshot_root():
+    return os.path.abspath(str(settings.SNAPSHOT_ROOT)).rstrip(os.sep) + os.sep
+
+
+def snapshot_url():
+    return ensure_leading_trailing_slash(settings.SNAPSHOT_URL)
+
+
+class SnapshotWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoise that also serves JSON snapshots published after startup.
+
+    Plain WhiteNoise only indexes files present when the process starts, so
+    ``SNAPSHOT_URL`` is looked up on disk instead. Snapshot files carry a
+    content hash in their name and are cached as immutable; only
+    ``manifest.json`` is revalidated.
+    """
+
+    def __init__(self, get_response=None, settings=settings):
+        # Set before super().__init__(), which already calls immutable_file_test().
+        self.snapshot_prefix = snapshot_url()
+        self.snapshot_root = snapshot_root()
+        self.snapshot_files = {}
+        super().__init__(get_response, settings)
+
+    def __call__(self, request):
+        path = request.path_info
+        if path.startswith(self.snapshot_prefix):
+            response = self.serve_snapshot(path, request)
+            if response is not None:
+                return response
+        return super().__call__(request)
+
+    def serve_snapshot(self, url, request):
+        static_file = self.snapshot_files.get(url) or self.find_snapshot(url)
+        if static_file is None:
+            return None
+        try:
+            return self.serve(static_file, request)
+        except FileNotFoundError:
+            # Pruned after it was looked up.
+            self.snapshot_files.pop(url, None)
+            return None
+
+    def find_snapshot(self, url):
+        if not self.url_is_canonical(url):
+            return None
+        path = os.path.join(self.snapshot_root, url[len(self.snapshot_prefix) :])
+        if os.path.commonprefix((self.snapshot_root, path)) != self.snapshot_root or self.is_compressed_variant(path):
+            return None
+        try:
+            static_file = self.get_static_file(path, url)
+        except (MissingFileError, IsDirectoryError):
+            return None
+        if os.path.basename(path) != MANIFEST_NAME:
+            # Hashed names never change content, so the lookup can be reused.
+            self.snapshot_files[url] = static_file
+        return static_file
+
+    def immutable_file_test(self, path, url):
+        if url.startswith(self.snapshot_prefix):
+            return os.path.basename(url) != MANIFEST_NAME
+        return super().immutable_file_test(path, url)
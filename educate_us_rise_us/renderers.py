@@ -0,0 +1,119 @@
+from itertools import chain, islice
+
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` that encodes with orjson when it is installed.
+
+    Non-native values (``Decimal``, ``datetime``, lazy strings, ...) go
+    through DRF's ``JSONEncoder`` so they are formatted identically. orjson
+    only produces DRF's default form (``COMPACT_JSON``, ``UNICODE_JSON`` and
+    ``STRICT_JSON`` all on), so any other setting, indented output (the
+    browsable API) and anything orjson rejects use the stdlib path.
+
+    One difference remains: orjson writes ``NaN`` and ``Infinity`` as
+    ``null``, where DRF's strict mode raises ``ValueError``.
+    """
+
+    orjson_options = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def __init__(self):
+        self._encoder = encoders.JSONEncoder()
+
+    @staticmethod
+    def orjson_enabled():
+        return (
+            orjson is not None
+            and api_settings.COMPACT_JSON
+            and api_settings.UNICODE_JSON
+            and api_settings.STRICT_JSON
+        )
+
+    def dumps(self, data):
+        if not self.orjson_enabled():
+            return super().render(data)
+        try:
+            ret = orjson.dumps(data, default=self._encoder.default, option=self.orjson_options)
+        except (orjson.JSONEncodeError, TypeError):
+            return super().render(data)
+        # Same escaping as JSONRenderer, so the output is safe inside <script>.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if not self.orjson_enabled() or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return self.dumps(data)
+
+    def iter_render(self, items, chunk_size=500):
+        """Yield a JSON array of ``items`` in byte chunks of ``chunk_size`` elements."""
+        items = iter(items)
+        yield b"["
+        first = True
+        while True:
+            chunk = list(islice(items, chunk_size))
+            if not chunk:
+                break
+            # Encode the chunk as one array and drop its brackets.
+            body = self.dumps(chunk)[1:-1]
+            yield body if first else b"," + body
+            first = False
+        yield b"]"
+
+
+def default_json_renderer():
+    """An instance of the first JSON renderer in ``DEFAULT_RENDERER_CLASSES``."""
+    for renderer_class in api_settings.DEFAULT_RENDERER_CLASSES:
+        if getattr(renderer_class, "format", None) == "json":
+            return renderer_class()
+    return JSONRenderer()
+
+
+class StreamingListMixin:
+    """Stream unpaginated JSON ``list()`` responses as incremental array chunks.
+
+    Rows are read with ``.iterator()`` and serialized ``stream_chunk_size`` at
+    a time, so memory stays flat however large the list is. Paginated views
+    and non-JSON renderers use the normal response.
+
+    The first chunk is rendered before the response is returned, so errors
+    in the query or early rows still produce a normal error response. Once
+    the 200 is sent, a failure in a later chunk can only cut the body short;
+    clients see truncated, invalid JSON rather than an error status.
+    """
+
+    stream_chunk_size = 500
+
+    def list(self, request, *args, **kwargs):
+        renderer = getattr(request, "accepted_renderer", None)
+        if not isinstance(renderer, FastJSONRenderer) or renderer.get_indent(
+            request.accepted_media_type, self.get_renderer_context()
+        ):
+            return super().list(request, *args, **kwargs)
+
+        if self.paginator is not None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        chunks = renderer.iter_render(self.iter_list_items(queryset), self.stream_chunk_size)
+        # "[" plus the first chunk (or "]" for an empty list).
+        head = [next(chunks), next(chunks)]
+        return StreamingHttpResponse(chain(head, chunks), content_type="application/json")
+
+    def iter_list_items(self, queryset):
+        rows = queryset.iterator(chunk_size=self.stream_chunk_size)
+        while True:
+            chunk = list(islice(rows, self.stream_chunk_size))
+            if not chunk:
+                return
+            yield from self.get_serializer(chunk, many=True).data
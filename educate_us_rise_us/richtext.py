@@ -0,0 +1,115 @@
+import html
+import re
+
+import bleach
+
+EXCERPT_LENGTH = 280
+
+ALLOWED_TAGS = {
+    "a", "b", "blockquote", "br", "code", "em", "h1", "h2", "h3", "h4", "h5", "h6", "hr",
+    "i", "img", "li", "ol", "p", "pre", "s", "span", "strong", "sub", "sup", "table",
+    "tbody", "td", "th", "thead", "tr", "u", "ul",
+}
+ALLOWED_ATTRIBUTES = {
+    "a": ["href", "title"],
+    "img": ["src", "alt", "title", "width", "height"],
+    "td": ["colspan", "rowspan"],
+    "th": ["colspan", "rowspan"],
+}
+ALLOWED_PROTOCOLS = {"http", "https", "mailto", "tel"}
+
+# Elements whose text must go with them rather than leak into the output.
+_DROPPED_ELEMENTS = re.compile(r"<(script|style|iframe|object|noscript)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+# Block boundaries that separate words once the tags are gone.
+_BLOCK_BOUNDARY = re.compile(r"<(?:br|/?(?:p|div|li|ul|ol|h[1-6]|blockquote|pre|tr|td|th|table|hr))\b", re.IGNORECASE)
+_TAG = re.compile(r"<[^>]*>")
+_WORD = re.compile(r"\w+")
+
+
+def sanitize_html(value):
+    """Allow-listed editor HTML: no scripts, event handlers, styles or unsafe URLs."""
+    if not value:
+        return ""
+    return bleach.clean(
+        _DROPPED_ELEMENTS.sub("", value),
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        protocols=ALLOWED_PROTOCOLS,
+        strip=True,
+        strip_comments=True,
+    )
+
+
+def plain_text(value):
+    """Text content of rich text with whitespace collapsed."""
+    if not value:
+        return ""
+    value = _DROPPED_ELEMENTS.sub("", value)
+    value = _TAG.sub("", _BLOCK_BOUNDARY.sub(lambda match: " " + match.group(0), value))
+    return " ".join(html.unescape(value).split())
+
+
+def build_excerpt(text, length=EXCERPT_LENGTH):
+    """Cut plain ``text`` to ``length`` characters on a word boundary."""
+    if len(text) <= length:
+        return text
+    cut = text[: length - 1]
+    if " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,;:.") + "…"
+
+
+def derive(value, excerpt_length=EXCERPT_LENGTH):
+    """``(sanitized_html, excerpt, word_count)`` for one rich text value."""
+    text = plain_text(value)
+    return sanitize_html(value), build_excerpt(text, excerpt_length), len(_WORD.findall(text))
+
+
+def derived_columns(field_name):
+    return f"{field_name}_html", f"{field_name}_excerpt", f"{field_name}_word_count"
+
+
+def derive_rows(rows, excerpt_length=EXCERPT_LENGTH):
+    """``[(pk, derived values)]`` for ``(pk, value)`` pairs; runs in worker processes."""
+    return [(pk, derive(value, excerpt_length)) for pk, value in rows]
+
+
+def rich_text_models():
+    from django.apps import apps
+
+    return [model for model in apps.get_models() if issubclass(model, RichTextMixin) and model.rich_text_fields]
+
+
+def render_rich_text(instance, field_names=None):
+    """Fill the derived columns of ``instance`` for ``field_names`` (default: all)."""
+    for field_name in field_names or instance.rich_text_fields:
+        html_column, excerpt_column, words_column = derived_columns(field_name)
+        excerpt_length = instance._meta.get_field(excerpt_column).max_length
+        values = derive(getattr(instance, field_name), excerpt_length)
+        for column, value in zip((html_column, excerpt_column, words_column), values):
+            setattr(instance, column, value)
+
+
+class RichTextMixin:
+    """Keep ``<field>_html``/``_excerpt``/``_word_count`` in step with ``rich_text_fields``.
+
+    The derived columns are refreshed on ``save()``, including saves limited
+    by ``update_fields``. Bulk writes call ``render_rich_text()`` themselves;
+    ``manage.py backfill_rich_text`` covers existing rows.
+    """
+
+    rich_text_fields = ()
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            render_rich_text(self)
+        else:
+            sources = [name for name in self.rich_text_fields if name in update_fields]
+            if sources:
+                render_rich_text(self, sources)
+                kwargs["update_fields"] = {
+                    *update_fields,
+                    *(column for name in sources for column in derived_columns(name)),
+                }
+        super().save(*args, **kwargs)
@@ -53,11 +53,14 @@ INSTALLED_APPS = [
     "donations",
     "applications",
     "eventmedia",
+    "search",
+    "matching",
+    "outbox",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "educate_us_rise_us.middleware.SnapshotWhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -96,6 +99,23 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if DATABASE_URL:
     DATABASES["default"] = dj_database_url.parse(DATABASE_URL, conn_max_age=600, ssl_require=True)
 
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "eutr-default"),
+    }
+}
+
+CONTENT_CACHE_TIMEOUT = int(os.getenv("CONTENT_CACHE_TIMEOUT", "3600"))
+CONTENT_CACHE_LOCK_SECONDS = int(os.getenv("CONTENT_CACHE_LOCK_SECONDS", "10"))
+PUBLIC_CACHE_CONTROL = {
+    "public": True,
+    "max_age": int(os.getenv("PUBLIC_CACHE_MAX_AGE", "60")),
+    "stale_while_revalidate": int(os.getenv("PUBLIC_CACHE_STALE_WHILE_REVALIDATE", "300")),
+}
+CDN_PURGE_URL = os.getenv("CDN_PURGE_URL", "")
+CDN_PURGE_TOKEN = os.getenv("CDN_PURGE_TOKEN", "")
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -147,6 +167,11 @@ for raw_origin in [*_default_cors_origins, *_env_cors_origins]:
         CORS_ALLOWED_ORIGINS.append(normalized)
 
 REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": (
+        # Uses orjson when installed; swap for rest_framework.renderers.JSONRenderer to opt out.
+        "educate_us_rise_us.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
@@ -163,6 +188,13 @@ EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
 EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "true").lower() == "true"
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "no-reply@eutr.local")
 PARTNER_BOOKING_NOTIFICATION_EMAIL = os.getenv("PARTNER_BOOKING_NOTIFICATION_EMAIL", DEFAULT_FROM_EMAIL)
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50"))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5"))
+EMAIL_OUTBOX_RETRY_BASE_SECONDS = int(os.getenv("EMAIL_OUTBOX_RETRY_BASE_SECONDS", "60"))
+EMAIL_OUTBOX_RETRY_MAX_SECONDS = int(os.getenv("EMAIL_OUTBOX_RETRY_MAX_SECONDS", "3600"))
+EMAIL_OUTBOX_LEASE_SECONDS = int(os.getenv("EMAIL_OUTBOX_LEASE_SECONDS", "600"))
+MAIL_CAMPAIGN_CHUNK_SIZE = int(os.getenv("MAIL_CAMPAIGN_CHUNK_SIZE", "200"))
+MAIL_CAMPAIGN_RATE_PER_SECOND = float(os.getenv("MAIL_CAMPAIGN_RATE_PER_SECOND", "5"))
 
 PAYMENT_REQUIRE_WEBHOOK_SIGNATURES = os.getenv("PAYMENT_REQUIRE_WEBHOOK_SIGNATURES", "false").lower() in {"1", "true", "yes", "on"}
 PAYMENT_WEBHOOK_TOLERANCE_SECONDS = int(os.getenv("PAYMENT_WEBHOOK_TOLERANCE_SECONDS", "300"))
@@ -178,6 +210,42 @@ MPESA_PASSKEY = os.getenv("MPESA_PASSKEY", "")
 MPESA_CALLBACK_URL = os.getenv("MPESA_CALLBACK_URL", "")
 MPESA_TEST_PHONE = os.getenv("MPESA_TEST_PHONE", "")
 
+CAMPAIGN_COUNTER_SHARDS = int(os.getenv("CAMPAIGN_COUNTER_SHARDS", "16"))
+CAMPAIGN_PROGRESS_CACHE_SECONDS = int(os.getenv("CAMPAIGN_PROGRESS_CACHE_SECONDS", "5"))
+ADMIN_DASHBOARD_CACHE_SECONDS = int(os.getenv("ADMIN_DASHBOARD_CACHE_SECONDS", "30"))
+ADMIN_DASHBOARD_SPARKLINE_DAYS = int(os.getenv("ADMIN_DASHBOARD_SPARKLINE_DAYS", "14"))
+ADMIN_EXACT_COUNT_THRESHOLD = int(os.getenv("ADMIN_EXACT_COUNT_THRESHOLD", "10000"))
+
+IMAGE_VARIANT_WIDTHS = [int(width) for width in os.getenv("IMAGE_VARIANT_WIDTHS", "320,640,1280").split(",") if width.strip()]
+IMAGE_VARIANT_QUALITY = int(os.getenv("IMAGE_VARIANT_QUALITY", "80"))
+IMAGE_VARIANT_WORKERS = int(os.getenv("IMAGE_VARIANT_WORKERS", "2"))
+IMAGE_VARIANTS_ASYNC = os.getenv("IMAGE_VARIANTS_ASYNC", "true").lower() in {"1", "true", "yes", "on"}
+IMAGE_VARIANT_MAX_ATTEMPTS = int(os.getenv("IMAGE_VARIANT_MAX_ATTEMPTS", "3"))
+IMAGE_VARIANT_RETRY_SECONDS = int(os.getenv("IMAGE_VARIANT_RETRY_SECONDS", "60"))
+IMAGE_VARIANT_LEASE_SECONDS = int(os.getenv("IMAGE_VARIANT_LEASE_SECONDS", "600"))
+CONTENT_IMPORT_BATCH_SIZE = int(os.getenv("CONTENT_IMPORT_BATCH_SIZE", "500"))
+CONTENT_IMPORT_PHOTO_WORKERS = int(os.getenv("CONTENT_IMPORT_PHOTO_WORKERS", "4"))
+CONTENT_IMPORT_MAX_PHOTO_BYTES = int(os.getenv("CONTENT_IMPORT_MAX_PHOTO_BYTES", str(10 * 1024 * 1024)))
+
+# Static JSON snapshots of the public lists (see `manage.py publish_snapshots`).
+SNAPSHOT_ROOT = Path(os.getenv("SNAPSHOT_ROOT") or MEDIA_ROOT / "snapshots")
+SNAPSHOT_URL = os.getenv("SNAPSHOT_URL", "/snapshots/")
+SNAPSHOT_PUBLIC_URL = os.getenv("SNAPSHOT_PUBLIC_URL", "")
+SNAPSHOT_PUBLISH_ON_CHANGE = os.getenv("SNAPSHOT_PUBLISH_ON_CHANGE", "true").lower() in {"1", "true", "yes", "on"}
+SNAPSHOT_PUBLISH_DELAY_SECONDS = float(os.getenv("SNAPSHOT_PUBLISH_DELAY_SECONDS", "2"))
+
+# Latest posts included in /api/posts/feed.atom and /api/posts/feed.json.
+POST_FEED_SIZE = int(os.getenv("POST_FEED_SIZE", "20"))
+# Counter changes to a post within this many seconds of the last direct write
+# are batched in memory (0 writes every change immediately).
+POST_COUNTER_FLUSH_SECONDS = float(os.getenv("POST_COUNTER_FLUSH_SECONDS", "2"))
+
+# Volunteer/opportunity matching (matching app).
+MATCH_TOP_K = int(os.getenv("MATCH_TOP_K", "10"))
+MATCH_LOCATION_WEIGHT = float(os.getenv("MATCH_LOCATION_WEIGHT", "0.25"))
+MATCH_CACHE_TIMEOUT = int(os.getenv("MATCH_CACHE_TIMEOUT", str(CONTENT_CACHE_TIMEOUT)))
+MATCH_STATS_SECONDS = int(os.getenv("MATCH_STATS_SECONDS", "300"))
+
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 SESSION_COOKIE_SECURE = not DEBUG
 CSRF_COOKIE_SECURE = not DEBUG
@@ -0,0 +1,84 @@
+import hashlib
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from applications.fastpath import serialize_queryset
+from applications.views import (
+    EventsListView,
+    PartnersListView,
+    ProgramsListView,
+    ProjectsListView,
+    TeamListView,
+    TestimonialsListView,
+)
+from donations.views import payment_section_payload
+from eventmedia.models import EventOverviewVideo
+from eventmedia.serializers import EventOverviewVideoSerializer
+
+from .content_cache import content_versions, get_or_build, url_digest
+from .http_cache import apply_public_cache_headers
+from .renderers import default_json_renderer
+
+BUNDLE_LISTS = (
+    ("programs", ProgramsListView),
+    ("projects", ProjectsListView),
+    ("events", EventsListView),
+    ("team", TeamListView),
+    ("partners", PartnersListView),
+    ("testimonials", TestimonialsListView),
+)
+
+
+def bundle_models():
+    return [view_class().get_queryset().model for _, view_class in BUNDLE_LISTS] + [EventOverviewVideo]
+
+
+def bundle_list_payload(view_class, request):
+    view = view_class()
+    return serialize_queryset(view.get_serializer_class(), view.get_queryset(), {"request": request})
+
+
+def overview_video_payload():
+    video = EventOverviewVideo.objects.filter(is_active=True).first() or EventOverviewVideo.objects.first()
+    return EventOverviewVideoSerializer(video).data if video else None
+
+
+def build_site_bundle(request):
+    payload = {}
+    for key, view_class in BUNDLE_LISTS:
+        payload[key] = bundle_list_payload(view_class, request)
+
+    payload["event_overview_video"] = overview_video_payload()
+    payload["payment_section"] = payment_section_payload()
+    return payload
+
+
+def site_bundle_snapshot(request):
+    """Return ``(etag, body)`` for the current content versions."""
+    key = f"site-bundle:{content_versions(bundle_models())}:{url_digest(request, include_path=False)}"
+    snapshot = cache.get(key)
+    if snapshot is None:
+
+        def build():
+            body = default_json_renderer().render(build_site_bundle(request))
+            return f'"{hashlib.sha256(body).hexdigest()[:32]}"', body
+
+        snapshot = get_or_build(key, build)
+    return snapshot
+
+
+class SiteBundleView(APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        etag, body = site_bundle_snapshot(request)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(body, content_type="application/json")
+        response["ETag"] = etag
+        return apply_public_cache_headers(response, bundle_models(), {"no_cache": True})
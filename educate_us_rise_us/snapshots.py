@@ -0,0 +1,249 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.db import connection
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from eventmedia.models import EventOverviewVideo
+
+from .content_cache import content_versions
+from .middleware import MANIFEST_NAME, snapshot_root, snapshot_url
+from .renderers import default_json_renderer
+from .site_bundle import BUNDLE_LISTS, bundle_list_payload, overview_video_payload
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+LOCK_NAME = ".publish.lock"
+_publish_lock = threading.Lock()
+_timer = None
+_timer_lock = threading.Lock()
+
+
+class SnapshotURLBuilder:
+    """Request stand-in so serializers build media URLs on ``SNAPSHOT_PUBLIC_URL``."""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/") + "/"
+
+    def build_absolute_uri(self, location=None):
+        return urljoin(self.base_url, location or "")
+
+
+def snapshot_request():
+    base_url = (getattr(settings, "SNAPSHOT_PUBLIC_URL", "") or "").strip()
+    return SnapshotURLBuilder(base_url) if base_url else None
+
+
+def snapshot_sections():
+    """Section name -> (model, payload builder taking the request stand-in)."""
+    sections = {
+        key: (view_class().get_queryset().model, lambda request, view_class=view_class: bundle_list_payload(view_class, request))
+        for key, view_class in BUNDLE_LISTS
+    }
+    sections["event_overview_video"] = (EventOverviewVideo, lambda request: overview_video_payload())
+    return sections
+
+
+def snapshot_models():
+    return {model for model, _ in snapshot_sections().values()}
+
+
+def current_content_version():
+    """Content versions of every snapshot model, as recorded in the manifest."""
+    return content_versions(sorted(snapshot_models(), key=lambda model: model._meta.label))
+
+
+@contextmanager
+def publish_lock():
+    """Serialize publishes across threads and, via ``flock``, across processes.
+
+    Gunicorn workers, ``publish_snapshots`` and ``import_content`` may all
+    publish into the same ``SNAPSHOT_ROOT``; without the file lock one of
+    them could prune files another has just put in its manifest.
+    """
+    with _publish_lock:
+        os.makedirs(snapshot_root(), exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(snapshot_root(), LOCK_NAME), "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_snapshot(section, body):
+    """Write ``body`` as ``<section>.<hash>.json`` plus precompressed siblings."""
+    name = f"{section}.{hashlib.sha256(body).hexdigest()[:16]}.json"
+    path = os.path.join(snapshot_root(), name)
+    if not os.path.exists(path):
+        # Compressed files first: WhiteNoise picks up the encodings that exist
+        # when it first serves the JSON file.
+        _write_atomic(f"{path}.gz", gzip.compress(body, compresslevel=9, mtime=0))
+        if brotli is not None:
+            _write_atomic(f"{path}.br", brotli.compress(body))
+        _write_atomic(path, body)
+    return name
+
+
+def read_manifest():
+    try:
+        with open(os.path.join(snapshot_root(), MANIFEST_NAME), "rb") as handle:
+            return handle.read()
+    except FileNotFoundError:
+        return None
+
+
+def _load_manifest(body):
+    try:
+        return json.loads(body) if body else {}
+    except ValueError:
+        return {}
+
+
+def _referenced_names(manifest):
+    return {entry["url"].rsplit("/", 1)[-1] for entry in manifest.get("files", {}).values()}
+
+
+def _prune(keep):
+    for name in os.listdir(snapshot_root()):
+        base = name[:-3] if name.endswith((".gz", ".br")) else name
+        if name in (MANIFEST_NAME, LOCK_NAME) or base in keep or name.endswith(".tmp"):
+            continue
+        try:
+            os.remove(os.path.join(snapshot_root(), name))
+        except FileNotFoundError:
+            pass
+
+
+def manifest_is_stale(manifest):
+    return manifest.get("content_version") != current_content_version()
+
+
+def publish_snapshots(if_stale=False):
+    """Render every public section to versioned JSON and repoint the manifest.
+
+    Unchanged sections hash to existing files and are not rewritten. Files
+    named by the previous manifest are kept so clients holding it can still
+    fetch them; anything older is removed. The manifest records the content
+    versions it was built from; with ``if_stale`` nothing is rendered while
+    they are still current. Returns the new manifest dict.
+    """
+    with publish_lock():
+        previous = _load_manifest(read_manifest())
+        # Read before rendering: a change landing mid-publish leaves the
+        # manifest stale, so the next check publishes again.
+        content_version = current_content_version()
+        if if_stale and previous.get("content_version") == content_version:
+            return previous
+        request = snapshot_request()
+        renderer = default_json_renderer()
+
+        files = {}
+        for section, (_, build) in snapshot_sections().items():
+            payload = build(request)
+            # Renderers return an empty body for None; the file must stay valid JSON.
+            body = renderer.render(payload) if payload is not None else b"null"
+            name = write_snapshot(section, body)
+            files[section] = {"url": f"{snapshot_url()}{name}", "bytes": len(body)}
+
+        if previous.get("files") == files and previous.get("content_version") == content_version:
+            return previous
+
+        version = hashlib.sha256(json.dumps(files, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        manifest = {
+            "version": version,
+            "generated_at": timezone.now().isoformat(),
+            "content_version": content_version,
+            "files": files,
+        }
+        _write_atomic(os.path.join(snapshot_root(), MANIFEST_NAME), json.dumps(manifest, indent=2).encode("utf-8"))
+        _prune(_referenced_names(previous) | _referenced_names(manifest))
+        return manifest
+
+
+def _publish_in_background():
+    try:
+        publish_snapshots()
+    except Exception as exc:
+        logger.warning("Publishing JSON snapshots failed: %s", exc)
+    finally:
+        connection.close()
+
+
+def schedule_publish():
+    """Republish shortly after a burst of writes settles, off the request thread.
+
+    The timer is not a daemon so short-lived processes (e.g. ``import_content``)
+    still publish before they exit.
+    """
+    global _timer
+    delay = float(getattr(settings, "SNAPSHOT_PUBLISH_DELAY_SECONDS", 2))
+    with _timer_lock:
+        if _timer is not None:
+            _timer.cancel()
+        _timer = threading.Timer(delay, _publish_in_background)
+        _timer.start()
+
+
+def publish_on_change(sender, **kwargs):
+    if getattr(settings, "SNAPSHOT_PUBLISH_ON_CHANGE", True) and sender in snapshot_models():
+        schedule_publish()
+
+
+class SnapshotManifestView(APIView):
+    """Points clients at the current snapshot files, read from disk.
+
+    Writes made by other processes (``import_content``, the worker, another
+    instance) publish onto their own disk, if at all. So the manifest's
+    content versions are compared against the shared cache here, on the web
+    service that serves the files, and a stale manifest is republished
+    before it is returned. While nothing has changed this is a cache read
+    and no database queries.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        body = read_manifest()
+        if body is None or manifest_is_stale(_load_manifest(body)):
+            publish_snapshots(if_stale=True)
+            body = read_manifest()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(body, content_type="application/json")
+        response["ETag"] = etag
+        patch_cache_control(response, no_cache=True, public=True)
+        return response
@@ -6,6 +6,9 @@ from django.urls import include, path
 
 from donations.views import MpesaWebhookView
 
+from .site_bundle import SiteBundleView
+from .snapshots import SnapshotManifestView
+
 
 def api_root(request):
     return JsonResponse({"message": "Welcome to the EUTR", "status": "running"})
@@ -18,12 +21,15 @@ urlpatterns = [
     path("mpesa-express-simulate/", MpesaWebhookView.as_view(), name="mpesa-express-simulate"),
     path("api/auth/", include("accounts.urls")),
     path("api/auth/", include("rest_framework.urls")),
+    path("api/site-bundle/", SiteBundleView.as_view(), name="site-bundle"),
+    path("api/snapshots/", SnapshotManifestView.as_view(), name="snapshot-manifest"),
     path("api/", include("members.urls")),
     path("api/", include("posts.urls")),
     path("api/", include("volunteering.urls")),
     path("api/", include("donations.urls")),
     path("api/", include("applications.urls")),
     path("api/", include("eventmedia.urls")),
+    path("api/", include("outbox.urls")),
 ]
 
 if settings.DEBUG:
@@ -4,3 +4,6 @@
 class EventmediaConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "eventmedia"
+
+    def ready(self):
+        from . import signals  # noqa: F401
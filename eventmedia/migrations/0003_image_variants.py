@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eventmedia', '0002_eventoverviewvideo_image_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventoverviewvideo',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -1,15 +1,20 @@
 ﻿from django.db import models
 
+from educate_us_rise_us.content_cache import ContentQuerySet
+
 
 class EventOverviewVideo(models.Model):
     title = models.CharField(max_length=160)
     youtube_url = models.URLField()
     image = models.ImageField(upload_to="event-overview/", blank=True, null=True)
     image_url = models.URLField(blank=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ContentQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
 
@@ -1,10 +1,13 @@
 ﻿from rest_framework import serializers
 
+from educate_us_rise_us.images import srcset_map
+
 from .models import EventOverviewVideo
 
 
 class EventOverviewVideoSerializer(serializers.ModelSerializer):
     image_file_url = serializers.SerializerMethodField(read_only=True)
+    image_srcset = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
         model = EventOverviewVideo
@@ -15,6 +18,7 @@ class EventOverviewVideoSerializer(serializers.ModelSerializer):
             "image",
             "image_url",
             "image_file_url",
+            "image_srcset",
             "is_active",
             "created_at",
             "updated_at",
@@ -27,3 +31,6 @@ class EventOverviewVideoSerializer(serializers.ModelSerializer):
         if request:
             return request.build_absolute_uri(obj.image.url)
         return obj.image.url
+
+    def get_image_srcset(self, obj):
+        return srcset_map(obj.image_variants, obj.image, self.context.get("request"))
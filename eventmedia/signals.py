@@ -0,0 +1,7 @@
+from educate_us_rise_us.content_cache import track_content_model
+from educate_us_rise_us.images import register_image_field
+
+from .models import EventOverviewVideo
+
+track_content_model(EventOverviewVideo)
+register_image_field(EventOverviewVideo, "image")
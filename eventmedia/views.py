@@ -6,6 +6,7 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from applications.pagination import AdminResultsSetPagination
+from educate_us_rise_us.http_cache import ConditionalGetMixin
 
 from .models import EventOverviewVideo
 from .serializers import EventOverviewVideoSerializer
@@ -22,10 +23,13 @@ def parse_bool(value):
     return None
 
 
-class EventOverviewVideoView(APIView):
+class EventOverviewVideoView(ConditionalGetMixin, APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
+        return self.conditional_response(request, EventOverviewVideo.objects.all(), self.current_video_response)
+
+    def current_video_response(self):
         video = EventOverviewVideo.objects.filter(is_active=True).first() or EventOverviewVideo.objects.first()
         if not video:
             return Response({"detail": "No event overview video found."}, status=status.HTTP_404_NOT_FOUND)
@@ -33,7 +37,7 @@ class EventOverviewVideoView(APIView):
         return Response(serializer.data)
 
 
-class EventOverviewVideoListView(generics.ListAPIView):
+class EventOverviewVideoListView(ConditionalGetMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
     serializer_class = EventOverviewVideoSerializer
 
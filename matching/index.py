@@ -0,0 +1,138 @@
+import math
+import re
+import time
+from collections import defaultdict
+from itertools import islice
+
+from django.core.cache import cache
+from django.db import transaction
+
+from educate_us_rise_us.richtext import plain_text
+from members.models import MemberProfile, normalize_location
+from volunteering.models import Opportunity
+
+from .models import MatchDocument, MatchPosting
+
+MAX_TERMS = 64
+TERM_LENGTH = 60
+STOP_WORDS = frozenset(
+    """
+    a an and are as at be by can for from has have in into is it its of on or our
+    the their this to was we were will with you your who what when where which
+    """.split()
+)
+_TOKEN = re.compile(r"[^\W\d_]{2,}")
+
+# kind -> (model, {field: weight})
+SOURCES = {
+    MatchDocument.KIND_MEMBER: (MemberProfile, {"skills": 1.0}),
+    MatchDocument.KIND_OPPORTUNITY: (Opportunity, {"title": 2.0, "description": 1.0}),
+}
+KIND_FOR_MODEL = {model: kind for kind, (model, _) in SOURCES.items()}
+
+
+def stem(token):
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    return [stem(token) for token in _TOKEN.findall(plain_text(text).casefold()) if token not in STOP_WORDS]
+
+
+def term_weights(obj, fields):
+    """``{term: weight}`` with log-scaled, field-weighted term frequencies."""
+    frequencies = defaultdict(float)
+    for field, field_weight in fields.items():
+        for token in tokenize(getattr(obj, field, "")):
+            frequencies[token[:TERM_LENGTH]] += field_weight
+    weights = {term: 1 + math.log(frequency) if frequency >= 1 else frequency for term, frequency in frequencies.items()}
+    if len(weights) > MAX_TERMS:
+        weights = dict(sorted(weights.items(), key=lambda item: (-item[1], item[0]))[:MAX_TERMS])
+    return weights
+
+
+def _version_key(kind, object_id):
+    return f"match-version:{kind}:{object_id}"
+
+
+def _bump(keys):
+    keys = list(keys)
+
+    def bump():
+        for key in keys:
+            try:
+                cache.incr(key)
+            except ValueError:
+                # Clock-seeded so an evicted counter never repeats an old value.
+                cache.set(key, int(time.time() * 1000), timeout=None)
+
+    # After commit, so nothing is cached under the new version from old rows.
+    transaction.on_commit(bump)
+
+
+def index_versions(kind, object_ids):
+    """``{object_id: version}`` of indexed documents; moves when one is reindexed."""
+    keys = {_version_key(kind, object_id): object_id for object_id in object_ids}
+    found = cache.get_many(list(keys))
+    missing = {key: int(time.time() * 1000) for key in keys if key not in found}
+    for key, value in missing.items():
+        cache.add(key, value, timeout=None)
+    if missing:
+        found.update(cache.get_many(list(missing)))
+    return {object_id: found.get(key) for key, object_id in keys.items()}
+
+
+def index_objects(kind, objects):
+    """Rewrite the documents and postings of ``objects`` (all of one ``kind``)."""
+    _, fields = SOURCES[kind]
+    objects = [obj for obj in objects if obj.pk is not None]
+    if not objects:
+        return 0
+    weights = {obj.pk: term_weights(obj, fields) for obj in objects}
+    with transaction.atomic():
+        MatchDocument.objects.bulk_create(
+            [
+                MatchDocument(
+                    kind=kind,
+                    object_id=obj.pk,
+                    location_key=normalize_location(getattr(obj, "location", ""))[:120],
+                )
+                for obj in objects
+            ],
+            update_conflicts=True,
+            unique_fields=["kind", "object_id"],
+            update_fields=["location_key", "updated_at"],
+        )
+        document_ids = dict(
+            MatchDocument.objects.filter(kind=kind, object_id__in=weights).values_list("object_id", "pk")
+        )
+        MatchPosting.objects.filter(document_id__in=document_ids.values()).delete()
+        MatchPosting.objects.bulk_create(
+            [
+                MatchPosting(document_id=document_ids[object_id], kind=kind, term=term, weight=weight)
+                for object_id, terms in weights.items()
+                for term, weight in terms.items()
+            ],
+            batch_size=1000,
+        )
+    _bump(_version_key(kind, object_id) for object_id in weights)
+    return len(objects)
+
+
+def reindex_pks(kind, pks, batch_size=500):
+    model, _ = SOURCES[kind]
+    pks = iter(pks)
+    indexed = 0
+    while True:
+        batch = list(islice(pks, batch_size))
+        if not batch:
+            return indexed
+        indexed += index_objects(kind, model._base_manager.filter(pk__in=batch))
+
+
+def remove_pks(kind, pks):
+    pks = list(pks)
+    MatchDocument.objects.filter(kind=kind, object_id__in=pks).delete()
+    _bump(_version_key(kind, pk) for pk in pks)
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from matching.index import SOURCES, reindex_pks
+from matching.models import MatchDocument
+from matching.recommend import warm_recommendations
+
+
+class Command(BaseCommand):
+    help = "Rebuild the volunteer matching index and optionally precompute recommendations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kinds", nargs="*", help=f"Limit to these kinds ({', '.join(SOURCES)}).")
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows indexed or scored per batch.")
+        parser.add_argument("--warm", action="store_true", help="Cache top-k recommendations for every document.")
+
+    def handle(self, *args, **options):
+        kinds = options["kinds"] or list(SOURCES)
+        unknown = [kind for kind in kinds if kind not in SOURCES]
+        if unknown:
+            raise CommandError(f"Unknown kinds: {', '.join(unknown)}")
+
+        for kind in kinds:
+            model, _ = SOURCES[kind]
+            pks = model._base_manager.values_list("pk", flat=True).order_by("pk")
+            indexed = reindex_pks(kind, pks.iterator(), batch_size=options["batch_size"])
+            stale = MatchDocument.objects.filter(kind=kind).exclude(object_id__in=model._base_manager.values("pk"))
+            removed, _ = stale.delete()
+            self.stdout.write(f"{kind}: {indexed} document(s) indexed, {removed} stale row(s) removed")
+
+        if options["warm"]:
+            for kind in kinds:
+                object_ids = MatchDocument.objects.filter(kind=kind).values_list("object_id", flat=True).order_by("object_id")
+                warmed = warm_recommendations(kind, object_ids.iterator(), batch_size=options["batch_size"])
+                self.stdout.write(f"{kind}: recommendations cached for {warmed} document(s)")
+
+        self.stdout.write(self.style.SUCCESS("Match index rebuild completed."))
@@ -0,0 +1,43 @@
+# Generated by Django 6.0.2 on 2026-10-19 18:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('member', 'Member'), ('opportunity', 'Opportunity')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('location_key', models.CharField(blank=True, max_length=120)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'location_key'], name='match_document_location_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_match_document')],
+            },
+        ),
+        migrations.CreateModel(
+            name='MatchPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('member', 'Member'), ('opportunity', 'Opportunity')], max_length=20)),
+                ('term', models.CharField(max_length=60)),
+                ('weight', models.FloatField()),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='postings', to='matching.matchdocument')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'term'], name='match_posting_term_idx')],
+                'constraints': [models.UniqueConstraint(fields=('document', 'term'), name='unique_match_posting')],
+            },
+        ),
+    ]
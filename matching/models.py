@@ -0,0 +1,53 @@
+from django.db import models
+
+
+class MatchDocument(models.Model):
+    """One indexed member profile or opportunity.
+
+    Vector lengths depend on the IDF of the whole collection, so they are
+    computed by ``matching.recommend`` per index version rather than stored.
+    """
+
+    KIND_MEMBER = "member"
+    KIND_OPPORTUNITY = "opportunity"
+    KIND_CHOICES = [
+        (KIND_MEMBER, "Member"),
+        (KIND_OPPORTUNITY, "Opportunity"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    location_key = models.CharField(max_length=120, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id"], name="unique_match_document"),
+        ]
+        indexes = [
+            models.Index(fields=["kind", "location_key"], name="match_document_location_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id}"
+
+
+class MatchPosting(models.Model):
+    """Inverted index entry: ``term`` occurs in ``document`` with ``weight``."""
+
+    document = models.ForeignKey(MatchDocument, on_delete=models.CASCADE, related_name="postings")
+    # Copied from the document so term lookups stay within one index.
+    kind = models.CharField(max_length=20, choices=MatchDocument.KIND_CHOICES)
+    term = models.CharField(max_length=60)
+    weight = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["document", "term"], name="unique_match_posting"),
+        ]
+        indexes = [
+            models.Index(fields=["kind", "term"], name="match_posting_term_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.term} -> {self.document_id}"
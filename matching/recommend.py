@@ -0,0 +1,201 @@
+import heapq
+import math
+from collections import defaultdict
+from itertools import islice
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+
+from volunteering.models import Opportunity
+
+from .index import index_versions
+from .models import MatchDocument, MatchPosting
+
+TARGET_KIND = {
+    MatchDocument.KIND_MEMBER: MatchDocument.KIND_OPPORTUNITY,
+    MatchDocument.KIND_OPPORTUNITY: MatchDocument.KIND_MEMBER,
+}
+TERM_CHUNK = 500
+
+
+def _chunks(values, size):
+    values = iter(values)
+    while True:
+        chunk = list(islice(values, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _location_weight():
+    return min(max(float(getattr(settings, "MATCH_LOCATION_WEIGHT", 0.25)), 0.0), 1.0)
+
+
+def _idf(total, frequency):
+    return math.log((total + 1) / (frequency + 1)) + 1
+
+
+def _norms(kind, object_ids, idf, total):
+    """Lengths of the IDF-weighted vectors of ``object_ids`` (all of ``kind``)."""
+    squares = defaultdict(float)
+    postings = MatchPosting.objects.filter(kind=kind)
+    if object_ids is not None:
+        postings = postings.filter(document__object_id__in=object_ids)
+    for object_id, term, weight in postings.values_list("document__object_id", "term", "weight").iterator(
+        chunk_size=2000
+    ):
+        squares[object_id] += (weight * (idf.get(term) or _idf(total, 0))) ** 2
+    return {object_id: math.sqrt(value) for object_id, value in squares.items()}
+
+
+def _compute_collection_stats(kind):
+    total = MatchDocument.objects.filter(kind=kind).count()
+    idf = {
+        term: _idf(total, count)
+        for term, count in MatchPosting.objects.filter(kind=kind).values_list("term").annotate(count=Count("id")).order_by()
+    }
+    return {"total": total, "idf": idf, "norms": _norms(kind, None, idf, total)}
+
+
+def _stats_timeout():
+    return int(getattr(settings, "MATCH_STATS_SECONDS", 300))
+
+
+def collection_stats(kind):
+    """``{"total", "idf": {term: idf}, "norms": {object_id: length}}`` for one kind.
+
+    Rebuilding them scans every posting of the kind, so they are refreshed
+    every ``MATCH_STATS_SECONDS`` rather than on each reindex; in between,
+    :func:`top_matches` fills in norms for documents indexed since.
+    """
+    key = f"match-stats:{kind}"
+    stats = cache.get(key)
+    if stats is None:
+        stats = _compute_collection_stats(kind)
+        cache.set(key, stats, _stats_timeout())
+    return stats
+
+
+def top_matches(source_kind, object_ids, k):
+    """Score ``object_ids`` (all of ``source_kind``) against the other kind in one batch.
+
+    Returns ``{object_id: [(target_id, score), ...]}`` with at most ``k``
+    entries each, best first, scores in ``[0, 1]``. Text similarity is the
+    cosine of the TF-IDF vectors, both weighted with the IDF of the target
+    collection; sharing a location adds ``MATCH_LOCATION_WEIGHT``. Only the
+    postings of the batch's terms are loaded; target norms come from
+    :func:`collection_stats`, or are computed here for targets newer than it.
+    """
+    target_kind = TARGET_KIND[source_kind]
+    object_ids = list(object_ids)
+    stats = collection_stats(target_kind)
+
+    queries = defaultdict(dict)
+    for object_id, term, weight in MatchPosting.objects.filter(
+        document__kind=source_kind, document__object_id__in=object_ids
+    ).values_list("document__object_id", "term", "weight"):
+        queries[object_id][term] = weight
+    locations = dict(
+        MatchDocument.objects.filter(kind=source_kind, object_id__in=object_ids)
+        .exclude(location_key="")
+        .values_list("object_id", "location_key")
+    )
+
+    terms = set().union(*queries.values()) if queries else set()
+    # Terms no target uses still count towards the query's length.
+    idf = {term: stats["idf"].get(term) or _idf(stats["total"], 0) for term in terms}
+    hits = []
+    for chunk in _chunks(sorted(terms & stats["idf"].keys()), TERM_CHUNK):
+        hits.extend(
+            MatchPosting.objects.filter(kind=target_kind, term__in=chunk).values_list(
+                "term", "document__object_id", "weight"
+            )
+        )
+    norms = stats["norms"]
+    unknown = {target_id for _, target_id, _ in hits} - norms.keys()
+    if unknown:
+        norms = {**norms, **_norms(target_kind, unknown, stats["idf"], stats["total"])}
+    postings = defaultdict(list)
+    for term, target_id, weight in hits:
+        norm = norms.get(target_id)
+        if norm:
+            postings[term].append((target_id, weight * idf[term] / norm))
+
+    same_location = defaultdict(list)
+    for location_key, target_id in MatchDocument.objects.filter(
+        kind=target_kind, location_key__in=set(locations.values())
+    ).values_list("location_key", "object_id"):
+        same_location[location_key].append(target_id)
+
+    allowed = None
+    if target_kind == MatchDocument.KIND_OPPORTUNITY:
+        allowed = set(Opportunity.objects.filter(is_active=True).values_list("pk", flat=True))
+
+    location_weight = _location_weight()
+    results = {}
+    for object_id in object_ids:
+        query = {term: weight * idf[term] for term, weight in queries.get(object_id, {}).items()}
+        query_norm = math.sqrt(sum(weight * weight for weight in query.values()))
+        text_scores = defaultdict(float)
+        if query_norm:
+            for term, query_weight in query.items():
+                factor = query_weight / query_norm
+                for target_id, weight in postings.get(term, ()):
+                    text_scores[target_id] += factor * weight
+        local = set(same_location.get(locations.get(object_id), ()))
+        scores = {
+            target_id: (1 - location_weight) * min(text_scores.get(target_id, 0.0), 1.0)
+            + (location_weight if target_id in local else 0.0)
+            for target_id in text_scores.keys() | local
+            if allowed is None or target_id in allowed
+        }
+        best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+        results[object_id] = [(target_id, round(score, 4)) for target_id, score in best if score > 0]
+    return results
+
+
+def _cache_keys(source_kind, object_ids, k):
+    # Keyed on the source document only: a new or edited target shows up
+    # once the entry expires (MATCH_CACHE_TIMEOUT) instead of invalidating
+    # every cached list of the kind. Callers drop targets that have since
+    # been deleted or deactivated.
+    versions = index_versions(source_kind, object_ids)
+    return {object_id: f"match:{source_kind}:{object_id}:{k}:{versions[object_id]}" for object_id in object_ids}
+
+
+def _timeout():
+    return int(getattr(settings, "MATCH_CACHE_TIMEOUT", getattr(settings, "CONTENT_CACHE_TIMEOUT", 3600)))
+
+
+def requested_k(request, maximum=50):
+    """``?limit=`` clamped to ``1..maximum``, defaulting to ``MATCH_TOP_K``."""
+    default = int(getattr(settings, "MATCH_TOP_K", 10))
+    try:
+        k = int(request.query_params.get("limit", default))
+    except (TypeError, ValueError):
+        k = default
+    return min(max(k, 1), maximum)
+
+
+def recommendations(source_kind, object_id, k=None):
+    """Cached top-``k`` ``(target_id, score)`` pairs for one member or opportunity."""
+    k = k or int(getattr(settings, "MATCH_TOP_K", 10))
+    key = _cache_keys(source_kind, [object_id], k)[object_id]
+    matches = cache.get(key)
+    if matches is None:
+        matches = top_matches(source_kind, [object_id], k)[object_id]
+        cache.set(key, matches, _timeout())
+    return matches
+
+
+def warm_recommendations(source_kind, object_ids, k=None, batch_size=500):
+    """Precompute and cache recommendations for many sources; returns how many."""
+    k = k or int(getattr(settings, "MATCH_TOP_K", 10))
+    warmed = 0
+    for batch in _chunks(object_ids, batch_size):
+        keys = _cache_keys(source_kind, batch, k)
+        matches = top_matches(source_kind, batch, k)
+        cache.set_many({keys[object_id]: matches[object_id] for object_id in batch}, _timeout())
+        warmed += len(batch)
+    return warmed
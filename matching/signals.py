@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete, post_save
+
+from .index import KIND_FOR_MODEL, index_objects, remove_pks
+
+
+def _index_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    index_objects(KIND_FOR_MODEL[sender], [instance])
+
+
+def _remove_deleted(sender, instance, **kwargs):
+    remove_pks(KIND_FOR_MODEL[sender], [instance.pk])
+
+
+for model in KIND_FOR_MODEL:
+    label = model._meta.label_lower
+    post_save.connect(_index_saved, sender=model, dispatch_uid=f"match-index-save-{label}")
+    post_delete.connect(_remove_deleted, sender=model, dispatch_uid=f"match-index-delete-{label}")
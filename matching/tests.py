@@ -0,0 +1,70 @@
+import math
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from accounts.models import User
+from members.models import MemberProfile
+from volunteering.models import Opportunity
+
+from .index import SOURCES, term_weights
+from .models import MatchDocument
+from .recommend import _cache_keys, collection_stats, top_matches
+
+
+@override_settings(MATCH_LOCATION_WEIGHT=0)
+class TopMatchesTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tutoring = Opportunity.objects.create(title="Math tutoring", description="Tutoring math for pupils")
+            self.garden = Opportunity.objects.create(title="Community garden", description="Garden planting and tutoring")
+            self.kitchen = Opportunity.objects.create(title="Soup kitchen", description="Cooking meals")
+            user = User.objects.create_user(email="volunteer@example.org")
+            self.member = MemberProfile.objects.create(user=user, skills="math, tutoring")
+
+    def expected_cosine(self, opportunity):
+        opportunities = Opportunity.objects.all()
+        _, fields = SOURCES[MatchDocument.KIND_OPPORTUNITY]
+        vectors = {obj.pk: term_weights(obj, fields) for obj in opportunities}
+        query = term_weights(self.member, SOURCES[MatchDocument.KIND_MEMBER][1])
+        total = len(vectors)
+
+        def idf(term):
+            return math.log((total + 1) / (sum(term in vector for vector in vectors.values()) + 1)) + 1
+
+        target = {term: weight * idf(term) for term, weight in vectors[opportunity.pk].items()}
+        query = {term: weight * idf(term) for term, weight in query.items()}
+        dot = sum(weight * target.get(term, 0.0) for term, weight in query.items())
+        return dot / (math.sqrt(sum(w * w for w in query.values())) * math.sqrt(sum(w * w for w in target.values())))
+
+    def test_ranking_and_scores_are_tf_idf_cosine(self):
+        matches = top_matches(MatchDocument.KIND_MEMBER, [self.member.pk], 10)[self.member.pk]
+        self.assertEqual([target_id for target_id, _ in matches], [self.tutoring.pk, self.garden.pk])
+        for target_id, score in matches:
+            self.assertGreaterEqual(score, 0)
+            self.assertLessEqual(score, 1)
+            self.assertAlmostEqual(score, self.expected_cosine(Opportunity.objects.get(pk=target_id)), places=4)
+
+    def test_target_changes_keep_cached_recommendations_and_stats(self):
+        key = _cache_keys(MatchDocument.KIND_MEMBER, [self.member.pk], 10)[self.member.pk]
+        collection_stats(MatchDocument.KIND_OPPORTUNITY)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.kitchen.description = "Cooking meals and math tutoring"
+            self.kitchen.save()
+        self.assertEqual(_cache_keys(MatchDocument.KIND_MEMBER, [self.member.pk], 10)[self.member.pk], key)
+        with self.assertNumQueries(0):
+            collection_stats(MatchDocument.KIND_OPPORTUNITY)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.member.skills = "cooking"
+            self.member.save()
+        self.assertNotEqual(_cache_keys(MatchDocument.KIND_MEMBER, [self.member.pk], 10)[self.member.pk], key)
+
+    def test_targets_indexed_after_the_stats_are_still_scored(self):
+        collection_stats(MatchDocument.KIND_OPPORTUNITY)
+        with self.captureOnCommitCallbacks(execute=True):
+            reading = Opportunity.objects.create(title="Reading help", description="Tutoring reading and math")
+        scores = dict(top_matches(MatchDocument.KIND_MEMBER, [self.member.pk], 10)[self.member.pk])
+        self.assertIn(reading.pk, scores)
+        self.assertLessEqual(scores[reading.pk], 1)
@@ -3,7 +3,7 @@ from django.urls import reverse
 from django.utils.html import format_html
 
 from educate_us_rise_us.admin_mixins import RichTextAdminMixin
-from .models import MemberProfile
+from .models import MemberProfile, Skill
 
 
 class AdminActionLinksMixin:
@@ -25,3 +25,11 @@ class MemberProfileAdmin(AdminActionLinksMixin, RichTextAdminMixin, admin.ModelA
     rich_text_fields = ("bio",)
     list_display = ["id", "user", "location", "skills", "photo", "action_links"]
     search_fields = ["user__email", "user__full_name", "location", "skills"]
+    list_filter = ["skill_tags"]
+
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    list_display = ["id", "name", "slug"]
+    search_fields = ["name", "slug"]
+    prepopulated_fields = {"slug": ("name",)}
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.2 on 2026-10-19 16:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='memberprofile',
+            name='bio_excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=280),
+        ),
+        migrations.AddField(
+            model_name='memberprofile',
+            name='bio_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='memberprofile',
+            name='bio_word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
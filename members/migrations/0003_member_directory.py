@@ -0,0 +1,84 @@
+# Generated by Django 6.0.2 on 2026-10-19 17:40
+
+import re
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+# Mirrors members.models.parse_skills/normalize_location at the time of this migration.
+SKILL_SEPARATORS = re.compile(r"[,;/|\n]+")
+
+
+def parse_skills(value):
+    skills = {}
+    for part in SKILL_SEPARATORS.split(value or ""):
+        name = " ".join(part.split())[:80]
+        slug = slugify(name, allow_unicode=True)
+        if slug and slug not in skills:
+            skills[slug] = name
+    return list(skills.items())
+
+
+def backfill_directory(apps, schema_editor):
+    """Parse every profile's skills string into tags and fill location_key, in bulk."""
+    MemberProfile = apps.get_model("members", "MemberProfile")
+    Skill = apps.get_model("members", "Skill")
+    Through = MemberProfile.skill_tags.through
+
+    profiles = []
+    profile_skills = {}
+    names = {}
+    for profile in MemberProfile.objects.only("id", "location", "skills").iterator(chunk_size=2000):
+        profile.location_key = " ".join((profile.location or "").split()).casefold()[:120]
+        profiles.append(profile)
+        parsed = parse_skills(profile.skills)
+        profile_skills[profile.pk] = [slug for slug, _ in parsed]
+        for slug, name in parsed:
+            names.setdefault(slug, name)
+
+    MemberProfile.objects.bulk_update(profiles, ["location_key"], batch_size=1000)
+    Skill.objects.bulk_create(
+        [Skill(slug=slug, name=name) for slug, name in names.items()], batch_size=1000, ignore_conflicts=True
+    )
+    skill_ids = dict(Skill.objects.values_list("slug", "id"))
+    Through.objects.bulk_create(
+        [
+            Through(memberprofile_id=profile_id, skill_id=skill_ids[slug])
+            for profile_id, slugs in profile_skills.items()
+            for slug in slugs
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0002_rich_text_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=80)),
+                ('slug', models.SlugField(allow_unicode=True, max_length=80, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='memberprofile',
+            name='location_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=120),
+        ),
+        migrations.AddField(
+            model_name='memberprofile',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, editable=False, related_name='members', to='members.skill'),
+        ),
+        migrations.RunPython(backfill_directory, migrations.RunPython.noop),
+    ]
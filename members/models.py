@@ -1,14 +1,77 @@
+import re
+
 from django.db import models
 from django.conf import settings
+from django.utils.text import slugify
+
+from educate_us_rise_us.richtext import EXCERPT_LENGTH, RichTextMixin
+
+
+SKILL_SEPARATORS = re.compile(r"[,;/|\n]+")
+
+
+def parse_skills(value):
+    """Split a free-text skills string into ``(slug, name)`` pairs, deduplicated."""
+    skills = {}
+    for part in SKILL_SEPARATORS.split(value or ""):
+        name = " ".join(part.split())[:80]
+        slug = slugify(name, allow_unicode=True)
+        if slug and slug not in skills:
+            skills[slug] = name
+    return list(skills.items())
+
+
+def normalize_location(value):
+    return " ".join((value or "").split()).casefold()
+
 
-class MemberProfile(models.Model):
+class Skill(models.Model):
+    name = models.CharField(max_length=80)
+    slug = models.SlugField(max_length=80, unique=True, allow_unicode=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class MemberProfile(RichTextMixin, models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='profile')
     bio = models.TextField(blank=True)
+    bio_html = models.TextField(blank=True, editable=False)
+    bio_excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False)
+    bio_word_count = models.PositiveIntegerField(default=0, editable=False)
     location = models.CharField(max_length=120, blank=True)
     skills = models.CharField(max_length=200, blank=True)
+    # Derived from location/skills on save so directory filters are index lookups.
+    location_key = models.CharField(max_length=120, blank=True, db_index=True, editable=False)
+    skill_tags = models.ManyToManyField(Skill, blank=True, related_name='members', editable=False)
     photo = models.ImageField(upload_to='profiles/', blank=True, null=True)
 
+    rich_text_fields = ("bio",)
+    search_fields = ("user__full_name", "user__email", "bio", "location", "skills")
+
     def __str__(self):
         return self.user.email
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        self.location_key = normalize_location(self.location)[:120]
+        if update_fields is not None and 'location' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'location_key'}
+        super().save(*args, **kwargs)
+        if update_fields is None or 'skills' in update_fields:
+            self.sync_skill_tags()
+
+    def sync_skill_tags(self):
+        """Point ``skill_tags`` at the skills parsed from ``skills``, creating new ones."""
+        parsed = dict(parse_skills(self.skills))
+        if parsed:
+            Skill.objects.bulk_create(
+                [Skill(slug=slug, name=name) for slug, name in parsed.items()],
+                ignore_conflicts=True,
+            )
+        self.skill_tags.set(Skill.objects.filter(slug__in=parsed).values_list('pk', flat=True))
+
 # Create your models here.
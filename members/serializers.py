@@ -8,10 +8,25 @@ class MemberProfileSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(source="user.email", read_only=True)
     photo_url = serializers.SerializerMethodField(read_only=True)
     user_id = serializers.IntegerField(source="user.id", read_only=True)
+    skill_tags = serializers.SlugRelatedField(many=True, read_only=True, slug_field="name")
 
     class Meta:
         model = MemberProfile
-        fields = ["id", "user_id", "full_name", "email", "bio", "location", "skills", "photo", "photo_url"]
+        fields = [
+            "id",
+            "user_id",
+            "full_name",
+            "email",
+            "bio",
+            "bio_html",
+            "bio_excerpt",
+            "bio_word_count",
+            "location",
+            "skills",
+            "skill_tags",
+            "photo",
+            "photo_url",
+        ]
 
     def get_photo_url(self, obj):
         if not obj.photo:
@@ -0,0 +1,5 @@
+from search.index import register_search_model
+
+from .models import MemberProfile
+
+register_search_model(MemberProfile)
@@ -1,3 +1,65 @@
+from importlib import import_module
+
+from django.apps import apps
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+
+from .models import MemberProfile, Skill
+
+backfill_directory = import_module('members.migrations.0003_member_directory').backfill_directory
+
+
+class SkillTagTests(TestCase):
+    def profile(self, email, **fields):
+        return MemberProfile.objects.create(user=User.objects.create_user(email=email), **fields)
+
+    def slugs(self, profile):
+        return set(profile.skill_tags.values_list('slug', flat=True))
+
+    def test_save_syncs_tags_from_the_skills_string(self):
+        first = self.profile('a@example.org', skills='Maths, English; maths / Public  Speaking')
+        second = self.profile('b@example.org', skills='english')
+        self.assertEqual(self.slugs(first), {'maths', 'english', 'public-speaking'})
+        self.assertEqual(self.slugs(second), {'english'})
+        self.assertEqual(Skill.objects.filter(slug='english').count(), 1)
+
+        first.skills = 'Cooking'
+        first.save(update_fields=['skills'])
+        self.assertEqual(self.slugs(first), {'cooking'})
+
+        first.skills = 'Gardening'
+        first.save(update_fields=['bio'])
+        self.assertEqual(self.slugs(first), {'cooking'})
+
+    def test_location_key_follows_location(self):
+        profile = self.profile('a@example.org', location='  Nairobi   West ')
+        self.assertEqual(profile.location_key, 'nairobi west')
+        profile.location = 'Kisumu'
+        profile.save(update_fields=['location'])
+        profile.refresh_from_db()
+        self.assertEqual(profile.location_key, 'kisumu')
+
+    def test_directory_filters_use_tags_and_location_key(self):
+        both = self.profile('a@example.org', skills='maths, english', location='Nairobi')
+        self.profile('b@example.org', skills='maths', location='Nairobi')
+        client = APIClient()
+        client.force_authenticate(User.objects.create_superuser(email='admin@example.org'))
+        response = client.get('/api/members/', {'skill': 'Maths,English', 'location': 'NAIROBI'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row['id'] for row in response.json()['results']], [both.pk])
+
+    def test_backfill_rebuilds_tags_and_location_keys(self):
+        first = self.profile('a@example.org', skills='Maths, English', location='Nairobi  West')
+        second = self.profile('b@example.org', skills='english')
+        MemberProfile.skill_tags.through.objects.all().delete()
+        Skill.objects.all().delete()
+        MemberProfile.objects.update(location_key='')
+
+        backfill_directory(apps, None)
 
-# Create your tests here.
+        self.assertEqual(self.slugs(first), {'maths', 'english'})
+        self.assertEqual(self.slugs(second), {'english'})
+        first.refresh_from_db()
+        self.assertEqual(first.location_key, 'nairobi west')
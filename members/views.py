@@ -5,14 +5,28 @@ from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
-from .models import MemberProfile
+from applications.pagination import AdminPagination
+from matching.models import MatchDocument
+from matching.recommend import recommendations, requested_k
+from search.filters import FullTextSearchFilter, RankedOrderingFilter
+
+from volunteering.models import Opportunity
+from volunteering.serializers import OpportunitySerializer
+
+from .models import MemberProfile, normalize_location, parse_skills
 from .serializers import MemberProfileSerializer
 
 
 class MemberProfileViewSet(viewsets.ModelViewSet):
-    queryset = MemberProfile.objects.select_related('user').all()
+    queryset = MemberProfile.objects.select_related('user').prefetch_related('skill_tags')
     serializer_class = MemberProfileSerializer
     parser_classes = [MultiPartParser, FormParser, JSONParser]
+    pagination_class = AdminPagination
+    pagination_mode = 'estimate'
+    filter_backends = [FullTextSearchFilter, RankedOrderingFilter]
+    search_fields = MemberProfile.search_fields
+    ordering_fields = ['id', 'location_key', 'user__full_name', 'user__email']
+    ordering = ['id']
 
     def get_permissions(self):
         if self.action in ['list', 'retrieve', 'create', 'update', 'partial_update', 'destroy']:
@@ -21,6 +35,19 @@ class MemberProfileViewSet(viewsets.ModelViewSet):
             return [IsAuthenticated()]
         return [IsAuthenticated()]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action != 'list':
+            return queryset
+        # ``?skill=maths,english`` needs every listed skill; each one is a
+        # seek on the skill slug and the join table.
+        for slug, _ in parse_skills(self.request.query_params.get('skill')):
+            queryset = queryset.filter(skill_tags__slug=slug)
+        location = normalize_location(self.request.query_params.get('location'))
+        if location:
+            queryset = queryset.filter(location_key=location)
+        return queryset
+
     def perform_create(self, serializer):
         user_id = self.request.data.get('user_id')
         if user_id:
@@ -43,3 +70,19 @@ class MemberProfileViewSet(viewsets.ModelViewSet):
             request.user.full_name = full_name
             request.user.save(update_fields=['full_name'])
         return Response(serializer.data)
+
+    @action(detail=False, methods=['get'], url_path='me/recommendations', permission_classes=[IsAuthenticated])
+    def recommendations(self, request):
+        """Active opportunities matching the caller's skills and location, best first."""
+        profile, _ = MemberProfile.objects.get_or_create(user=request.user)
+        matches = recommendations(MatchDocument.KIND_MEMBER, profile.pk, requested_k(request))
+        # Cached matches can outlive a deactivation; only show what is still active.
+        opportunities = Opportunity.objects.filter(is_active=True).in_bulk(
+            [opportunity_id for opportunity_id, _ in matches]
+        )
+        context = self.get_serializer_context()
+        return Response([
+            {'score': score, 'opportunity': OpportunitySerializer(opportunities[opportunity_id], context=context).data}
+            for opportunity_id, score in matches
+            if opportunity_id in opportunities
+        ])
@@ -0,0 +1,61 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import MailCampaign, OutboxEmail
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ["id", "subject", "recipients", "status", "attempts", "next_attempt_at", "sent_at", "created_at"]
+    list_filter = ["status", "created_at", "sent_at"]
+    search_fields = ["subject", "body", "last_error"]
+    readonly_fields = ["attempts", "last_error", "sent_at", "created_at"]
+    actions = ["retry_now"]
+
+    @admin.display(description="To")
+    def recipients(self, obj):
+        return ", ".join(obj.to)
+
+    @admin.action(description="Retry selected emails now")
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status=OutboxEmail.STATUS_SENT).update(
+            status=OutboxEmail.STATUS_PENDING,
+            attempts=0,
+            next_attempt_at=timezone.now(),
+        )
+        self.message_user(request, f"Queued {updated} email(s) for delivery.")
+
+
+@admin.register(MailCampaign)
+class MailCampaignAdmin(admin.ModelAdmin):
+    list_display = [
+        "id",
+        "name",
+        "audience",
+        "status",
+        "total_recipients",
+        "sent_count",
+        "failed_count",
+        "created_by",
+        "created_at",
+        "finished_at",
+    ]
+    list_filter = ["status", "audience", "created_at"]
+    search_fields = ["name", "subject_template"]
+    readonly_fields = [
+        "audience",
+        "filters",
+        "total_recipients",
+        "sent_count",
+        "failed_count",
+        "created_by",
+        "created_at",
+        "started_at",
+        "finished_at",
+    ]
+    actions = ["cancel_campaigns"]
+
+    @admin.action(description="Cancel selected campaigns")
+    def cancel_campaigns(self, request, queryset):
+        updated = queryset.filter(status__in=MailCampaign.ACTIVE_STATUSES).update(status=MailCampaign.STATUS_CANCELLED)
+        self.message_user(request, f"Cancelled {updated} campaign(s).")
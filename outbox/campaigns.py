@@ -0,0 +1,180 @@
+import logging
+from itertools import islice
+
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.db import transaction
+from django.db.models import F
+from django.template import Context, Template
+from django.utils import timezone
+
+from .delivery import Throttle, claim_due, close_connection, lease_seconds, open_connection, retry_delay
+from .models import MailCampaign, MailCampaignRecipient
+
+logger = logging.getLogger(__name__)
+
+
+def create_campaign(queryset, fields, **attrs):
+    """Create a campaign addressed to every row of ``queryset``.
+
+    ``fields`` are the columns copied into each recipient's template
+    context and must include ``email``. Duplicate addresses are sent once.
+    """
+    chunk_size = int(getattr(settings, "MAIL_CAMPAIGN_CHUNK_SIZE", 200))
+    rows = queryset.order_by().values(*fields).iterator(chunk_size=chunk_size)
+
+    with transaction.atomic():
+        campaign = MailCampaign.objects.create(audience=queryset.model._meta.label_lower, **attrs)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            MailCampaignRecipient.objects.bulk_create(
+                [
+                    MailCampaignRecipient(campaign=campaign, email=row["email"], context=row)
+                    for row in chunk
+                    if row.get("email")
+                ],
+                ignore_conflicts=True,
+            )
+        campaign.total_recipients = campaign.recipients.count()
+        if not campaign.total_recipients:
+            campaign.status = MailCampaign.STATUS_COMPLETED
+            campaign.finished_at = timezone.now()
+        campaign.save(update_fields=["total_recipients", "status", "finished_at"])
+    return campaign
+
+
+class _Renderer:
+    def __init__(self, campaign):
+        self.subject = Template(campaign.subject_template)
+        self.body = Template(campaign.body_template)
+
+    def render(self, recipient):
+        context = Context(recipient.context, autoescape=False)
+        subject = " ".join(self.subject.render(context).split())
+        return subject[:255], self.body.render(context)
+
+
+def deliver_campaign_chunk(campaign, connection, throttle=None, chunk_size=None, max_attempts=None):
+    """Render and send one chunk of due recipients over ``connection``.
+
+    Recipients are leased with :func:`~outbox.delivery.claim_due` and
+    committed before the throttled sends, so no row lock is held while
+    waiting on the rate limit or SMTP. The chunk is capped to what the
+    throttle can send in half a lease. Recipient state is written back with
+    a single ``bulk_update``. Returns ``(sent, failed)``, or ``None`` if
+    nothing was due.
+    """
+    chunk_size = chunk_size or int(getattr(settings, "MAIL_CAMPAIGN_CHUNK_SIZE", 200))
+    max_attempts = max_attempts or int(getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5))
+    throttle = throttle or Throttle(0)
+    if throttle.interval:
+        chunk_size = max(min(chunk_size, int(lease_seconds() / 2 / throttle.interval)), 1)
+    renderer = _Renderer(campaign)
+    from_email = campaign.from_email or getattr(settings, "DEFAULT_FROM_EMAIL", "") or None
+    sent = failed = 0
+
+    recipients = claim_due(MailCampaignRecipient.objects.filter(campaign=campaign), chunk_size)
+    if not recipients:
+        return None
+
+    for recipient in recipients:
+        recipient.attempts += 1
+        try:
+            subject, body = renderer.render(recipient)
+            throttle.wait()
+            message = EmailMessage(subject, body, from_email, [recipient.email], connection=connection)
+            connection.send_messages([message])
+        except Exception as exc:
+            recipient.last_error = str(exc)[:2000]
+            if recipient.attempts >= max_attempts:
+                recipient.status = MailCampaignRecipient.STATUS_FAILED
+                failed += 1
+            else:
+                recipient.next_attempt_at = timezone.now() + retry_delay(recipient.attempts)
+            # The server may have dropped us; reconnect before the next recipient.
+            close_connection(connection)
+            try:
+                connection.open()
+            except Exception as open_exc:
+                logger.warning("Could not reopen email connection: %s", open_exc)
+        else:
+            recipient.status = MailCampaignRecipient.STATUS_SENT
+            recipient.sent_at = timezone.now()
+            recipient.last_error = ""
+            sent += 1
+
+    with transaction.atomic():
+        MailCampaignRecipient.objects.bulk_update(
+            recipients, ["status", "attempts", "next_attempt_at", "last_error", "sent_at"]
+        )
+        MailCampaign.objects.filter(pk=campaign.pk).update(
+            sent_count=F("sent_count") + sent,
+            failed_count=F("failed_count") + failed,
+        )
+    return sent, failed
+
+
+def start_campaign(campaign):
+    if campaign.status == MailCampaign.STATUS_QUEUED:
+        MailCampaign.objects.filter(pk=campaign.pk, status=MailCampaign.STATUS_QUEUED).update(
+            status=MailCampaign.STATUS_SENDING,
+            started_at=timezone.now(),
+        )
+        campaign.status = MailCampaign.STATUS_SENDING
+
+
+def finish_if_done(campaign):
+    if campaign.recipients.filter(status=MailCampaignRecipient.STATUS_PENDING).exists():
+        return False
+    MailCampaign.objects.filter(pk=campaign.pk, status__in=MailCampaign.ACTIVE_STATUSES).update(
+        status=MailCampaign.STATUS_COMPLETED,
+        finished_at=timezone.now(),
+    )
+    return True
+
+
+def next_due_campaign():
+    return (
+        MailCampaign.objects.filter(
+            status__in=MailCampaign.ACTIVE_STATUSES,
+            recipients__status=MailCampaignRecipient.STATUS_PENDING,
+            recipients__next_attempt_at__lte=timezone.now(),
+        )
+        .order_by("id")
+        .first()
+    )
+
+
+def is_active(campaign):
+    return MailCampaign.objects.filter(pk=campaign.pk, status__in=MailCampaign.ACTIVE_STATUSES).exists()
+
+
+def run_campaign(campaign, rate=None, chunk_size=None):
+    """Send every due recipient of ``campaign`` over one pooled connection.
+
+    Stops early if the campaign is cancelled between chunks. Recipients that
+    failed and are waiting on a retry keep the campaign open; running it again
+    later resumes where it left off. Returns ``(sent, failed)``.
+    """
+    if rate is None:
+        rate = float(getattr(settings, "MAIL_CAMPAIGN_RATE_PER_SECOND", 5))
+    throttle = Throttle(rate)
+    total_sent = total_failed = 0
+
+    start_campaign(campaign)
+    connection, _ = open_connection()
+    if connection is None:
+        return total_sent, total_failed
+    try:
+        while is_active(campaign):
+            result = deliver_campaign_chunk(campaign, connection, throttle, chunk_size)
+            if result is None:
+                break
+            total_sent += result[0]
+            total_failed += result[1]
+    finally:
+        close_connection(connection)
+    finish_if_done(campaign)
+    return total_sent, total_failed
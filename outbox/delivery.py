@@ -0,0 +1,134 @@
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+
+def retry_delay(attempts):
+    base = int(getattr(settings, "EMAIL_OUTBOX_RETRY_BASE_SECONDS", 60))
+    ceiling = int(getattr(settings, "EMAIL_OUTBOX_RETRY_MAX_SECONDS", 3600))
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), ceiling))
+
+
+def lease_seconds():
+    return int(getattr(settings, "EMAIL_OUTBOX_LEASE_SECONDS", 600))
+
+
+def claim_due(queryset, limit, ordering=("id",)):
+    """Lease up to ``limit`` pending, due rows of ``queryset`` and commit.
+
+    The rows are locked with ``SKIP LOCKED`` only while ``next_attempt_at``
+    is pushed ``EMAIL_OUTBOX_LEASE_SECONDS`` ahead, so other workers skip
+    them but no lock is held while mail is sent. A worker that dies
+    mid-batch leaves its rows to be picked up again once the lease expires.
+    """
+    model = queryset.model
+    with transaction.atomic():
+        rows = list(
+            queryset.select_for_update(skip_locked=True)
+            .filter(status=model.STATUS_PENDING, next_attempt_at__lte=timezone.now())
+            .order_by(*ordering)[:limit]
+        )
+        if rows:
+            model.objects.filter(pk__in=[row.pk for row in rows]).update(
+                next_attempt_at=timezone.now() + timedelta(seconds=lease_seconds())
+            )
+    return rows
+
+
+class Throttle:
+    """Space out sends so no more than ``rate`` go out per second (0 = unlimited)."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_at = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        if now < self.next_at:
+            time.sleep(self.next_at - now)
+            now = self.next_at
+        self.next_at = now + self.interval
+
+
+def open_connection():
+    """Return ``(connection, error)``; ``connection`` is ``None`` if it could not be opened."""
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as exc:
+        logger.warning("Could not open email connection: %s", exc)
+        return None, str(exc)
+    return connection, ""
+
+
+def close_connection(connection):
+    if connection is None:
+        return
+    try:
+        connection.close()
+    except Exception:
+        pass
+
+
+def _to_message(email, connection):
+    return EmailMessage(
+        subject=email.subject,
+        body=email.body,
+        from_email=email.from_email or None,
+        to=email.to,
+        connection=connection,
+    )
+
+
+def deliver_batch(batch_size=None, max_attempts=None):
+    """Send one batch of due outbox rows over a single SMTP connection.
+
+    The batch is leased with :func:`claim_due` and committed before the
+    SMTP connection is opened, so several workers can drain the outbox
+    without sending anything twice or holding row locks across the network.
+    Results are written back afterwards. Returns ``(sent, failed)``.
+    """
+    batch_size = batch_size or int(getattr(settings, "EMAIL_OUTBOX_BATCH_SIZE", 50))
+    max_attempts = max_attempts or int(getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5))
+    sent = failed = 0
+
+    emails = claim_due(OutboxEmail.objects.all(), batch_size, ordering=("next_attempt_at", "id"))
+    if not emails:
+        return sent, failed
+
+    connection, open_error = open_connection()
+    try:
+        for email in emails:
+            email.attempts += 1
+            try:
+                if connection is None:
+                    raise RuntimeError(open_error)
+                connection.send_messages([_to_message(email, connection)])
+            except Exception as exc:
+                failed += 1
+                email.last_error = str(exc)[:2000]
+                if email.attempts >= max_attempts:
+                    email.status = OutboxEmail.STATUS_FAILED
+                else:
+                    email.next_attempt_at = timezone.now() + retry_delay(email.attempts)
+            else:
+                sent += 1
+                email.status = OutboxEmail.STATUS_SENT
+                email.sent_at = timezone.now()
+                email.last_error = ""
+    finally:
+        close_connection(connection)
+
+    OutboxEmail.objects.bulk_update(emails, ["status", "attempts", "next_attempt_at", "last_error", "sent_at"])
+    return sent, failed
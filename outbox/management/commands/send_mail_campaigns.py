@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from outbox.campaigns import run_campaign
+from outbox.models import MailCampaign
+
+
+class Command(BaseCommand):
+    help = "Send (or resume) active mail campaigns."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--campaign", type=int, default=None, help="Only send this campaign id.")
+        parser.add_argument("--rate", type=float, default=None, help="Maximum emails per second (0 = unlimited).")
+        parser.add_argument("--chunk-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        campaigns = MailCampaign.objects.filter(status__in=MailCampaign.ACTIVE_STATUSES).order_by("id")
+        if options["campaign"] is not None:
+            campaigns = campaigns.filter(pk=options["campaign"])
+            if not campaigns.exists():
+                raise CommandError(f"No active campaign with id {options['campaign']}.")
+
+        for campaign in campaigns:
+            sent, failed = run_campaign(campaign, rate=options["rate"], chunk_size=options["chunk_size"])
+            campaign.refresh_from_db()
+            self.stdout.write(
+                f"{campaign.name}: sent {sent}, failed {failed} this run "
+                f"({campaign.sent_count}/{campaign.total_recipients} delivered, status {campaign.status})."
+            )
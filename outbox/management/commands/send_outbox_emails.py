@@ -0,0 +1,61 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from outbox.campaigns import deliver_campaign_chunk, finish_if_done, next_due_campaign, start_campaign
+from outbox.delivery import Throttle, close_connection, deliver_batch, open_connection
+
+
+class Command(BaseCommand):
+    help = "Deliver queued outbox emails in batches over a reused SMTP connection."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--max-attempts", type=int, default=None)
+        parser.add_argument("--loop", action="store_true", help="Keep polling for new emails.")
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds to sleep when the outbox is empty.")
+        parser.add_argument(
+            "--skip-campaigns",
+            action="store_true",
+            help="Only deliver transactional emails, not mail campaign chunks.",
+        )
+
+    def handle(self, *args, **options):
+        total_sent = total_failed = 0
+        throttle = Throttle(float(getattr(settings, "MAIL_CAMPAIGN_RATE_PER_SECOND", 5)))
+        campaign_connection = None
+        try:
+            while True:
+                sent, failed = deliver_batch(options["batch_size"], options["max_attempts"])
+
+                # Transactional mail goes first; campaigns get one chunk per
+                # pass so a large mailing never delays a booking confirmation.
+                campaign = None if options["skip_campaigns"] else next_due_campaign()
+                if campaign is not None:
+                    if campaign_connection is None:
+                        campaign_connection, _ = open_connection()
+                    if campaign_connection is not None:
+                        start_campaign(campaign)
+                        result = deliver_campaign_chunk(
+                            campaign, campaign_connection, throttle, max_attempts=options["max_attempts"]
+                        )
+                        if result is not None:
+                            sent += result[0]
+                            failed += result[1]
+                        finish_if_done(campaign)
+
+                total_sent += sent
+                total_failed += failed
+                if sent or failed:
+                    self.stdout.write(f"Sent {sent}, failed {failed}.")
+                    continue
+                if not options["loop"]:
+                    break
+                close_connection(campaign_connection)
+                campaign_connection = None
+                time.sleep(options["interval"])
+        finally:
+            close_connection(campaign_connection)
+
+        self.stdout.write(self.style.SUCCESS(f"Outbox drained: {total_sent} sent, {total_failed} failed."))
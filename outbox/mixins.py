@@ -0,0 +1,37 @@
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from .campaigns import create_campaign
+from .serializers import MailCampaignCreateSerializer, MailCampaignSerializer
+
+
+class MailCampaignActionMixin:
+    """Adds ``POST <list-url>/mail-campaign/`` to an admin viewset.
+
+    The campaign targets exactly the rows the list endpoint would return for
+    the same query string. ``mail_campaign_fields`` are exposed to the
+    subject and body templates (e.g. ``{{ name }}``) and must include
+    ``email``.
+    """
+
+    mail_campaign_fields = ("email",)
+
+    @action(detail=False, methods=["post"], url_path="mail-campaign")
+    def mail_campaign(self, request, *args, **kwargs):
+        serializer = MailCampaignCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        queryset = self.filter_queryset(self.get_queryset())
+        campaign = create_campaign(
+            queryset,
+            self.mail_campaign_fields,
+            name=data["name"],
+            subject_template=data["subject"],
+            body_template=data["body"],
+            from_email=data["from_email"],
+            filters=request.query_params.dict(),
+            created_by=request.user,
+        )
+        return Response(MailCampaignSerializer(campaign).data, status=status.HTTP_201_CREATED)
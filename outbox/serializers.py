@@ -0,0 +1,56 @@
+from django.template import Template, TemplateSyntaxError
+from rest_framework import serializers
+
+from .models import MailCampaign, MailCampaignRecipient
+
+
+def _validate_template(value):
+    try:
+        Template(value)
+    except TemplateSyntaxError as exc:
+        raise serializers.ValidationError(f"Invalid template: {exc}")
+    return value
+
+
+class MailCampaignCreateSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=200)
+    subject = serializers.CharField(max_length=255, validators=[_validate_template])
+    body = serializers.CharField(validators=[_validate_template])
+    from_email = serializers.EmailField(required=False, allow_blank=True, default="")
+
+
+class MailCampaignSerializer(serializers.ModelSerializer):
+    created_by_email = serializers.EmailField(source="created_by.email", read_only=True, default=None)
+    pending_count = serializers.SerializerMethodField()
+
+    class Meta:
+        model = MailCampaign
+        fields = [
+            "id",
+            "name",
+            "audience",
+            "filters",
+            "subject_template",
+            "body_template",
+            "from_email",
+            "status",
+            "total_recipients",
+            "sent_count",
+            "failed_count",
+            "pending_count",
+            "created_by_email",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+    def get_pending_count(self, obj):
+        return max(obj.total_recipients - obj.sent_count - obj.failed_count, 0)
+
+
+class MailCampaignRecipientSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = MailCampaignRecipient
+        fields = ["id", "email", "status", "attempts", "next_attempt_at", "last_error", "sent_at"]
+        read_only_fields = fields
@@ -0,0 +1,110 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.core.mail import get_connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from applications.models import ContactMessage
+
+from .campaigns import create_campaign, deliver_campaign_chunk, run_campaign, start_campaign
+from .delivery import claim_due, deliver_batch, retry_delay
+from .models import MailCampaign, MailCampaignRecipient, OutboxEmail
+
+
+@override_settings(
+    EMAIL_OUTBOX_LEASE_SECONDS=600,
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS=60,
+    EMAIL_OUTBOX_RETRY_MAX_SECONDS=300,
+    EMAIL_OUTBOX_MAX_ATTEMPTS=3,
+)
+class OutboxDeliveryTests(TestCase):
+    def setUp(self):
+        self.emails = [OutboxEmail.enqueue(f"Hello {i}", "Body", f"user{i}@example.org") for i in range(3)]
+
+    def test_claim_due_leases_rows_until_the_lease_expires(self):
+        first = claim_due(OutboxEmail.objects.all(), 2)
+        self.assertEqual([email.pk for email in first], [email.pk for email in self.emails[:2]])
+        leased = OutboxEmail.objects.filter(pk__in=[email.pk for email in first])
+        self.assertTrue(all(row.next_attempt_at > timezone.now() + timedelta(seconds=590) for row in leased))
+
+        self.assertEqual([email.pk for email in claim_due(OutboxEmail.objects.all(), 2)], [self.emails[2].pk])
+        self.assertEqual(claim_due(OutboxEmail.objects.all(), 2), [])
+
+        later = timezone.now() + timedelta(seconds=601)
+        with mock.patch("outbox.delivery.timezone.now", return_value=later):
+            self.assertEqual(len(claim_due(OutboxEmail.objects.all(), 10)), 3)
+
+    def test_retry_delay_doubles_up_to_the_ceiling(self):
+        self.assertEqual([retry_delay(n).total_seconds() for n in range(1, 5)], [60, 120, 240, 300])
+
+    def test_failed_sends_back_off_then_give_up(self):
+        with mock.patch("outbox.delivery.open_connection", return_value=(None, "SMTP down")):
+            self.assertEqual(deliver_batch(), (0, 3))
+            email = OutboxEmail.objects.get(pk=self.emails[0].pk)
+            self.assertEqual((email.status, email.attempts, email.last_error), (OutboxEmail.STATUS_PENDING, 1, "SMTP down"))
+            self.assertAlmostEqual((email.next_attempt_at - timezone.now()).total_seconds(), 60, delta=5)
+            # Not due again until the backoff has passed.
+            self.assertEqual(deliver_batch(), (0, 0))
+
+            OutboxEmail.objects.update(attempts=2, next_attempt_at=timezone.now())
+            self.assertEqual(deliver_batch(), (0, 3))
+        self.assertEqual(set(OutboxEmail.objects.values_list("status", flat=True)), {OutboxEmail.STATUS_FAILED})
+
+    def test_deliver_batch_sends_due_rows(self):
+        self.assertEqual(deliver_batch(), (3, 0))
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(set(OutboxEmail.objects.values_list("status", flat=True)), {OutboxEmail.STATUS_SENT})
+        self.assertEqual(deliver_batch(), (0, 0))
+
+
+class MailCampaignTests(TestCase):
+    def setUp(self):
+        for i in range(3):
+            ContactMessage.objects.create(name=f"Contact {i}", email=f"contact{i}@example.org", message="Hi")
+        ContactMessage.objects.create(name="Duplicate", email="contact0@example.org", message="Hi again")
+        self.campaign = create_campaign(
+            ContactMessage.objects.all(),
+            ["email", "name"],
+            name="Newsletter",
+            subject_template="News for {{ name }}",
+            body_template="Dear {{ name }}",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_superuser(email="admin@example.org"))
+
+    def url(self, action):
+        return f"/api/admin/mail-campaigns/{self.campaign.pk}/{action}/"
+
+    def test_recipients_are_frozen_and_deduplicated(self):
+        self.assertEqual(self.campaign.total_recipients, 3)
+        ContactMessage.objects.create(name="Late", email="late@example.org", message="Hi")
+        self.assertEqual(run_campaign(self.campaign, rate=0), (3, 0))
+        self.campaign.refresh_from_db()
+        self.assertEqual((self.campaign.status, self.campaign.sent_count), (MailCampaign.STATUS_COMPLETED, 3))
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), [f"contact{i}@example.org" for i in range(3)])
+        self.assertTrue(mail.outbox[0].subject.startswith("News for "))
+
+    def test_cancel_stops_delivery_and_resume_picks_up_where_it_left_off(self):
+        start_campaign(self.campaign)
+        connection = get_connection()
+        self.assertEqual(deliver_campaign_chunk(self.campaign, connection, chunk_size=1), (1, 0))
+
+        self.assertEqual(self.client.post(self.url("cancel")).json()["status"], MailCampaign.STATUS_CANCELLED)
+        self.campaign.refresh_from_db()
+        self.assertEqual(run_campaign(self.campaign, rate=0), (0, 0))
+        self.assertEqual(len(mail.outbox), 1)
+
+        failed = self.campaign.recipients.filter(status=MailCampaignRecipient.STATUS_PENDING).order_by("id").first()
+        MailCampaignRecipient.objects.filter(pk=failed.pk).update(status=MailCampaignRecipient.STATUS_FAILED, attempts=5)
+
+        response = self.client.post(self.url("resume")).json()
+        self.assertEqual((response["status"], response["retried"]), (MailCampaign.STATUS_SENDING, 1))
+        self.campaign.refresh_from_db()
+        self.assertEqual(run_campaign(self.campaign, rate=0), (2, 0))
+        self.campaign.refresh_from_db()
+        self.assertEqual((self.campaign.status, self.campaign.sent_count), (MailCampaign.STATUS_COMPLETED, 3))
+        self.assertEqual(len(mail.outbox), 3)
@@ -0,0 +1,9 @@
+from rest_framework.routers import DefaultRouter
+
+from .views import MailCampaignAdminViewSet
+
+router = DefaultRouter()
+router.include_format_suffixes = False
+router.register(r"admin/mail-campaigns", MailCampaignAdminViewSet, basename="admin-mail-campaigns")
+
+urlpatterns = router.urls
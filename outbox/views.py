@@ -0,0 +1,61 @@
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from applications.views import JWTAdminMixin
+
+from .models import MailCampaign, MailCampaignRecipient
+from .serializers import MailCampaignRecipientSerializer, MailCampaignSerializer
+
+
+class MailCampaignAdminViewSet(JWTAdminMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = MailCampaign.objects.select_related("created_by").all()
+    serializer_class = MailCampaignSerializer
+    search_fields = ["name", "subject_template"]
+    ordering_fields = ["created_at", "status", "name", "total_recipients"]
+    ordering = ["-created_at"]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        status_value = self.request.query_params.get("status")
+        if status_value in {choice for choice, _ in MailCampaign.STATUS_CHOICES}:
+            queryset = queryset.filter(status=status_value)
+        return queryset
+
+    @action(detail=True, methods=["get"])
+    def recipients(self, request, pk=None):
+        campaign = self.get_object()
+        queryset = campaign.recipients.all()
+        status_value = request.query_params.get("status")
+        if status_value in {choice for choice, _ in MailCampaignRecipient.STATUS_CHOICES}:
+            queryset = queryset.filter(status=status_value)
+        page = self.paginate_queryset(queryset)
+        serializer = MailCampaignRecipientSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=True, methods=["post"])
+    def cancel(self, request, pk=None):
+        campaign = self.get_object()
+        MailCampaign.objects.filter(pk=campaign.pk, status__in=MailCampaign.ACTIVE_STATUSES).update(
+            status=MailCampaign.STATUS_CANCELLED
+        )
+        campaign.refresh_from_db()
+        return Response(self.get_serializer(campaign).data)
+
+    @action(detail=True, methods=["post"])
+    def resume(self, request, pk=None):
+        """Re-queue a cancelled campaign, retrying recipients that failed permanently."""
+        campaign = self.get_object()
+        retried = campaign.recipients.filter(status=MailCampaignRecipient.STATUS_FAILED).update(
+            status=MailCampaignRecipient.STATUS_PENDING,
+            attempts=0,
+        )
+        MailCampaign.objects.filter(pk=campaign.pk).update(
+            status=MailCampaign.STATUS_SENDING if campaign.started_at else MailCampaign.STATUS_QUEUED,
+            failed_count=0,
+            finished_at=None,
+        )
+        campaign.refresh_from_db()
+        data = self.get_serializer(campaign).data
+        data["retried"] = retried
+        return Response(data)
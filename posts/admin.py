@@ -3,7 +3,8 @@ from django.urls import reverse
 from django.utils.html import format_html
 
 from educate_us_rise_us.admin_mixins import RichTextAdminMixin
-from .models import Post
+from search.mixins import FullTextAdminSearchMixin
+from .models import Post, PostComment
 
 
 class AdminActionLinksMixin:
@@ -21,8 +22,17 @@ class AdminActionLinksMixin:
 
 
 @admin.register(Post)
-class PostAdmin(AdminActionLinksMixin, RichTextAdminMixin, admin.ModelAdmin):
+class PostAdmin(FullTextAdminSearchMixin, AdminActionLinksMixin, RichTextAdminMixin, admin.ModelAdmin):
     rich_text_fields = ("content",)
-    list_display = ["id", "title", "author", "created_at", "action_links"]
+    list_display = ["id", "title", "author", "reaction_count", "comment_count", "created_at", "action_links"]
     search_fields = ["title", "content", "author__email"]
     list_filter = ["created_at"]
+
+
+@admin.register(PostComment)
+class PostCommentAdmin(AdminActionLinksMixin, admin.ModelAdmin):
+    list_display = ["id", "post", "author", "created_at", "action_links"]
+    search_fields = ["body", "author__email", "post__title"]
+    list_filter = ["created_at"]
+    list_select_related = ["post", "author"]
+    raw_id_fields = ["post", "author"]
@@ -0,0 +1,141 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from itertools import takewhile
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Case, Count, F, IntegerField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Greatest
+
+from educate_us_rise_us.content_cache import bump_counter_version
+
+from .models import Post, PostComment, PostReaction
+
+logger = logging.getLogger(__name__)
+
+COUNTER_SOURCES = {
+    'reaction_count': PostReaction,
+    'comment_count': PostComment,
+}
+
+_lock = threading.Lock()
+_pending = defaultdict(int)
+_last_direct_write = {}
+_timer = None
+
+
+def _update_posts(post_ids, **updates):
+    # The plain manager skips search reindexing, the updated_at stamp and the
+    # Post content version: a like is not an edit, so feeds and cached lists
+    # keep their entries. Only the counter version moves.
+    rows = Post._base_manager.filter(pk__in=post_ids).update(**updates)
+    if rows:
+        bump_counter_version('posts')
+    return rows
+
+
+def apply_deltas(deltas):
+    """Add ``{(post_id, counter): delta}`` to the counters in a single ``UPDATE``."""
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return 0
+    updates = {}
+    for field in COUNTER_SOURCES:
+        whens = [When(pk=post_id, then=Value(delta)) for (post_id, name), delta in deltas.items() if name == field]
+        if whens:
+            change = Case(*whens, default=Value(0), output_field=IntegerField())
+            # Never below zero, even if an increment was lost before a decrement.
+            updates[field] = Greatest(F(field) + change, Value(0))
+    return _update_posts({post_id for post_id, _ in deltas}, **updates)
+
+
+def flush_pending():
+    """Write buffered counter changes; returns the number of posts updated."""
+    global _timer
+    with _lock:
+        deltas = dict(_pending)
+        _pending.clear()
+        _timer = None
+        _prune_stamps(time.monotonic() - _flush_seconds())
+    try:
+        return apply_deltas(deltas)
+    except Exception:
+        with _lock:
+            for key, delta in deltas.items():
+                _pending[key] += delta
+        raise
+
+
+def _flush_in_background():
+    try:
+        flush_pending()
+    except Exception as exc:
+        logger.warning('Flushing post counters failed: %s', exc)
+    finally:
+        connection.close()
+
+
+def _prune_stamps(cutoff):
+    # Stamps are kept oldest first (see record_change), so expired ones are
+    # always at the front and pruning stops at the first live entry.
+    expired = [post_id for post_id, _ in takewhile(lambda item: item[1] < cutoff, _last_direct_write.items())]
+    for post_id in expired:
+        del _last_direct_write[post_id]
+
+
+def _flush_seconds():
+    return float(getattr(settings, 'POST_COUNTER_FLUSH_SECONDS', 2))
+
+
+def _buffer(post_id, field, delta):
+    global _timer
+    with _lock:
+        _pending[(post_id, field)] += delta
+        if _timer is None:
+            # Not a daemon, so short-lived processes still flush before exiting.
+            _timer = threading.Timer(_flush_seconds(), _flush_in_background)
+            _timer.start()
+
+
+def record_change(post_id, field, delta):
+    """Adjust one counter after a reaction or comment is added or removed.
+
+    The first change to a post is written straight away with an ``F()``
+    update in the caller's transaction. Further changes within
+    ``POST_COUNTER_FLUSH_SECONDS`` mark the post as hot: they are summed in
+    memory and flushed together after commit, one ``UPDATE`` per batch.
+    """
+    window = _flush_seconds()
+    now = time.monotonic()
+    with _lock:
+        _prune_stamps(now - window)
+        hot = window > 0 and post_id in _last_direct_write
+        if not hot:
+            # Re-insert so the dict stays ordered by stamp.
+            _last_direct_write.pop(post_id, None)
+            _last_direct_write[post_id] = now
+    if hot:
+        transaction.on_commit(lambda: _buffer(post_id, field, delta))
+    else:
+        apply_deltas({(post_id, field): delta})
+
+
+def _actual_count(model):
+    counts = model.objects.filter(post=OuterRef('pk')).order_by().values('post').annotate(total=Count('pk')).values('total')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def repair_counters(post_ids=None):
+    """Recompute the counters from the source tables; returns the posts corrected."""
+    actual = {field: _actual_count(model) for field, model in COUNTER_SOURCES.items()}
+    posts = Post.objects.all() if post_ids is None else Post.objects.filter(pk__in=post_ids)
+    drifted = Q()
+    for field in COUNTER_SOURCES:
+        drifted |= ~Q(**{field: F(f'actual_{field}')})
+    stale = posts.annotate(**{f'actual_{field}': expression for field, expression in actual.items()}).filter(drifted)
+    stale_ids = list(stale.values_list('pk', flat=True))
+    if not stale_ids:
+        return 0
+    return _update_posts(stale_ids, **actual)
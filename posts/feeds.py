@@ -0,0 +1,115 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils.feedgenerator import Atom1Feed, rfc3339_date
+
+from educate_us_rise_us.content_cache import content_versions, get_or_build, url_digest
+from educate_us_rise_us.renderers import default_json_renderer
+
+from .models import Post
+
+FEED_TITLE = 'EUTR News'
+JSON_FEED_VERSION = 'https://jsonfeed.org/version/1.1'
+CONTENT_TYPES = {
+    'atom': Atom1Feed.content_type,
+    'json': 'application/feed+json; charset=utf-8',
+}
+
+
+class PostAtomFeed(Atom1Feed):
+    """Atom feed with the sanitized post body as ``<content>`` next to the summary."""
+
+    def add_item_elements(self, handler, item):
+        super().add_item_elements(handler, item)
+        if item.get('content_html'):
+            handler.addQuickElement('content', item['content_html'], {'type': 'html'})
+
+
+def latest_posts():
+    limit = int(getattr(settings, 'POST_FEED_SIZE', 20))
+    return list(
+        Post.objects.select_related('author')
+        .only(
+            'id', 'title', 'content_html', 'content_excerpt', 'image', 'created_at', 'updated_at',
+            'author__full_name',
+        )
+        .order_by('-created_at', '-id')[:limit]
+    )
+
+
+def _entry_url(request, post):
+    return request.build_absolute_uri(reverse('posts-detail', args=[post.pk]))
+
+
+def build_atom_feed(request, posts):
+    feed = PostAtomFeed(
+        title=FEED_TITLE,
+        link=request.build_absolute_uri(reverse('posts-list')),
+        description='',
+        feed_url=request.build_absolute_uri(reverse('posts-feed-atom')),
+        author_name=FEED_TITLE,
+    )
+    for post in posts:
+        feed.add_item(
+            title=post.title,
+            link=_entry_url(request, post),
+            description=post.content_excerpt,
+            unique_id=_entry_url(request, post),
+            pubdate=post.created_at,
+            updateddate=post.updated_at,
+            author_name=post.author.full_name or None,
+            content_html=post.content_html,
+        )
+    return feed.writeString('utf-8').encode('utf-8')
+
+
+def build_json_feed(request, posts):
+    items = []
+    for post in posts:
+        item = {
+            'id': _entry_url(request, post),
+            'url': _entry_url(request, post),
+            'title': post.title,
+            'content_html': post.content_html,
+            'summary': post.content_excerpt,
+            'date_published': rfc3339_date(post.created_at),
+            'date_modified': rfc3339_date(post.updated_at),
+        }
+        if post.image:
+            item['image'] = request.build_absolute_uri(post.image.url)
+        if post.author.full_name:
+            item['authors'] = [{'name': post.author.full_name}]
+        items.append(item)
+    return default_json_renderer().render({
+        'version': JSON_FEED_VERSION,
+        'title': FEED_TITLE,
+        'home_page_url': request.build_absolute_uri(reverse('posts-list')),
+        'feed_url': request.build_absolute_uri(reverse('posts-feed-json')),
+        'items': items,
+    })
+
+
+BUILDERS = {'atom': build_atom_feed, 'json': build_json_feed}
+
+
+def post_feed_snapshot(request, fmt):
+    """Return ``(etag, body)`` for the current ``Post`` version.
+
+    Every post save/delete bumps the version, so each format is rendered once
+    per change and polling readers are answered from the cache. There is no
+    ``Last-Modified``: the newest ``updated_at`` does not move when a post is
+    deleted, so ``If-Modified-Since`` cannot tell that the feed changed.
+    """
+    key = f'posts-feed:{fmt}:{content_versions([Post])}:{url_digest(request, include_path=False)}'
+    snapshot = cache.get(key)
+    if snapshot is None:
+
+        def build():
+            posts = latest_posts()
+            body = BUILDERS[fmt](request, posts)
+            return f'"{hashlib.sha256(body).hexdigest()[:32]}"', body
+
+        snapshot = get_or_build(key, build)
+    return snapshot
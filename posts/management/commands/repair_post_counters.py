@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from posts.counters import repair_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute post reaction and comment counters from the source tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("post_ids", nargs="*", type=int, help="Limit to these post ids.")
+
+    def handle(self, *args, **options):
+        fixed = repair_counters(options["post_ids"] or None)
+        if fixed:
+            self.stdout.write(self.style.SUCCESS(f"Corrected counters on {fixed} post(s)."))
+        else:
+            self.stdout.write(self.style.SUCCESS("All post counters are accurate."))
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.2 on 2026-10-19 16:05
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+
+def backfill_excerpts(apps, schema_editor):
+    # Same rules as posts.models.build_excerpt at the time of this migration.
+    Post = apps.get_model("posts", "Post")
+    posts = list(Post.objects.only("id", "content"))
+    for post in posts:
+        text = " ".join(strip_tags(post.content or "").split())
+        if len(text) > 280:
+            cut = text[:279]
+            if " " in cut:
+                cut = cut.rsplit(" ", 1)[0]
+            text = cut.rstrip(" ,;:.") + "…"
+        post.excerpt = text
+    Post.objects.bulk_update(posts, ["excerpt"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0002_post_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=280),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-created_at', '-id'], name='post_feed_idx'),
+        ),
+        migrations.RunPython(backfill_excerpts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.2 on 2026-10-19 16:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0003_post_excerpt_and_feed_index'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='post',
+            old_name='excerpt',
+            new_name='content_excerpt',
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='content_word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -1,14 +1,85 @@
 from django.db import models
 from django.conf import settings
 
-class Post(models.Model):
+from educate_us_rise_us.content_cache import ContentQuerySet
+from educate_us_rise_us.richtext import EXCERPT_LENGTH, RichTextMixin
+
+
+COUNTER_FIELDS = ('reaction_count', 'comment_count')
+
+
+class Post(RichTextMixin, models.Model):
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='posts')
     title = models.CharField(max_length=200)
     content = models.TextField()
+    content_html = models.TextField(blank=True, editable=False)
+    content_excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False)
+    content_word_count = models.PositiveIntegerField(default=0, editable=False)
+    # Denormalized engagement counters, maintained by posts.counters.
+    reaction_count = models.PositiveIntegerField(default=0, editable=False)
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
     image = models.ImageField(upload_to='posts/', blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ContentQuerySet.as_manager()
+
+    rich_text_fields = ("content",)
+    search_fields = ("title", "content", "author__email")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="post_feed_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
-# Create your models here.
+    def save(self, *args, **kwargs):
+        # The counters are only written by posts.counters; a full save of a
+        # stale instance would otherwise overwrite changes made since it was loaded.
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+
+class PostReaction(models.Model):
+    KIND_CHOICES = [
+        ('like', 'Like'),
+        ('love', 'Love'),
+        ('celebrate', 'Celebrate'),
+        ('support', 'Support'),
+    ]
+
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='reactions')
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='post_reactions')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default='like')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'user'], name='post_reaction_unique_user'),
+        ]
+
+    def __str__(self):
+        return f'{self.user} {self.kind} {self.post}'
+
+
+class PostComment(models.Model):
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='comments')
+    author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='post_comments')
+    body = models.TextField(max_length=2000)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['post', 'created_at', 'id'], name='post_comment_thread_idx'),
+        ]
+
+    def __str__(self):
+        return f'Comment by {self.author} on {self.post}'
@@ -0,0 +1,19 @@
+from rest_framework.pagination import CursorPagination
+
+
+class PostFeedPagination(CursorPagination):
+    """Newest-first cursor pages keyed on ``(created_at, id)`` (``post_feed_idx``)."""
+
+    ordering = ("-created_at", "-id")
+    page_size = 20
+    page_size_query_param = "limit"
+    max_page_size = 100
+
+
+class PostCommentPagination(CursorPagination):
+    """Oldest-first comment threads keyed on ``(created_at, id)`` (``post_comment_thread_idx``)."""
+
+    ordering = ("created_at", "id")
+    page_size = 50
+    page_size_query_param = "limit"
+    max_page_size = 200
@@ -1,10 +1,48 @@
 from rest_framework import serializers
-from .models import Post
+from .models import Post, PostComment, PostReaction
 
 class PostSerializer(serializers.ModelSerializer):
     author_name = serializers.CharField(source='author.full_name', read_only=True)
 
     class Meta:
         model = Post
-        fields = ['id', 'title', 'content', 'image', 'created_at', 'author', 'author_name']
+        fields = [
+            'id', 'title', 'content', 'content_html', 'content_excerpt', 'content_word_count',
+            'image', 'created_at', 'author', 'author_name', 'reaction_count', 'comment_count',
+        ]
         read_only_fields = ['author', 'created_at']
+
+
+class PostFeedSerializer(serializers.ModelSerializer):
+    """Card representation for the feed: the stored excerpt instead of ``content``."""
+
+    author_name = serializers.CharField(source='author.full_name', read_only=True)
+    excerpt = serializers.CharField(source='content_excerpt', read_only=True)
+
+    class Meta:
+        model = Post
+        fields = [
+            'id', 'title', 'excerpt', 'content_word_count', 'image', 'created_at', 'author', 'author_name',
+            'reaction_count', 'comment_count',
+        ]
+        read_only_fields = fields
+
+
+class PostReactionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = PostReaction
+        fields = ['kind']
+
+
+class PostCommentSerializer(serializers.ModelSerializer):
+    author_name = serializers.CharField(source='author.full_name', read_only=True)
+
+    class Meta:
+        model = PostComment
+        fields = ['id', 'post', 'body', 'author', 'author_name', 'created_at', 'updated_at']
+        read_only_fields = ['author', 'created_at', 'updated_at']
+
+    def validate_post(self, value):
+        if self.instance is not None and value != self.instance.post:
+            raise serializers.ValidationError('Comments cannot be moved to another post.')
+        return value
@@ -0,0 +1,31 @@
+from django.db.models.signals import post_delete, post_save
+
+from educate_us_rise_us.content_cache import track_content_model
+from search.index import register_search_model
+
+from .models import Post, PostComment, PostReaction
+
+track_content_model(Post)
+register_search_model(Post)
+
+
+def _counter_receiver(field, delta):
+    def receiver(sender, instance, **kwargs):
+        if delta > 0 and not kwargs.get('created'):
+            return
+        from .counters import record_change
+
+        record_change(instance.post_id, field, delta)
+
+    return receiver
+
+
+_reaction_added = _counter_receiver('reaction_count', 1)
+_reaction_removed = _counter_receiver('reaction_count', -1)
+_comment_added = _counter_receiver('comment_count', 1)
+_comment_removed = _counter_receiver('comment_count', -1)
+
+post_save.connect(_reaction_added, sender=PostReaction, dispatch_uid='post-reaction-count-add')
+post_delete.connect(_reaction_removed, sender=PostReaction, dispatch_uid='post-reaction-count-remove')
+post_save.connect(_comment_added, sender=PostComment, dispatch_uid='post-comment-count-add')
+post_delete.connect(_comment_removed, sender=PostComment, dispatch_uid='post-comment-count-remove')
@@ -1,3 +1,86 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from educate_us_rise_us.content_cache import get_content_version
+
+from . import counters
+from .models import Post, PostComment, PostReaction
+
+
+@override_settings(POST_COUNTER_FLUSH_SECONDS=60)
+class PostCounterTests(TestCase):
+    def setUp(self):
+        # Buffered changes are flushed by hand instead of on a timer thread.
+        timer = mock.patch('posts.counters.threading.Timer')
+        timer.start()
+        self.addCleanup(timer.stop)
+        counters._pending.clear()
+        counters._last_direct_write.clear()
+        counters._timer = None
+        self.author = User.objects.create_user(email='author@example.org')
+        self.readers = [User.objects.create_user(email=f'reader{i}@example.org') for i in range(3)]
+        self.post = Post.objects.create(author=self.author, title='Hello', content='<p>Body</p>')
+
+    def react(self, user):
+        with self.captureOnCommitCallbacks(execute=True):
+            return PostReaction.objects.create(post=self.post, user=user)
+
+    def test_first_change_is_written_without_touching_updated_at_or_version(self):
+        updated_at = self.post.updated_at
+        version = get_content_version(Post)
+        self.react(self.readers[0])
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.reaction_count, 1)
+        self.assertEqual(self.post.updated_at, updated_at)
+        self.assertEqual(get_content_version(Post), version)
+
+    def test_hot_post_changes_are_buffered_until_flushed(self):
+        for reader in self.readers:
+            self.react(reader)
+        with self.captureOnCommitCallbacks(execute=True):
+            PostComment.objects.create(post=self.post, author=self.readers[0], body='Nice')
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.reaction_count, self.post.comment_count), (1, 0))
+
+        self.assertEqual(counters.flush_pending(), 1)
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.reaction_count, self.post.comment_count), (3, 1))
+        self.assertEqual(counters.flush_pending(), 0)
+
+    def test_cold_posts_do_not_accumulate_stamps(self):
+        self.react(self.readers[0])
+        self.assertIn(self.post.pk, counters._last_direct_write)
+        other = Post.objects.create(author=self.author, title='Other', content='<p>Body</p>')
+        with mock.patch('posts.counters.time.monotonic', return_value=counters.time.monotonic() + 120):
+            with self.captureOnCommitCallbacks(execute=True):
+                PostReaction.objects.create(post=other, user=self.readers[1])
+        self.assertEqual(list(counters._last_direct_write), [other.pk])
+
+    def test_full_save_keeps_counts_written_since_load(self):
+        stale = Post.objects.get(pk=self.post.pk)
+        self.react(self.readers[0])
+        stale.title = 'Edited'
+        stale.save()
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.title, self.post.reaction_count), ('Edited', 1))
+
+    def test_repair_counters_fixes_drift(self):
+        self.react(self.readers[0])
+        Post._base_manager.filter(pk=self.post.pk).update(reaction_count=7, comment_count=2)
+        self.assertEqual(counters.repair_counters(), 1)
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.reaction_count, self.post.comment_count), (1, 0))
+        self.assertEqual(counters.repair_counters(), 0)
+
+    def test_counter_change_moves_the_etag(self):
+        client = APIClient()
+        url = f'/api/posts/{self.post.pk}/'
+        etag = client.get(url)['ETag']
+        self.assertEqual(client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.react(self.readers[0])
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['reaction_count'], 1)
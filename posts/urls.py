@@ -1,8 +1,14 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import PostViewSet
+from .views import PostCommentViewSet, PostViewSet, post_feed
 
 router = DefaultRouter()
 router.include_format_suffixes = False
 router.register(r'posts', PostViewSet, basename='posts')
+router.register(r'post-comments', PostCommentViewSet, basename='post-comments')
 
-urlpatterns = router.urls
+urlpatterns = [
+    path('posts/feed.atom', post_feed, {'fmt': 'atom'}, name='posts-feed-atom'),
+    path('posts/feed.json', post_feed, {'fmt': 'json'}, name='posts-feed-json'),
+    *router.urls,
+]
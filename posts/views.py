@@ -1,14 +1,102 @@
-from rest_framework import viewsets
-from rest_framework.parsers import MultiPartParser, FormParser
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
-from .models import Post
-from .serializers import PostSerializer
-
-class PostViewSet(viewsets.ModelViewSet):
-    queryset = Post.objects.all().order_by('-created_at')
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.views.decorators.http import require_safe
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
+from educate_us_rise_us.content_cache import get_counter_version
+from educate_us_rise_us.http_cache import ConditionalGetMixin, apply_public_cache_headers
+
+from .feeds import CONTENT_TYPES, post_feed_snapshot
+from .models import Post, PostComment, PostReaction
+from .pagination import PostCommentPagination, PostFeedPagination
+from .serializers import PostCommentSerializer, PostFeedSerializer, PostReactionSerializer, PostSerializer
+
+class PostViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
+    queryset = Post.objects.select_related('author').order_by('-created_at', '-id')
     serializer_class = PostSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     parser_classes = [MultiPartParser, FormParser]
 
+    def get_cache_scope(self):
+        # Counter updates leave updated_at and the Post version alone, so the
+        # counter version keeps the validators from outliving stale counts.
+        return f'counters:{get_counter_version("posts")}'
+
+    def get_serializer_class(self):
+        if self.action == 'feed':
+            return PostFeedSerializer
+        if self.action == 'reaction':
+            return PostReactionSerializer
+        return super().get_serializer_class()
+
     def perform_create(self, serializer):
         serializer.save(author=self.request.user)
+
+    @action(detail=False, methods=['get'], pagination_class=PostFeedPagination)
+    def feed(self, request, *args, **kwargs):
+        """Cursor-paginated post cards (``?limit=``, ``?cursor=``), newest first."""
+        queryset = self.filter_queryset(self.get_queryset()).defer('content', 'content_html')
+
+        def respond():
+            page = self.paginate_queryset(queryset)
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        return self.conditional_response(request, queryset, respond)
+
+    @action(
+        detail=True,
+        methods=['post', 'delete'],
+        permission_classes=[IsAuthenticated],
+        parser_classes=[JSONParser, FormParser],
+    )
+    def reaction(self, request, pk=None):
+        """Set (``POST {"kind": ...}``) or remove (``DELETE``) the caller's reaction."""
+        post = self.get_object()
+        if request.method == 'DELETE':
+            # Delete instances rather than the queryset so the counter signals fire.
+            for existing in PostReaction.objects.filter(post=post, user=request.user):
+                existing.delete()
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        PostReaction.objects.update_or_create(post=post, user=request.user, defaults=serializer.validated_data)
+        return Response(serializer.data)
+
+
+class PostCommentViewSet(viewsets.ModelViewSet):
+    """Comments on posts; ``?post=<id>`` narrows the list to one thread."""
+
+    serializer_class = PostCommentSerializer
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = PostCommentPagination
+
+    def get_queryset(self):
+        queryset = PostComment.objects.select_related('author')
+        post_id = self.request.query_params.get('post')
+        if self.action == 'list' and post_id:
+            queryset = queryset.filter(post_id=post_id) if post_id.isdigit() else queryset.none()
+        return queryset
+
+    def perform_create(self, serializer):
+        serializer.save(author=self.request.user)
+
+    def check_object_permissions(self, request, obj):
+        super().check_object_permissions(request, obj)
+        if request.method not in ('GET', 'HEAD', 'OPTIONS') and obj.author_id != request.user.pk and not request.user.is_staff:
+            raise PermissionDenied('You can only change your own comments.')
+
+
+@require_safe
+def post_feed(request, fmt):
+    """``/api/posts/feed.atom`` and ``/api/posts/feed.json``: the latest posts for aggregators."""
+    etag, body = post_feed_snapshot(request, fmt)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(body, content_type=CONTENT_TYPES[fmt])
+    response['ETag'] = etag
+    return apply_public_cache_headers(response, [Post])
@@ -0,0 +1,31 @@
+from rest_framework import filters
+
+from .index import full_text_filter, is_registered
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """``SearchFilter`` drop-in that queries the full-text index.
+
+    Models without a registered search document fall back to the stock
+    ``icontains`` behaviour.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if not is_registered(queryset.model):
+            return super().filter_queryset(request, queryset, view)
+        term = request.query_params.get(self.search_param, "")
+        if not term.strip():
+            return queryset
+        return full_text_filter(queryset, term)
+
+
+class RankedOrderingFilter(filters.OrderingFilter):
+    """Order full-text results by relevance unless ``?ordering=`` is given."""
+
+    def get_default_ordering(self, view):
+        request = getattr(view, "request", None)
+        search_param = FullTextSearchFilter.search_param
+        if request is not None and request.query_params.get(search_param, "").strip():
+            if is_registered(view.get_queryset().model):
+                return ["-search_rank", "-pk"]
+        return super().get_default_ordering(view)
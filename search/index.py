@@ -0,0 +1,168 @@
+import re
+from itertools import islice
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.db.models import FloatField, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete, post_save
+from django.utils.html import strip_tags
+
+from .models import SearchDocument
+
+DOCUMENT_TABLE = "search_searchdocument"
+FTS_TABLE = "search_searchdocument_fts"
+
+_registry = {}
+
+
+def register_search_model(model, fields=None):
+    """Keep a search document for ``model`` built from ``fields``.
+
+    ``fields`` defaults to the model's ``search_fields`` attribute, which the
+    API viewsets also use, and may follow relations with ``__`` (e.g.
+    ``author__email``).
+    """
+    _registry[model] = tuple(model.search_fields if fields is None else fields)
+    label = model._meta.label_lower
+    post_save.connect(_index_saved, sender=model, dispatch_uid=f"search-index-save-{label}")
+    post_delete.connect(_remove_deleted, sender=model, dispatch_uid=f"search-index-delete-{label}")
+
+
+def is_registered(model):
+    return model in _registry
+
+
+def indexed_fields(model):
+    """Names of ``model``'s own fields whose changes alter its search document."""
+    return {path.split("__", 1)[0] for path in _registry.get(model, ())}
+
+
+def registered_models():
+    return list(_registry)
+
+
+def normalize(text):
+    return " ".join(re.findall(r"\w+", strip_tags(str(text or "")).lower()))
+
+
+def query_tokens(term):
+    return re.findall(r"\w+", (term or "").lower())
+
+
+def _resolve(obj, path):
+    value = obj
+    for part in path.split("__"):
+        value = getattr(value, part, None)
+        if value is None:
+            return ""
+    return value
+
+
+def build_document(obj):
+    return normalize(" ".join(str(_resolve(obj, path)) for path in _registry[type(obj)]))
+
+
+def _relations(model):
+    return sorted({path.rsplit("__", 1)[0] for path in _registry[model] if "__" in path})
+
+
+def index_objects(model, objects):
+    content_type = ContentType.objects.get_for_model(model)
+    documents = [
+        SearchDocument(content_type=content_type, object_id=obj.pk, body=build_document(obj))
+        for obj in objects
+        if obj.pk is not None
+    ]
+    SearchDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=["content_type", "object_id"],
+        update_fields=["body", "updated_at"],
+    )
+    return len(documents)
+
+
+def reindex_pks(model, pks, batch_size=500):
+    pks = iter(pks)
+    indexed = 0
+    while True:
+        batch = list(islice(pks, batch_size))
+        if not batch:
+            return indexed
+        objects = model._base_manager.filter(pk__in=batch).select_related(*_relations(model))
+        indexed += index_objects(model, objects)
+
+
+def remove_pks(model, pks):
+    content_type = ContentType.objects.get_for_model(model)
+    SearchDocument.objects.filter(content_type=content_type, object_id__in=list(pks)).delete()
+
+
+def _index_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    index_objects(sender, [instance])
+
+
+def _remove_deleted(sender, instance, **kwargs):
+    remove_pks(sender, [instance.pk])
+
+
+def _match_sql(vendor):
+    if vendor == "sqlite":
+        match = (
+            f"SELECT d.object_id FROM {DOCUMENT_TABLE} d JOIN {FTS_TABLE} f ON f.rowid = d.id "
+            f"WHERE d.content_type_id = %s AND {FTS_TABLE} MATCH %s"
+        )
+        rank = (
+            f"SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} f JOIN {DOCUMENT_TABLE} d ON f.rowid = d.id "
+            f"WHERE d.content_type_id = %s AND d.object_id = {{pk}} AND {FTS_TABLE} MATCH %s"
+        )
+        return match, rank
+    if vendor == "postgresql":
+        match = (
+            f"SELECT d.object_id FROM {DOCUMENT_TABLE} d "
+            "WHERE d.content_type_id = %s AND d.search_vector @@ to_tsquery('simple', %s)"
+        )
+        rank = (
+            f"SELECT ts_rank(d.search_vector, to_tsquery('simple', %s)) FROM {DOCUMENT_TABLE} d "
+            "WHERE d.content_type_id = %s AND d.object_id = {pk}"
+        )
+        return match, rank
+    return None, None
+
+
+def full_text_filter(queryset, term):
+    """Restrict ``queryset`` to rows matching ``term`` and annotate ``search_rank``."""
+    model = queryset.model
+    tokens = query_tokens(term)
+    if not tokens:
+        return queryset.none().annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+    content_type = ContentType.objects.get_for_model(model)
+    vendor = connection.vendor
+    match_sql, rank_sql = _match_sql(vendor)
+
+    if match_sql is None:
+        matches = SearchDocument.objects.filter(content_type=content_type)
+        for token in tokens:
+            matches = matches.filter(body__icontains=token)
+        return queryset.filter(pk__in=matches.values("object_id")).annotate(
+            search_rank=Value(0.0, output_field=FloatField())
+        )
+
+    pk_column = f'"{model._meta.db_table}"."{model._meta.pk.column}"'
+    rank_sql = rank_sql.replace("{pk}", pk_column)
+    if vendor == "sqlite":
+        query = " ".join(f'"{token}"*' for token in tokens)
+        match_params = (content_type.pk, query)
+        rank_params = (content_type.pk, query)
+    else:
+        query = " & ".join(f"{token}:*" for token in tokens)
+        match_params = (content_type.pk, query)
+        rank_params = (query, content_type.pk)
+
+    return queryset.filter(pk__in=RawSQL(match_sql, match_params)).annotate(
+        search_rank=RawSQL(rank_sql, rank_params, output_field=FloatField())
+    )
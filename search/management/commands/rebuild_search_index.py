@@ -0,0 +1,30 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from search.index import registered_models, reindex_pks
+
+
+class Command(BaseCommand):
+    help = "Rebuild full-text search documents for every registered model (or the ones given)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("models", nargs="*", help="Limit to these models, e.g. applications.Application.")
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows indexed per query.")
+
+    def handle(self, *args, **options):
+        targets = registered_models()
+        if options["models"]:
+            try:
+                targets = [apps.get_model(label) for label in options["models"]]
+            except (LookupError, ValueError) as exc:
+                raise CommandError(str(exc))
+            unknown = [model._meta.label for model in targets if model not in registered_models()]
+            if unknown:
+                raise CommandError(f"Not registered for search: {', '.join(unknown)}")
+
+        for model in targets:
+            pks = model._base_manager.values_list("pk", flat=True).order_by("pk")
+            indexed = reindex_pks(model, pks.iterator(), batch_size=options["batch_size"])
+            self.stdout.write(f"{model._meta.label}: {indexed} document(s) indexed")
+
+        self.stdout.write(self.style.SUCCESS("Search index rebuild completed."))
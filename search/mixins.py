@@ -0,0 +1,10 @@
+from .index import full_text_filter, is_registered
+
+
+class FullTextAdminSearchMixin:
+    """Route Django admin changelist search through the full-text index."""
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip() or not is_registered(queryset.model):
+            return super().get_search_results(request, queryset, search_term)
+        return full_text_filter(queryset, search_term), False
@@ -0,0 +1,24 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """Flattened, normalized text of one indexed row.
+
+    The full-text index lives beside this table: an FTS5 virtual table kept
+    in sync by triggers on SQLite, and a generated ``tsvector`` column with a
+    GIN index on PostgreSQL (see ``0001_initial``).
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    body = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["content_type", "object_id"], name="unique_search_document"),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type_id}:{self.object_id}"
@@ -0,0 +1,39 @@
+from django.db import models
+
+
+class SearchIndexedQuerySet(models.QuerySet):
+    """QuerySet whose bulk write paths keep search documents in sync.
+
+    ``save()`` and ``delete()`` are covered by signals; ``update()``,
+    ``bulk_create()`` and ``bulk_update()`` skip those, so they reindex the
+    affected rows here. Updates that touch no indexed field skip the reindex.
+    """
+
+    def update(self, **kwargs):
+        from .index import indexed_fields, reindex_pks
+
+        if indexed_fields(self.model).isdisjoint(kwargs):
+            return super().update(**kwargs)
+        pks = list(self.values_list("pk", flat=True))
+        rows = super().update(**kwargs)
+        if rows:
+            reindex_pks(self.model, pks)
+        return rows
+
+    update.alters_data = True
+
+    def bulk_create(self, objs, *args, **kwargs):
+        from .index import is_registered, reindex_pks
+
+        created = super().bulk_create(objs, *args, **kwargs)
+        if is_registered(self.model):
+            reindex_pks(self.model, [obj.pk for obj in created if obj.pk is not None])
+        return created
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        from .index import indexed_fields, reindex_pks
+
+        rows = super().bulk_update(objs, fields, *args, **kwargs)
+        if rows and not indexed_fields(self.model).isdisjoint(fields):
+            reindex_pks(self.model, [obj.pk for obj in objs])
+        return rows
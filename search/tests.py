@@ -0,0 +1,48 @@
+from django.test import TestCase
+
+from applications.models import ContactMessage
+
+from .index import full_text_filter
+
+
+class FullTextFilterTests(TestCase):
+    def message(self, text, name="Visitor"):
+        return ContactMessage.objects.create(name=name, email="visitor@example.org", message=text)
+
+    def search(self, term):
+        return list(
+            full_text_filter(ContactMessage.objects.all(), term).order_by("-search_rank", "pk").values_list("pk", flat=True)
+        )
+
+    def test_prefix_match_ranks_denser_documents_first(self):
+        sparse = self.message("garden cooking baking")
+        dense = self.message("garden garden garden")
+        self.message("cooking classes")
+        self.assertEqual(self.search("gard"), [dense.pk, sparse.pk])
+        self.assertEqual(self.search("garden cook"), [sparse.pk])
+        self.assertEqual(self.search("  "), [])
+
+    def test_rank_is_annotated(self):
+        self.message("garden")
+        (rank,) = full_text_filter(ContactMessage.objects.all(), "garden").values_list("search_rank", flat=True)
+        self.assertGreater(rank, 0)
+
+    def test_update_reindexes_only_when_an_indexed_field_changes(self):
+        message = self.message("garden")
+        ContactMessage.objects.filter(pk=message.pk).update(message="kitchen")
+        self.assertEqual(self.search("garden"), [])
+        self.assertEqual(self.search("kitchen"), [message.pk])
+
+        with self.assertNumQueries(1):
+            ContactMessage.objects.filter(pk=message.pk).update(is_resolved=True)
+
+    def test_bulk_create_and_bulk_update_are_indexed(self):
+        created = ContactMessage.objects.bulk_create(
+            [ContactMessage(name="Bulk", email="bulk@example.org", message=f"orchard {i}") for i in range(3)]
+        )
+        self.assertEqual(sorted(self.search("orchard")), sorted(obj.pk for obj in created))
+
+        created[0].message = "meadow"
+        ContactMessage.objects.bulk_update(created[:1], ["message"])
+        self.assertEqual(self.search("meadow"), [created[0].pk])
+        self.assertEqual(len(self.search("orchard")), 2)
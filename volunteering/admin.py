@@ -23,7 +23,7 @@ class AdminActionLinksMixin:
 @admin.register(Opportunity)
 class OpportunityAdmin(AdminActionLinksMixin, RichTextAdminMixin, admin.ModelAdmin):
     rich_text_fields = ("description",)
-    list_display = ["id", "title", "location", "start_date", "end_date", "is_active", "action_links"]
+    list_display = ["id", "title", "location", "start_date", "end_date", "capacity", "seats_taken", "is_active", "action_links"]
     list_filter = ["is_active"]
     search_fields = ["title", "description", "location"]
 
@@ -31,6 +31,8 @@ class OpportunityAdmin(AdminActionLinksMixin, RichTextAdminMixin, admin.ModelAdm
 @admin.register(Signup)
 class SignupAdmin(AdminActionLinksMixin, RichTextAdminMixin, admin.ModelAdmin):
     rich_text_fields = ("message",)
-    list_display = ["id", "user", "opportunity", "created_at", "action_links"]
-    list_filter = ["created_at"]
+    list_display = ["id", "user", "opportunity", "status", "created_at", "action_links"]
+    list_filter = ["status", "created_at"]
+    # Seats are only claimed and released through volunteering.seats.
+    readonly_fields = ["status", "promoted_at"]
     search_fields = ["user__email", "opportunity__title"]
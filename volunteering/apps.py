@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class VolunteeringConfig(AppConfig):
     name = 'volunteering'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('volunteering', '0002_opportunity_image'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='opportunity',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
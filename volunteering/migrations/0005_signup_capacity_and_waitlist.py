@@ -0,0 +1,72 @@
+# Generated by Django 6.0.2 on 2026-10-19 18:45
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def dedupe_and_count_signups(apps, schema_editor):
+    """Keep each member's earliest signup per opportunity and count taken seats."""
+    Signup = apps.get_model("volunteering", "Signup")
+    Opportunity = apps.get_model("volunteering", "Opportunity")
+
+    duplicates = (
+        Signup.objects.values("user_id", "opportunity_id")
+        .annotate(first_id=Min("id"), total=Count("id"))
+        .filter(total__gt=1)
+    )
+    for row in duplicates.iterator():
+        Signup.objects.filter(user_id=row["user_id"], opportunity_id=row["opportunity_id"]).exclude(
+            pk=row["first_id"]
+        ).delete()
+
+    # Existing signups become confirmed seats; capacity starts unlimited.
+    opportunities = []
+    for opportunity_id, taken in (
+        Signup.objects.values_list("opportunity_id").annotate(total=Count("id")).order_by()
+    ):
+        opportunities.append(Opportunity(pk=opportunity_id, seats_taken=taken))
+    Opportunity.objects.bulk_update(opportunities, ["seats_taken"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    # The cleanup commits on its own so PostgreSQL can add the unique
+    # constraint without pending trigger events from the deletes.
+    atomic = False
+
+    dependencies = [
+        ('volunteering', '0004_rich_text_columns'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='opportunity',
+            name='capacity',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='opportunity',
+            name='seats_taken',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='signup',
+            name='promoted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='signup',
+            name='status',
+            field=models.CharField(choices=[('confirmed', 'Confirmed'), ('waitlisted', 'Waitlisted')], default='confirmed', max_length=20),
+        ),
+        migrations.RunPython(dedupe_and_count_signups, migrations.RunPython.noop, atomic=True),
+        migrations.AddIndex(
+            model_name='signup',
+            index=models.Index(fields=['opportunity', 'status', 'created_at', 'id'], name='signup_queue_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='signup',
+            constraint=models.UniqueConstraint(fields=('user', 'opportunity'), name='unique_volunteer_signup'),
+        ),
+    ]
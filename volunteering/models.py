@@ -1,26 +1,78 @@
-﻿from django.db import models
+﻿from django.db import models, transaction
 from django.conf import settings
 
+from educate_us_rise_us.content_cache import ContentQuerySet
+from educate_us_rise_us.richtext import EXCERPT_LENGTH, RichTextMixin
 
-class Opportunity(models.Model):
+
+class Opportunity(RichTextMixin, models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField()
+    description_html = models.TextField(blank=True, editable=False)
+    description_excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False)
+    description_word_count = models.PositiveIntegerField(default=0, editable=False)
     location = models.CharField(max_length=120, blank=True)
     image = models.ImageField(upload_to="volunteers/", blank=True, null=True)
     start_date = models.DateField(null=True, blank=True)
     end_date = models.DateField(null=True, blank=True)
     is_active = models.BooleanField(default=True)
+    # Empty capacity means unlimited seats; seats_taken is maintained by volunteering.seats.
+    capacity = models.PositiveIntegerField(null=True, blank=True)
+    seats_taken = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ContentQuerySet.as_manager()
+
+    rich_text_fields = ("description",)
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # seats_taken is only written by volunteering.seats; a full save of a
+        # stale instance would otherwise give claimed seats back.
+        if not self._state.adding and kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "seats_taken"
+            ]
+        # One transaction with the post_save waitlist promotion, so a raised
+        # capacity is never visible to claims before the waitlist is served.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+    @property
+    def seats_available(self):
+        if self.capacity is None:
+            return None
+        return max(self.capacity - self.seats_taken, 0)
+
 
 class Signup(models.Model):
+    STATUS_CONFIRMED = "confirmed"
+    STATUS_WAITLISTED = "waitlisted"
+    STATUS_CHOICES = [
+        (STATUS_CONFIRMED, "Confirmed"),
+        (STATUS_WAITLISTED, "Waitlisted"),
+    ]
+
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="volunteer_signups")
     opportunity = models.ForeignKey(Opportunity, on_delete=models.CASCADE, related_name="signups")
     message = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_CONFIRMED)
+    promoted_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "opportunity"], name="unique_volunteer_signup"),
+        ]
+        indexes = [
+            # Waitlist order for promotion and queue positions.
+            models.Index(fields=["opportunity", "status", "created_at", "id"], name="signup_queue_idx"),
+        ]
+
     def __str__(self):
         return f"{self.user.email} -> {self.opportunity.title}"
@@ -0,0 +1,118 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.utils import timezone
+
+from educate_us_rise_us.content_cache import bump_counter_version
+from outbox.models import OutboxEmail
+
+from .models import Opportunity, Signup
+
+
+class AlreadySignedUp(Exception):
+    pass
+
+
+def _seat_free():
+    return Q(capacity__isnull=True) | Q(seats_taken__lt=F("capacity"))
+
+
+def _seats():
+    # The plain manager: seat counts are not edits, so they skip the
+    # updated_at stamp, the content version and CDN purges. Views showing
+    # them use the "opportunities" counter version instead.
+    return Opportunity._base_manager
+
+
+def _adjust_seats(opportunity_id, delta, *conditions):
+    updated = _seats().filter(*conditions, pk=opportunity_id).update(seats_taken=F("seats_taken") + delta)
+    if updated:
+        bump_counter_version("opportunities")
+    return updated
+
+
+def claim_seat(opportunity, user, message=""):
+    """Sign ``user`` up, confirmed if a seat is free and waitlisted otherwise.
+
+    The seat is claimed with one conditional ``UPDATE`` on ``seats_taken``,
+    so concurrent signups can never overbook; the unique constraint on
+    ``(user, opportunity)`` rejects duplicates and rolls the claim back.
+    Nobody jumps the queue: while anyone is waitlisted, new signups join
+    the waitlist even if a seat is momentarily free.
+    """
+    waitlisted = Signup.objects.filter(opportunity=OuterRef("pk"), status=Signup.STATUS_WAITLISTED)
+    try:
+        with transaction.atomic():
+            claimed = _adjust_seats(opportunity.pk, 1, _seat_free(), ~Exists(waitlisted))
+            return Signup.objects.create(
+                user=user,
+                opportunity=opportunity,
+                message=message,
+                status=Signup.STATUS_CONFIRMED if claimed else Signup.STATUS_WAITLISTED,
+            )
+    except IntegrityError:
+        raise AlreadySignedUp()
+
+
+def waitlist_position(signup):
+    if signup.status != Signup.STATUS_WAITLISTED:
+        return None
+    ahead = Signup.objects.filter(
+        Q(created_at__lt=signup.created_at) | Q(created_at=signup.created_at, pk__lt=signup.pk),
+        opportunity_id=signup.opportunity_id,
+        status=Signup.STATUS_WAITLISTED,
+    )
+    return ahead.count() + 1
+
+
+def promote_waitlist(opportunity_id):
+    """Confirm as many waitlisted signups as there are free seats, oldest first.
+
+    The opportunity row is locked while the free seats are counted, so
+    concurrent claims wait rather than take seats being handed out here.
+    Returns the promoted signups.
+    """
+    with transaction.atomic():
+        opportunity = _seats().select_for_update().only("id", "title", "capacity", "seats_taken").get(pk=opportunity_id)
+        waitlist = Signup.objects.filter(opportunity_id=opportunity_id, status=Signup.STATUS_WAITLISTED).order_by(
+            "created_at", "id"
+        )
+        if opportunity.capacity is not None:
+            waitlist = waitlist[: max(opportunity.capacity - opportunity.seats_taken, 0)]
+        promoted = list(waitlist.select_related("user"))
+        if not promoted:
+            return []
+
+        Signup.objects.filter(pk__in=[signup.pk for signup in promoted]).update(
+            status=Signup.STATUS_CONFIRMED, promoted_at=timezone.now()
+        )
+        _adjust_seats(opportunity_id, len(promoted))
+        OutboxEmail.objects.bulk_create(
+            [
+                OutboxEmail.build(
+                    f"You're confirmed for {opportunity.title}",
+                    f"Hello {signup.user.full_name or signup.user.email},\n\n"
+                    f"A seat opened up and your place for \"{opportunity.title}\" is now confirmed.\n\n"
+                    "Best regards,\nEUTR Volunteering Team",
+                    [signup.user.email],
+                )
+                for signup in promoted
+            ]
+        )
+        return promoted
+
+
+def cancel_signup(opportunity, user):
+    """Remove ``user``'s signup; the ``post_delete`` handler frees its seat."""
+    with transaction.atomic():
+        signup = Signup.objects.filter(opportunity=opportunity, user=user).first()
+        if signup is None:
+            return False
+        signup.delete()
+        return True
+
+
+def release_seat(opportunity_id):
+    """Give back one confirmed seat and hand it to the waitlist in the same transaction."""
+    with transaction.atomic():
+        _adjust_seats(opportunity_id, -1, Q(seats_taken__gt=0))
+        promote_waitlist(opportunity_id)
@@ -1,10 +1,13 @@
 ﻿from rest_framework import serializers
 
+from applications.fieldsets import SparseFieldsetSerializerMixin
+
 from .models import Opportunity, Signup
 
 
-class OpportunitySerializer(serializers.ModelSerializer):
+class OpportunitySerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField(read_only=True)
+    seats_available = serializers.IntegerField(read_only=True, allow_null=True)
 
     class Meta:
         model = Opportunity
@@ -12,13 +15,20 @@ class OpportunitySerializer(serializers.ModelSerializer):
             "id",
             "title",
             "description",
+            "description_html",
+            "description_excerpt",
+            "description_word_count",
             "location",
             "image",
             "image_url",
             "start_date",
             "end_date",
             "is_active",
+            "capacity",
+            "seats_taken",
+            "seats_available",
         ]
+        sparse_field_sources = {"image_url": ["image"], "seats_available": ["capacity", "seats_taken"]}
 
     def get_image_url(self, obj):
         if not obj.image:
@@ -32,5 +42,5 @@ class OpportunitySerializer(serializers.ModelSerializer):
 class SignupSerializer(serializers.ModelSerializer):
     class Meta:
         model = Signup
-        fields = ["id", "opportunity", "message", "created_at"]
-        read_only_fields = ["created_at"]
+        fields = ["id", "opportunity", "message", "status", "promoted_at", "created_at"]
+        read_only_fields = ["status", "promoted_at", "created_at"]
@@ -0,0 +1,33 @@
+from django.db.models.signals import post_delete, post_save
+
+from educate_us_rise_us.content_cache import track_content_model
+
+from .models import Opportunity, Signup
+
+track_content_model(Opportunity)
+
+
+def _release_deleted_seat(sender, instance, origin=None, **kwargs):
+    # Deleting the opportunity itself (one instance, or a queryset from a
+    # bulk or admin delete) cascades here; nothing to hand out then.
+    if instance.status != Signup.STATUS_CONFIRMED:
+        return
+    if isinstance(origin, Opportunity) or getattr(origin, "model", None) is Opportunity:
+        return
+    from .seats import release_seat
+
+    release_seat(instance.opportunity_id)
+
+
+def _promote_after_capacity_change(sender, instance, created=False, raw=False, **kwargs):
+    # Runs inside Opportunity.save()'s transaction.
+    if created or raw:
+        return
+    if Signup.objects.filter(opportunity_id=instance.pk, status=Signup.STATUS_WAITLISTED).exists():
+        from .seats import promote_waitlist
+
+        promote_waitlist(instance.pk)
+
+
+post_delete.connect(_release_deleted_seat, sender=Signup, dispatch_uid="volunteer-signup-release-seat")
+post_save.connect(_promote_after_capacity_change, sender=Opportunity, dispatch_uid="volunteer-opportunity-promote")
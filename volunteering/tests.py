@@ -1,3 +1,92 @@
+from unittest import mock
+
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from educate_us_rise_us.content_cache import get_content_version, get_counter_version
+from outbox.models import OutboxEmail
+
+from .models import Opportunity, Signup
+from .seats import AlreadySignedUp, cancel_signup, claim_seat, waitlist_position
+
+
+class SeatTests(TestCase):
+    def setUp(self):
+        self.opportunity = Opportunity.objects.create(title="Beach clean-up", description="Bring gloves", capacity=1)
+        self.users = [User.objects.create_user(email=f"volunteer{i}@example.org") for i in range(3)]
+
+    def claim(self, user):
+        with self.captureOnCommitCallbacks(execute=True):
+            return claim_seat(self.opportunity, user)
+
+    def seats_taken(self):
+        return Opportunity.objects.values_list("seats_taken", flat=True).get(pk=self.opportunity.pk)
+
+    def test_claim_confirms_until_full_then_waitlists(self):
+        first, second, third = (self.claim(user) for user in self.users)
+        self.assertEqual(first.status, Signup.STATUS_CONFIRMED)
+        self.assertEqual([second.status, third.status], [Signup.STATUS_WAITLISTED] * 2)
+        self.assertEqual([waitlist_position(second), waitlist_position(third)], [1, 2])
+        self.assertEqual(self.seats_taken(), 1)
+
+    def test_seat_changes_leave_content_version_and_updated_at_alone(self):
+        updated_at = self.opportunity.updated_at
+        content_version = get_content_version(Opportunity)
+        counter_version = get_counter_version("opportunities")
+        self.claim(self.users[0])
+        self.opportunity.refresh_from_db()
+        self.assertEqual(self.opportunity.updated_at, updated_at)
+        self.assertEqual(get_content_version(Opportunity), content_version)
+        self.assertNotEqual(get_counter_version("opportunities"), counter_version)
+
+    def test_duplicate_signup_is_rejected(self):
+        self.claim(self.users[0])
+        with self.assertRaises(AlreadySignedUp):
+            self.claim(self.users[0])
+        self.assertEqual(self.seats_taken(), 1)
+
+        client = APIClient()
+        client.force_authenticate(self.users[0])
+        response = client.post(f"/api/volunteering/{self.opportunity.pk}/signup/", {"opportunity": self.opportunity.pk}, format="json")
+        self.assertEqual(response.status_code, 409)
+
+    def test_cancel_promotes_the_oldest_waitlisted_signup(self):
+        for user in self.users:
+            self.claim(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(cancel_signup(self.opportunity, self.users[0]))
+        statuses = dict(Signup.objects.values_list("user_id", "status"))
+        self.assertEqual(statuses[self.users[1].pk], Signup.STATUS_CONFIRMED)
+        self.assertEqual(statuses[self.users[2].pk], Signup.STATUS_WAITLISTED)
+        self.assertEqual(self.seats_taken(), 1)
+        self.assertEqual(list(OutboxEmail.objects.values_list("to", flat=True)), [[self.users[1].email]])
+
+    def test_raising_capacity_promotes_in_the_same_save(self):
+        for user in self.users:
+            self.claim(user)
+        self.opportunity.capacity = 3
+        self.opportunity.save()
+        self.assertFalse(Signup.objects.filter(status=Signup.STATUS_WAITLISTED).exists())
+        self.assertEqual(self.seats_taken(), 3)
+
+    def test_full_save_keeps_seats_claimed_since_load(self):
+        stale = Opportunity.objects.get(pk=self.opportunity.pk)
+        self.claim(self.users[0])
+        stale.title = "Beach clean-up (morning)"
+        stale.save()
+        self.assertEqual(self.seats_taken(), 1)
+
+    def test_free_seat_does_not_jump_the_waitlist(self):
+        Signup.objects.create(user=self.users[0], opportunity=self.opportunity, status=Signup.STATUS_WAITLISTED)
+        self.assertEqual(self.claim(self.users[1]).status, Signup.STATUS_WAITLISTED)
+        self.assertEqual(self.seats_taken(), 0)
 
-# Create your tests here.
+    def test_deleting_opportunities_does_not_release_seats(self):
+        for user in self.users:
+            self.claim(user)
+        with mock.patch("volunteering.seats.release_seat") as release_seat:
+            with self.captureOnCommitCallbacks(execute=True):
+                Opportunity.objects.filter(pk=self.opportunity.pk).delete()
+        release_seat.assert_not_called()
+        self.assertFalse(Signup.objects.exists())
@@ -1,27 +1,69 @@
-﻿from rest_framework import viewsets
+﻿from rest_framework import status, viewsets
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import IsAdminUser, IsAuthenticated, AllowAny
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from applications.fieldsets import SparseFieldsetMixin
+from applications.pagination import PublicCursorPagination
+from educate_us_rise_us.content_cache import get_counter_version
+from educate_us_rise_us.http_cache import ConditionalGetMixin
+from matching.models import MatchDocument
+from matching.recommend import recommendations, requested_k
+from members.models import MemberProfile
+from members.serializers import MemberProfileSerializer
+
 from .models import Opportunity, Signup
+from .seats import AlreadySignedUp, cancel_signup, claim_seat, waitlist_position
 from .serializers import OpportunitySerializer, SignupSerializer
 
 
-class OpportunityViewSet(viewsets.ModelViewSet):
-    queryset = Opportunity.objects.filter(is_active=True).order_by("-created_at")
+class OpportunityViewSet(SparseFieldsetMixin, ConditionalGetMixin, viewsets.ModelViewSet):
+    queryset = Opportunity.objects.filter(is_active=True).order_by("-created_at", "-id")
     serializer_class = OpportunitySerializer
     permission_classes = [AllowAny]
+    pagination_class = PublicCursorPagination
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
-    @action(detail=True, methods=["post"], permission_classes=[IsAuthenticated])
+    def get_cache_scope(self):
+        # Seat counts change without touching updated_at or the content version.
+        return f"seats:{get_counter_version('opportunities')}"
+
+    @action(detail=True, methods=["post", "delete"], permission_classes=[IsAuthenticated])
     def signup(self, request, pk=None):
         opportunity = self.get_object()
+        if request.method == "DELETE":
+            if not cancel_signup(opportunity, request.user):
+                return Response({"detail": "You are not signed up for this opportunity."}, status=status.HTTP_404_NOT_FOUND)
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
         serializer = SignupSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        Signup.objects.create(
-            user=request.user,
-            opportunity=opportunity,
-            message=serializer.validated_data.get("message", ""),
+        try:
+            signup = claim_seat(opportunity, request.user, serializer.validated_data.get("message", ""))
+        except AlreadySignedUp:
+            return Response(
+                {"detail": "You have already signed up for this opportunity."}, status=status.HTTP_409_CONFLICT
+            )
+        if signup.status == Signup.STATUS_WAITLISTED:
+            detail = "This opportunity is full; you have been added to the waitlist."
+        else:
+            detail = "Signed up successfully."
+        return Response(
+            {"detail": detail, "status": signup.status, "waitlist_position": waitlist_position(signup)}
+        )
+
+    @action(detail=True, methods=["get"], permission_classes=[IsAdminUser])
+    def candidates(self, request, pk=None):
+        """Members whose skills and location best match this opportunity."""
+        opportunity = self.get_object()
+        matches = recommendations(MatchDocument.KIND_OPPORTUNITY, opportunity.pk, requested_k(request))
+        profiles = MemberProfile.objects.select_related("user").prefetch_related("skill_tags").in_bulk(
+            [profile_id for profile_id, _ in matches]
         )
-        return Response({"detail": "Signed up successfully."})
+        context = self.get_serializer_context()
+        return Response([
+            {"score": score, "member": MemberProfileSerializer(profiles[profile_id], context=context).data}
+            for profile_id, score in matches
+            if profile_id in profiles
+        ])